@@ -0,0 +1,52 @@
+"""Switch the HNSW embedding index to inner-product ops
+
+Revision ID: 004
+Revises: 002
+Create Date: 2026-10-16 00:00:00.000000
+
+New embeddings are stored unit-normalized, so inner product equals cosine
+similarity and vector_ip_ops skips the per-distance norm computation.
+Similarity queries order by <#> to use this index. Rows written before
+normalization was enforced are rescaled to unit length first; cosine
+similarity is scale-invariant, so this doesn't change any existing score.
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '004'
+down_revision = '002'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute('DROP INDEX IF EXISTS idx_markets_embedding')
+
+    # Inner product only matches cosine for unit vectors; l2_normalize
+    # needs pgvector >= 0.7 (shipped in the pgvector/pgvector:pg16 image)
+    op.execute('''
+        UPDATE markets
+        SET text_embedding = l2_normalize(text_embedding)
+        WHERE text_embedding IS NOT NULL
+          AND abs(vector_norm(text_embedding) - 1) > 1e-6
+    ''')
+
+    # Same build parameters as 002, with inner-product distance
+    op.execute('''
+        CREATE INDEX idx_markets_embedding
+        ON markets
+        USING hnsw (text_embedding vector_ip_ops)
+        WITH (m = 16, ef_construction = 64)
+    ''')
+
+
+def downgrade() -> None:
+    op.execute('DROP INDEX IF EXISTS idx_markets_embedding')
+
+    # Restore the cosine HNSW index from 002
+    op.execute('''
+        CREATE INDEX idx_markets_embedding
+        ON markets
+        USING hnsw (text_embedding vector_cosine_ops)
+        WITH (m = 16, ef_construction = 64)
+    ''')
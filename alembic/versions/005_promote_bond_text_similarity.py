@@ -0,0 +1,30 @@
+"""Promote bonds.feature_breakdown text_similarity to a generated column
+
+Revision ID: 005
+Revises: 004
+Create Date: 2026-10-16 00:00:00.000000
+
+Filtering or sorting bonds by text similarity no longer needs a JSONB
+extraction and cast per row; the stored generated column is B-tree indexed.
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '005'
+down_revision = '004'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute('''
+        ALTER TABLE bonds
+        ADD COLUMN text_similarity double precision
+        GENERATED ALWAYS AS ((feature_breakdown->>'text_similarity')::double precision) STORED
+    ''')
+    op.create_index('idx_bonds_text_sim', 'bonds', ['tier', 'text_similarity'])
+
+
+def downgrade() -> None:
+    op.drop_index('idx_bonds_text_sim', table_name='bonds')
+    op.drop_column('bonds', 'text_similarity')
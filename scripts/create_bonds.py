@@ -24,7 +24,8 @@ import multiprocessing as mp
 from functools import partial
 
 from src.models import get_db, Market, Bond
-from src.config import settings
+from src.models.database import set_hnsw_ef_search
+from src.config import get_settings
 from src.similarity.calculator import calculate_similarity
 from src.similarity.tier_assigner import assign_tier
 
@@ -99,22 +100,26 @@ def find_candidates_with_embedding(
         )
         return []
 
-    # Use pgvector cosine similarity search
-    # <=> operator computes cosine distance (1 - cosine_similarity)
+    # Use pgvector similarity search
+    # Embeddings are unit-normalized, so <#> (negative inner product, served
+    # by the vector_ip_ops HNSW index) orders exactly like cosine distance;
+    # 1 + (a <#> b) is the cosine distance (1 - cosine_similarity)
     # We want similarity DESC, so distance ASC
     # NOTE: Removed category filter since all markets have category="unknown"
     query = text("""
-        SELECT m.id, m.text_embedding <=> CAST(:embedding AS vector) AS distance
+        SELECT m.id, 1 + (m.text_embedding <#> CAST(:embedding AS vector)) AS distance
         FROM markets m
         WHERE m.platform = 'polymarket'
           AND m.text_embedding IS NOT NULL
-        ORDER BY m.text_embedding <=> CAST(:embedding AS vector)
+        ORDER BY m.text_embedding <#> CAST(:embedding AS vector)
         LIMIT :limit
     """)
 
     # Convert numpy array to list for pgvector compatibility
     embedding_list = kalshi_market.text_embedding.tolist() if hasattr(kalshi_market.text_embedding, 'tolist') else list(kalshi_market.text_embedding)
 
+    set_hnsw_ef_search(db, limit)
+
     results = db.execute(
         query,
         {
@@ -306,7 +311,7 @@ def process_kalshi_market(
     candidates = find_candidates_with_embedding(
         db,
         kalshi_market,
-        limit=settings.candidate_limit,
+        limit=get_settings().candidate_limit,
     )
 
     stats["candidates"] = len(candidates)
@@ -9,11 +9,11 @@ project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
 from src.workers.price_updater import PriceUpdater
-from src.config import settings
+from src.config import get_settings
 
 if __name__ == "__main__":
     # Get update interval from settings (default 60 seconds)
-    interval = getattr(settings, 'price_update_interval_sec', 60)
+    interval = getattr(get_settings(), 'price_update_interval_sec', 60)
 
     updater = PriceUpdater()
 
@@ -5,10 +5,13 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 import structlog
 
-from src.config import settings
+from src.config import get_settings
 from src.api.middleware.auth import AuthMiddleware
 from src.api.routes import health, markets, pairs, arbitrage, dashboard
 
+# Entrypoint: build settings once, before logging is configured
+settings = get_settings()
+
 # Configure structured logging
 # Convert string log level to integer
 log_level = getattr(logging, settings.log_level.upper(), logging.INFO)
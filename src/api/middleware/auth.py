@@ -5,7 +5,7 @@ from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.responses import JSONResponse
 import structlog
 
-from src.config import settings
+from src.config import get_settings
 
 logger = structlog.get_logger()
 
@@ -48,7 +48,7 @@ class AuthMiddleware(BaseHTTPMiddleware):
             )
 
         # Validate API key
-        if api_key != settings.bonding_api_key:
+        if api_key != get_settings().bonding_api_key:
             logger.warning(
                 "auth_invalid_key",
                 path=request.url.path,
@@ -9,7 +9,7 @@ from sqlalchemy import func
 import structlog
 
 from src.models import get_db, Bond, Market
-from src.config import settings
+from src.config import get_settings
 
 logger = structlog.get_logger()
 
@@ -68,6 +68,7 @@ async def dashboard_home(request: Request, db: Session = Depends(get_db)):
     } for stat in bond_stats}
 
     # Get configuration
+    settings = get_settings()
     config_info = {
         'price_update_interval': settings.price_update_interval_sec,
         'tier1_min_similarity': settings.tier1_min_similarity_score,
@@ -414,6 +415,7 @@ async def detailed_status(db: Session = Depends(get_db)) -> Dict[str, Any]:
             price_health['status'] = 'critical'
 
     # Configuration
+    settings = get_settings()
     configuration = {
         'price_update_interval_sec': settings.price_update_interval_sec,
         'bond_registry_cache_ttl_sec': settings.bond_registry_cache_ttl_sec,
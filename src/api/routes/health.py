@@ -8,7 +8,7 @@ import redis as redis_lib
 import structlog
 
 from src.models import get_db
-from src.config import settings
+from src.config import get_settings
 
 logger = structlog.get_logger()
 
@@ -45,7 +45,7 @@ async def health_check(db: Session = Depends(get_db)):
 
     # Check Redis
     try:
-        redis_client = redis_lib.from_url(settings.redis_url, decode_responses=True)
+        redis_client = redis_lib.from_url(get_settings().redis_url, decode_responses=True)
         redis_client.ping()
         redis_client.close()
         health_status["components"]["redis"] = {
@@ -7,7 +7,8 @@ from pydantic import BaseModel, Field
 import structlog
 
 from src.models import get_db, Market
-from src.config import settings
+from src.models.database import set_hnsw_ef_search
+from src.config import get_settings
 
 logger = structlog.get_logger()
 
@@ -311,21 +312,26 @@ async def get_candidates(
 
     # Use pgvector cosine similarity to find top candidates
     # Multiply by limit factor to account for hard constraint filtering
-    search_limit = min(limit * 5, settings.candidate_limit * 2)
+    search_limit = min(limit * 5, get_settings().candidate_limit * 2)
 
+    # Embeddings are unit-normalized, so inner product equals cosine
+    # similarity; <#> returns the negative inner product and matches the
+    # vector_ip_ops HNSW index
     similarity_query = text("""
         SELECT
             id,
             raw_title,
-            1 - (text_embedding <=> :embedding) as cosine_similarity
+            -(text_embedding <#> :embedding) as cosine_similarity
         FROM markets
         WHERE platform = :target_platform
         AND text_embedding IS NOT NULL
         AND status = 'active'
-        ORDER BY text_embedding <=> :embedding
+        ORDER BY text_embedding <#> :embedding
         LIMIT :limit
     """)
 
+    set_hnsw_ef_search(db, search_limit)
+
     results = db.execute(
         similarity_query,
         {
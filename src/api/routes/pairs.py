@@ -7,7 +7,7 @@ from pydantic import BaseModel, Field
 import structlog
 
 from src.models import get_db, Bond, Market
-from src.config import settings
+from src.config import get_settings
 from src.utils.arbitrage import (
     calculate_arbitrage_opportunity,
     filter_by_minimum_volume,
@@ -355,11 +355,12 @@ async def get_bond_registry(
     )
 
     # Cache the response
-    cache.set(cache_key, response.dict(), ttl=settings.bond_registry_cache_ttl_sec)
+    ttl = get_settings().bond_registry_cache_ttl_sec
+    cache.set(cache_key, response.dict(), ttl=ttl)
     logger.debug(
         "bond_registry_cached",
         cache_key=cache_key[:50] + "...",
-        ttl=settings.bond_registry_cache_ttl_sec,
+        ttl=ttl,
     )
 
     return response
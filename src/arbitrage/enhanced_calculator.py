@@ -9,41 +9,84 @@ This module provides production-ready arbitrage detection that:
 - Ranks opportunities by risk-adjusted edge
 """
 
-from typing import Dict, Any, Optional, List, Tuple
-from dataclasses import dataclass
+from typing import Dict, Any, Optional, List, Tuple, NamedTuple, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field, replace
 from datetime import datetime
+from itertools import repeat
+import os
+import time
+import numpy as np
 import structlog
 
 from src.models import Market
+from src.utils.log_level import is_debug_enabled
 
 logger = structlog.get_logger()
 
-# Default fee rates (will be overridden by market-specific data)
-DEFAULT_KALSHI_FEE_RATE = 0.02  # 2% on profits
-DEFAULT_POLYMARKET_FEE_RATE = 0.02  # 2% on profits
-DEFAULT_POLYMARKET_GAS_COST_USD = 0.10  # ~$0.10 per trade on Polygon L2
 
+class FeeSchedule(NamedTuple):
+    """Default execution costs (overridden by market-specific fee data)."""
+    kalshi_fee_rate: float = 0.02  # 2% on profits
+    polymarket_fee_rate: float = 0.02  # 2% on profits
+    polymarket_gas_cost_usd: float = 0.10  # ~$0.10 per trade on Polygon L2
+
+
+DEFAULT_FEE_SCHEDULE = FeeSchedule()
+
+# Default fee rates (will be overridden by market-specific data)
+DEFAULT_KALSHI_FEE_RATE = DEFAULT_FEE_SCHEDULE.kalshi_fee_rate
+DEFAULT_POLYMARKET_FEE_RATE = DEFAULT_FEE_SCHEDULE.polymarket_fee_rate
+DEFAULT_POLYMARKET_GAS_COST_USD = DEFAULT_FEE_SCHEDULE.polymarket_gas_cost_usd
 
-@dataclass
-class OrderBookLevel:
-    """Single level in order book."""
-    price: float
-    size: float  # Available size at this price level
+# Level multipliers and sizes for estimated order books
+_ESTIMATED_LEVELS = np.arange(1, 4, dtype=np.float64)
+_ESTIMATED_LEVEL_SIZES = np.full(3, 1000.0)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True, eq=False)
 class OrderBook:
-    """Order book snapshot."""
-    bids: List[OrderBookLevel]  # Sorted descending by price
-    asks: List[OrderBookLevel]  # Sorted ascending by price
+    """Order book snapshot.
+
+    Each side is a ``(2, N)`` float64 array: row 0 holds prices, row 1 holds
+    the available size at that price level. Both sides are sorted and made
+    read-only on construction, with cumulative sizes precomputed so depth
+    queries are a binary search. Arrays have no single truth value, so
+    books compare and hash by identity.
+    """
+    bids: np.ndarray  # Sorted descending by price
+    asks: np.ndarray  # Sorted ascending by price
     timestamp: datetime
     market_id: str
     platform: str
+    bid_depth_cum: np.ndarray = field(init=False, repr=False, compare=False)
+    ask_depth_cum: np.ndarray = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        """Sort and freeze both sides of the book."""
+        bids = np.asarray(self.bids, dtype=np.float64).reshape(2, -1)
+        asks = np.asarray(self.asks, dtype=np.float64).reshape(2, -1)
+        bids = bids[:, np.argsort(-bids[0], kind="stable")]
+        asks = asks[:, np.argsort(asks[0], kind="stable")]
+        bid_depth_cum = np.cumsum(bids[1])
+        ask_depth_cum = np.cumsum(asks[1])
 
+        for array in (bids, asks, bid_depth_cum, ask_depth_cum):
+            array.setflags(write=False)
 
-@dataclass
+        object.__setattr__(self, "bids", bids)
+        object.__setattr__(self, "asks", asks)
+        object.__setattr__(self, "bid_depth_cum", bid_depth_cum)
+        object.__setattr__(self, "ask_depth_cum", ask_depth_cum)
+
+
+@dataclass(slots=True, frozen=True)
 class EnhancedArbitrageOpportunity:
-    """Enhanced arbitrage opportunity with realistic execution costs."""
+    """Enhanced arbitrage opportunity with realistic execution costs.
+
+    Slotted and frozen: bulk scans create one of these per market pair, so
+    dropping the per-instance ``__dict__`` keeps memory and GC pressure down.
+    """
     
     # Market identifiers
     kalshi_market_id: str
@@ -97,12 +140,17 @@ class EnhancedArbitrageOpportunity:
     trade_instructions: Dict[str, Any]
 
 
-def get_market_fee_rate(market: Market, platform: str) -> float:
+def get_market_fee_rate(
+    market: Market,
+    platform: str,
+    fees: FeeSchedule = DEFAULT_FEE_SCHEDULE,
+) -> float:
     """Get market-specific fee rate.
     
     Args:
         market: Market object
         platform: "kalshi" or "polymarket"
+        fees: Default fee schedule used when the market has no fee data
         
     Returns:
         Fee rate as decimal (e.g., 0.02 for 2%)
@@ -115,9 +163,9 @@ def get_market_fee_rate(market: Market, platform: str) -> float:
     
     # Default fees by platform
     if platform == "kalshi":
-        return DEFAULT_KALSHI_FEE_RATE
+        return fees.kalshi_fee_rate
     elif platform == "polymarket":
-        return DEFAULT_POLYMARKET_FEE_RATE
+        return fees.polymarket_fee_rate
     else:
         return 0.05  # Conservative 5% default
 
@@ -137,17 +185,11 @@ def estimate_order_book_from_prices(
     Returns:
         Estimated OrderBook
     """
-    spread = mid_price * spread_pct
+    offsets = _ESTIMATED_LEVELS * (mid_price * spread_pct)
     
     # Create simple order book with 3 levels
-    bids = [
-        OrderBookLevel(price=mid_price - spread * i, size=1000.0)
-        for i in range(1, 4)
-    ]
-    asks = [
-        OrderBookLevel(price=mid_price + spread * i, size=1000.0)
-        for i in range(1, 4)
-    ]
+    bids = np.stack((mid_price - offsets, _ESTIMATED_LEVEL_SIZES))
+    asks = np.stack((mid_price + offsets, _ESTIMATED_LEVEL_SIZES))
     
     return OrderBook(
         bids=bids,
@@ -174,23 +216,29 @@ def get_order_book_depth(
         Total available size at or better than target price
     """
     if side == "bid":
-        # For selling, we need bids >= target_price
-        total_size = 0.0
-        for bid in order_book.bids:
-            if bid.price >= target_price:
-                total_size += bid.size
-            else:
-                break
-        return total_size
+        # For selling, we need bids >= target_price (bids sorted descending)
+        levels = np.searchsorted(-order_book.bids[0], -target_price, side="right")
+        return float(order_book.bid_depth_cum[levels - 1]) if levels else 0.0
     else:  # ask
-        # For buying, we need asks <= target_price
-        total_size = 0.0
-        for ask in order_book.asks:
-            if ask.price <= target_price:
-                total_size += ask.size
-            else:
-                break
-        return total_size
+        # For buying, we need asks <= target_price (asks sorted ascending)
+        levels = np.searchsorted(order_book.asks[0], target_price, side="right")
+        return float(order_book.ask_depth_cum[levels - 1]) if levels else 0.0
+
+
+def _get_outcome_price(outcomes: Sequence[Dict[str, Any]], outcome_value: bool) -> Optional[float]:
+    """Get price for yes/no outcome.
+    
+    Args:
+        outcomes: Outcome entries from a market's outcome_schema
+        outcome_value: Outcome value to look up (True for yes)
+        
+    Returns:
+        Outcome price, or None if the outcome is missing
+    """
+    for outcome in outcomes:
+        if outcome.get("value") == outcome_value:
+            return outcome.get("price")
+    return None
 
 
 def calculate_enhanced_arbitrage(
@@ -200,6 +248,7 @@ def calculate_enhanced_arbitrage(
     order_book_p: Optional[OrderBook] = None,
     min_edge_percent: float = 0.01,  # Minimum 1% edge
     min_liquidity_usd: float = 1000.0,  # Minimum $1k liquidity
+    fees: FeeSchedule = DEFAULT_FEE_SCHEDULE,
 ) -> EnhancedArbitrageOpportunity:
     """Calculate enhanced arbitrage opportunity with realistic execution costs.
     
@@ -210,32 +259,29 @@ def calculate_enhanced_arbitrage(
         order_book_p: Polymarket order book (optional, will estimate if None)
         min_edge_percent: Minimum edge above zero to consider
         min_liquidity_usd: Minimum liquidity required
+        fees: Default fee schedule (bound once at definition time)
         
     Returns:
         EnhancedArbitrageOpportunity
     """
-    logger.info(
-        "calculate_enhanced_arbitrage_start",
-        kalshi_id=market_k.id,
-        polymarket_id=market_p.id,
-    )
+    # Per-pair logging is debug-only; batch scans log one summary instead
+    debug_enabled = is_debug_enabled()
+    if debug_enabled:
+        logger.debug(
+            "calculate_enhanced_arbitrage_start",
+            kalshi_id=market_k.id,
+            polymarket_id=market_p.id,
+        )
     
     warnings = []
     
-    # Extract prices from outcome_schema
-    def get_outcome_price(market: Market, outcome_value: bool) -> Optional[float]:
-        """Get price for yes/no outcome."""
-        if not market.outcome_schema:
-            return None
-        outcomes = market.outcome_schema.get("outcomes", [])
-        for outcome in outcomes:
-            if outcome.get("value") == outcome_value:
-                return outcome.get("price")
-        return None
-    
-    k_yes_mid = get_outcome_price(market_k, True)
+    # Extract prices from outcome_schema (read each schema once per call)
+    k_outs = market_k.outcome_schema.get("outcomes", ()) if market_k.outcome_schema else ()
+    p_outs = market_p.outcome_schema.get("outcomes", ()) if market_p.outcome_schema else ()
+    
+    k_yes_mid = _get_outcome_price(k_outs, True)
     k_no_mid = 1.0 - k_yes_mid if k_yes_mid else None
-    p_yes_mid = get_outcome_price(market_p, True)
+    p_yes_mid = _get_outcome_price(p_outs, True)
     p_no_mid = 1.0 - p_yes_mid if p_yes_mid else None
     
     if not all([k_yes_mid, p_yes_mid]):
@@ -252,35 +298,40 @@ def calculate_enhanced_arbitrage(
         warnings.append("Using estimated Polymarket order book")
     
     # Extract bid/ask from order books or fallback to outcome_schema
-    if order_book_k and order_book_k.bids:
-        k_bid = order_book_k.bids[0].price
+    if order_book_k and order_book_k.bids.shape[1]:
+        k_bid = float(order_book_k.bids[0, 0])
     else:
         # Try to get from outcome_schema (stored by price_updater)
-        k_outcomes = market_k.outcome_schema.get("outcomes", []) if market_k.outcome_schema else []
-        k_bid = next((o.get("bid") for o in k_outcomes if o.get("value") is True), k_yes_mid * 0.995)
+        k_bid = next((o.get("bid") for o in k_outs if o.get("value") is True), k_yes_mid * 0.995)
     
-    if order_book_k and order_book_k.asks:
-        k_ask = order_book_k.asks[0].price
+    if order_book_k and order_book_k.asks.shape[1]:
+        k_ask = float(order_book_k.asks[0, 0])
     else:
-        k_outcomes = market_k.outcome_schema.get("outcomes", []) if market_k.outcome_schema else []
-        k_ask = next((o.get("ask") for o in k_outcomes if o.get("value") is True), k_yes_mid * 1.005)
+        k_ask = next((o.get("ask") for o in k_outs if o.get("value") is True), k_yes_mid * 1.005)
     
-    if order_book_p and order_book_p.bids:
-        p_bid = order_book_p.bids[0].price
+    if order_book_p and order_book_p.bids.shape[1]:
+        p_bid = float(order_book_p.bids[0, 0])
     else:
-        p_outcomes = market_p.outcome_schema.get("outcomes", []) if market_p.outcome_schema else []
-        p_bid = next((o.get("bid") for o in p_outcomes if o.get("value") is True), p_yes_mid * 0.995)
+        p_bid = next((o.get("bid") for o in p_outs if o.get("value") is True), p_yes_mid * 0.995)
     
-    if order_book_p and order_book_p.asks:
-        p_ask = order_book_p.asks[0].price
+    if order_book_p and order_book_p.asks.shape[1]:
+        p_ask = float(order_book_p.asks[0, 0])
     else:
-        p_outcomes = market_p.outcome_schema.get("outcomes", []) if market_p.outcome_schema else []
-        p_ask = next((o.get("ask") for o in p_outcomes if o.get("value") is True), p_yes_mid * 1.005)
-    
+        p_ask = next((o.get("ask") for o in p_outs if o.get("value") is True), p_yes_mid * 1.005)
+
+    # Coarse filter: fees are non-negative, so neither direction can clear
+    # min_edge_percent unless the raw top-of-book spread minus gas does.
+    # Most pairs stop here, before any fee, depth or scoring work.
+    # (Hot path: builtins min/max/abs are replaced by conditional expressions.)
+    gas_cost = fees.polymarket_gas_cost_usd
+    edge_1 = p_bid - k_ask
+    edge_2 = k_bid - p_ask
+    if (edge_1 if edge_1 > edge_2 else edge_2) - gas_cost <= min_edge_percent:
+        return _create_no_opportunity(market_k, market_p, ["No profitable arbitrage after costs"])
+
     # Get fee rates
-    k_fee = get_market_fee_rate(market_k, "kalshi")
-    p_fee = get_market_fee_rate(market_p, "polymarket")
-    gas_cost = DEFAULT_POLYMARKET_GAS_COST_USD
+    k_fee = get_market_fee_rate(market_k, "kalshi", fees)
+    p_fee = get_market_fee_rate(market_p, "polymarket", fees)
     
     # Calculate both directions
     # Direction 1: Buy Kalshi Yes, Sell Polymarket Yes
@@ -310,16 +361,19 @@ def calculate_enhanced_arbitrage(
         # Need to buy at k_ask, sell at p_bid
         k_depth = get_order_book_depth(order_book_k, k_ask, "ask")
         p_depth = get_order_book_depth(order_book_p, p_bid, "bid")
-        available_liquidity = min(k_depth, p_depth)
     else:
         # Need to buy at p_ask, sell at k_bid
         k_depth = get_order_book_depth(order_book_k, k_bid, "bid")
         p_depth = get_order_book_depth(order_book_p, p_ask, "ask")
-        available_liquidity = min(k_depth, p_depth)
+    available_liquidity = k_depth if k_depth < p_depth else p_depth
     
     # Position sizing: use 10% of available liquidity or $10k max, whichever is smaller
-    max_position = min(available_liquidity * 0.1, 10000.0)
-    recommended_position = min(max_position * 0.5, 5000.0)  # Conservative 50% of max
+    max_position = available_liquidity * 0.1
+    if max_position > 10000.0:
+        max_position = 10000.0
+    recommended_position = max_position * 0.5  # Conservative 50% of max
+    if recommended_position > 5000.0:
+        recommended_position = 5000.0
     
     # Check liquidity thresholds
     is_illiquid = available_liquidity < min_liquidity_usd
@@ -331,25 +385,37 @@ def calculate_enhanced_arbitrage(
     # Calculate risk scores
     k_volume = float(market_k.market_metadata.get("volume", 0) if market_k.market_metadata else 0)
     p_volume = float(market_p.market_metadata.get("volume", 0) if market_p.market_metadata else 0)
-    min_volume = min(k_volume, p_volume)
+    min_volume = k_volume if k_volume < p_volume else p_volume
     
     k_liquidity = float(market_k.market_metadata.get("liquidity", 0) if market_k.market_metadata else 0)
     p_liquidity = float(market_p.market_metadata.get("liquidity", 0) if market_p.market_metadata else 0)
-    min_liquidity = min(k_liquidity, p_liquidity)
-    
-    liquidity_score = min(min_liquidity / 50000.0, 1.0) if min_liquidity > 0 else 0.0
-    volume_score = min(min_volume / 100000.0, 1.0) if min_volume > 0 else 0.0
-    confidence_score = (liquidity_score * 0.4) + (volume_score * 0.3) + (min(net_profit / 0.05, 1.0) * 0.3)
+    min_liquidity = k_liquidity if k_liquidity < p_liquidity else p_liquidity
+    
+    liquidity_score = min_liquidity / 50000.0 if min_liquidity > 0 else 0.0
+    if liquidity_score > 1.0:
+        liquidity_score = 1.0
+    volume_score = min_volume / 100000.0 if min_volume > 0 else 0.0
+    if volume_score > 1.0:
+        volume_score = 1.0
+    profit_score = net_profit / 0.05
+    if profit_score > 1.0:
+        profit_score = 1.0
+    confidence_score = (liquidity_score * 0.4) + (volume_score * 0.3) + (profit_score * 0.3)
     
     # Price staleness
     price_staleness = None
     if market_k.updated_at and market_p.updated_at:
-        staleness_k = (datetime.utcnow() - market_k.updated_at).total_seconds()
-        staleness_p = (datetime.utcnow() - market_p.updated_at).total_seconds()
-        price_staleness = int(max(staleness_k, staleness_p))
+        now = datetime.utcnow()
+        staleness_k = (now - market_k.updated_at).total_seconds()
+        staleness_p = (now - market_p.updated_at).total_seconds()
+        price_staleness = int(staleness_k if staleness_k > staleness_p else staleness_p)
         if price_staleness > 300:  # 5 minutes
             warnings.append(f"Price data is {price_staleness // 60} minutes old")
     
+    gross_spread = k_yes_mid - p_yes_mid
+    if gross_spread < 0:
+        gross_spread = -gross_spread
+    
     # Create trade instructions
     trade_instructions = _create_trade_instructions(
         direction, market_k, market_p,
@@ -374,7 +440,7 @@ def calculate_enhanced_arbitrage(
         polymarket_fee_rate=p_fee,
         polymarket_gas_cost_usd=gas_cost,
         total_fee_rate=k_fee + p_fee,
-        gross_spread=abs(k_yes_mid - p_yes_mid),
+        gross_spread=gross_spread,
         net_profit_per_share=net_profit,
         roi_percent=net_profit * 100,
         max_position_size=max_position,
@@ -391,60 +457,161 @@ def calculate_enhanced_arbitrage(
         trade_instructions=trade_instructions,
     )
     
-    logger.info(
-        "calculate_enhanced_arbitrage_complete",
-        kalshi_id=market_k.id,
-        polymarket_id=market_p.id,
-        opportunity_type=opportunity_type,
-        net_profit=net_profit,
-        roi_percent=opportunity.roi_percent,
-        recommended_position=recommended_position,
-    )
+    if debug_enabled:
+        logger.debug(
+            "calculate_enhanced_arbitrage_complete",
+            kalshi_id=market_k.id,
+            polymarket_id=market_p.id,
+            opportunity_type=opportunity_type,
+            net_profit=net_profit,
+            roi_percent=opportunity.roi_percent,
+            recommended_position=recommended_position,
+        )
     
     return opportunity
 
 
+def _scan_pairs(
+    pairs: Sequence[Tuple[Market, Market]],
+    min_edge_percent: float,
+    min_liquidity_usd: float,
+) -> List[EnhancedArbitrageOpportunity]:
+    """Run the per-pair calculation over one chunk (process pool worker)."""
+    return [
+        calculate_enhanced_arbitrage(
+            market_k,
+            market_p,
+            min_edge_percent=min_edge_percent,
+            min_liquidity_usd=min_liquidity_usd,
+        )
+        for market_k, market_p in pairs
+    ]
+
+
+def scan_enhanced_arbitrage(
+    pairs: Sequence[Tuple[Market, Market]],
+    min_edge_percent: float = 0.01,
+    min_liquidity_usd: float = 1000.0,
+    max_workers: Optional[int] = None,
+    chunk_size: int = 500,
+) -> List[EnhancedArbitrageOpportunity]:
+    """Calculate enhanced arbitrage for many market pairs.
+
+    Pairs are split into chunks and spread over a process pool, since the
+    per-pair work is independent and CPU-bound. Small scans (a single chunk)
+    or ``max_workers=1`` run inline to avoid pool startup cost.
+
+    Args:
+        pairs: (Kalshi market, Polymarket market) pairs
+        min_edge_percent: Minimum edge above zero to consider
+        min_liquidity_usd: Minimum liquidity required
+        max_workers: Worker processes (default: CPU count)
+        chunk_size: Pairs per worker task
+
+    Returns:
+        Opportunities in the same order as ``pairs``
+    """
+    start = time.perf_counter()
+    chunks = [pairs[i:i + chunk_size] for i in range(0, len(pairs), chunk_size)]
+    workers = max_workers or os.cpu_count() or 1
+
+    if workers <= 1 or len(chunks) <= 1:
+        opportunities = _scan_pairs(pairs, min_edge_percent, min_liquidity_usd)
+    else:
+        opportunities = []
+        with ProcessPoolExecutor(max_workers=min(workers, len(chunks))) as executor:
+            for chunk_result in executor.map(
+                _scan_pairs,
+                chunks,
+                repeat(min_edge_percent),
+                repeat(min_liquidity_usd),
+            ):
+                opportunities.extend(chunk_result)
+
+    logger.info(
+        "enhanced_arbitrage_scan_complete",
+        pairs=len(pairs),
+        opportunities=sum(1 for o in opportunities if o.opportunity_type != "none"),
+        workers=workers if len(chunks) > 1 else 1,
+        elapsed_ms=round((time.perf_counter() - start) * 1000, 1),
+    )
+
+    return opportunities
+
+
+# Shared zero-valued template for "no opportunity" results. Most pairs in a
+# scan end up here, so only the identifying fields are swapped per call.
+# The template's trade_instructions dict is shared and must not be mutated.
+_EMPTY_OPP_TEMPLATE = EnhancedArbitrageOpportunity(
+    kalshi_market_id="",
+    polymarket_market_id="",
+    kalshi_title="",
+    polymarket_title="",
+    opportunity_type="none",
+    direction="",
+    kalshi_bid=0.0,
+    kalshi_ask=0.0,
+    kalshi_mid=0.0,
+    polymarket_bid=0.0,
+    polymarket_ask=0.0,
+    polymarket_mid=0.0,
+    kalshi_fee_rate=0.0,
+    polymarket_fee_rate=0.0,
+    polymarket_gas_cost_usd=0.0,
+    total_fee_rate=0.0,
+    gross_spread=0.0,
+    net_profit_per_share=0.0,
+    roi_percent=0.0,
+    max_position_size=0.0,
+    recommended_position_size=0.0,
+    available_liquidity=0.0,
+    liquidity_score=0.0,
+    volume_score=0.0,
+    confidence_score=0.0,
+    min_edge_percent=0.0,
+    is_illiquid=True,
+    has_sufficient_depth=False,
+    price_staleness_sec=None,
+    warnings=[],
+    trade_instructions={},
+)
+
+
 def _create_no_opportunity(
     market_k: Market,
     market_p: Market,
     warnings: List[str]
 ) -> EnhancedArbitrageOpportunity:
     """Create a 'no opportunity' result."""
-    return EnhancedArbitrageOpportunity(
+    return replace(
+        _EMPTY_OPP_TEMPLATE,
         kalshi_market_id=market_k.id,
         polymarket_market_id=market_p.id,
         kalshi_title=market_k.clean_title or market_k.raw_title or "",
         polymarket_title=market_p.clean_title or market_p.raw_title or "",
-        opportunity_type="none",
-        direction="",
-        kalshi_bid=0.0,
-        kalshi_ask=0.0,
-        kalshi_mid=0.0,
-        polymarket_bid=0.0,
-        polymarket_ask=0.0,
-        polymarket_mid=0.0,
-        kalshi_fee_rate=0.0,
-        polymarket_fee_rate=0.0,
-        polymarket_gas_cost_usd=0.0,
-        total_fee_rate=0.0,
-        gross_spread=0.0,
-        net_profit_per_share=0.0,
-        roi_percent=0.0,
-        max_position_size=0.0,
-        recommended_position_size=0.0,
-        available_liquidity=0.0,
-        liquidity_score=0.0,
-        volume_score=0.0,
-        confidence_score=0.0,
-        min_edge_percent=0.0,
-        is_illiquid=True,
-        has_sufficient_depth=False,
-        price_staleness_sec=None,
         warnings=warnings,
-        trade_instructions={},
     )
 
 
+# Per-direction leg templates (buy leg, sell leg). Only the market id, price,
+# size and notional vary per opportunity, so each leg is a dict() copy of its
+# template with those keys overridden; key order matches the API output.
+_TRADE_LEG_TEMPLATES: Dict[str, Tuple[Dict[str, Any], Dict[str, Any]]] = {
+    "buy_k_sell_p": (
+        {"exchange": "kalshi", "market_id": "", "side": "buy", "outcome": "yes",
+         "price": 0.0, "size": 0.0, "estimated_cost": 0.0},
+        {"exchange": "polymarket", "market_id": "", "side": "sell", "outcome": "yes",
+         "price": 0.0, "size": 0.0, "estimated_revenue": 0.0},
+    ),
+    "buy_p_sell_k": (
+        {"exchange": "polymarket", "market_id": "", "side": "buy", "outcome": "yes",
+         "price": 0.0, "size": 0.0, "estimated_cost": 0.0},
+        {"exchange": "kalshi", "market_id": "", "side": "sell", "outcome": "yes",
+         "price": 0.0, "size": 0.0, "estimated_revenue": 0.0},
+    ),
+}
+
+
 def _create_trade_instructions(
     direction: str,
     market_k: Market,
@@ -462,55 +629,30 @@ def _create_trade_instructions(
         Dictionary with trade instructions in structured format
     """
     if direction == "buy_k_sell_p":
-        return {
-            "strategy": "direct_spread",
-            "legs": [
-                {
-                    "exchange": "kalshi",
-                    "market_id": market_k.id,
-                    "side": "buy",
-                    "outcome": "yes",
-                    "price": k_ask,
-                    "size": position_size,
-                    "estimated_cost": position_size * k_ask,
-                },
-                {
-                    "exchange": "polymarket",
-                    "market_id": market_p.id,
-                    "side": "sell",
-                    "outcome": "yes",
-                    "price": p_bid,
-                    "size": position_size,
-                    "estimated_revenue": position_size * p_bid,
-                },
-            ],
-            "expected_profit_usd": position_size * net_profit,
-            "expected_roi_percent": net_profit * 100,
-        }
+        buy_template, sell_template = _TRADE_LEG_TEMPLATES["buy_k_sell_p"]
+        buy_id, buy_price, sell_id, sell_price = market_k.id, k_ask, market_p.id, p_bid
     else:  # buy_p_sell_k
-        return {
-            "strategy": "direct_spread",
-            "legs": [
-                {
-                    "exchange": "polymarket",
-                    "market_id": market_p.id,
-                    "side": "buy",
-                    "outcome": "yes",
-                    "price": p_ask,
-                    "size": position_size,
-                    "estimated_cost": position_size * p_ask,
-                },
-                {
-                    "exchange": "kalshi",
-                    "market_id": market_k.id,
-                    "side": "sell",
-                    "outcome": "yes",
-                    "price": k_bid,
-                    "size": position_size,
-                    "estimated_revenue": position_size * k_bid,
-                },
-            ],
-            "expected_profit_usd": position_size * net_profit,
-            "expected_roi_percent": net_profit * 100,
-        }
-
+        buy_template, sell_template = _TRADE_LEG_TEMPLATES["buy_p_sell_k"]
+        buy_id, buy_price, sell_id, sell_price = market_p.id, p_ask, market_k.id, k_bid
+    
+    return {
+        "strategy": "direct_spread",
+        "legs": [
+            dict(
+                buy_template,
+                market_id=buy_id,
+                price=buy_price,
+                size=position_size,
+                estimated_cost=position_size * buy_price,
+            ),
+            dict(
+                sell_template,
+                market_id=sell_id,
+                price=sell_price,
+                size=position_size,
+                estimated_revenue=position_size * sell_price,
+            ),
+        ],
+        "expected_profit_usd": position_size * net_profit,
+        "expected_roi_percent": net_profit * 100,
+    }
@@ -0,0 +1,129 @@
+"""Kalshi market normalization, plus helpers shared with the Polymarket client.
+
+Kept free of I/O and annotated with concrete types so the module can be
+compiled with mypyc (``mypyc src/ingestion/_normalize.py``) for full crawls.
+The pure-Python module is used whenever no compiled extension is present.
+"""
+
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Dict, Optional, Sequence
+import sys
+
+# Kalshi market status -> internal status
+_KALSHI_STATUS_MAP = {
+    "open": "active",
+    "closed": "closed",
+    "settled": "resolved",
+}
+_DEFAULT_STATUS = "active"
+
+# Kalshi markets are yes/no; every normalized market shares these outcome
+# entries, so they must not be mutated in place.
+_YES_NO_OUTCOMES = (
+    {"label": "Yes", "value": True},
+    {"label": "No", "value": False},
+)
+
+
+@lru_cache(maxsize=256)
+def _normalize_category(category: str) -> str:
+    """Lowercase and intern a category (a few dozen distinct values per crawl)."""
+    return sys.intern(category.lower())
+
+
+@dataclass(slots=True)
+class NormalizedMarket:
+    """Kalshi market in internal format.
+
+    Slotted to keep per-record memory low during full crawls. ``market["id"]``
+    and ``market.get("id")`` keep working for callers written against the
+    previous dict format.
+    """
+
+    id: Optional[str]
+    title: str
+    description: str
+    category: str
+    resolution_date: Optional[str]
+    resolution_source: str
+    outcome_type: str
+    outcomes: Sequence[Dict[str, Any]]
+    metadata: Dict[str, Any]
+
+    def __getitem__(self, key: str) -> Any:
+        """Dict-style field access."""
+        if key not in self.__slots__:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Dict-style field access with a default."""
+        if key not in self.__slots__:
+            return default
+        return getattr(self, key)
+
+
+def normalize_kalshi_market(raw_market: Dict[str, Any]) -> NormalizedMarket:
+    """Normalize Kalshi market to internal format.
+
+    Args:
+        raw_market: Raw market data from Kalshi API
+
+    Returns:
+        Normalized market data
+    """
+    # Bound once: this runs for every market in a crawl
+    get = raw_market.get
+
+    # Extract basic info
+    ticker = get("ticker")
+    title = get("title", "")
+    subtitle = get("subtitle", "")
+
+    # Combine title and subtitle for full description
+    full_title = title
+    description = f"{title}. {subtitle}" if subtitle else title
+
+    # Extract timestamps
+    close_time = get("close_time")
+    expiration_time = get("expiration_time")
+    open_time = get("open_time")
+
+    # Parse resolution date (use expiration_time)
+    resolution_date = expiration_time
+
+    # Determine outcome type (Kalshi markets are typically yes/no)
+    # Some markets have ranges, check subtitle
+    outcome_type = "yes_no"
+    outcomes = _YES_NO_OUTCOMES
+
+    # Extract category from series ticker or event
+    category = get("category", "unknown")
+
+    # Market status
+    status = _KALSHI_STATUS_MAP.get(get("status", "").lower(), _DEFAULT_STATUS)
+
+    # Build normalized format
+    normalized = NormalizedMarket(
+        id=ticker,
+        title=full_title,
+        description=description,
+        category=_normalize_category(category) if category else "unknown",
+        resolution_date=resolution_date,
+        resolution_source="Kalshi",  # Kalshi resolves their own markets
+        outcome_type=outcome_type,
+        outcomes=outcomes,
+        # Literal string keys are interned code constants, and a dict
+        # display with constant keys builds faster than zip()/fromkeys().
+        metadata={
+            "liquidity": get("liquidity", 0),
+            "volume": get("volume", 0),
+            "open_time": open_time,
+            "close_time": close_time,
+            "event_ticker": get("event_ticker"),
+            "series_ticker": get("series_ticker"),
+        },
+    )
+
+    return normalized
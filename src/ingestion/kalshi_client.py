@@ -4,36 +4,90 @@ Public API documentation: https://trading-api.readme.io/reference/getting-starte
 """
 
 from typing import List, Dict, Any, Optional
+import asyncio
+import atexit
 import httpx
 import structlog
 from datetime import datetime
 
-from src.config import settings
+from src.config import get_settings
+from src.ingestion._normalize import NormalizedMarket, normalize_kalshi_market
+from src.utils.log_level import is_debug_enabled
+
+try:
+    import h2  # noqa: F401  (installed by the httpx[http2] extra)
+    _HTTP2_AVAILABLE = True
+except ImportError:
+    _HTTP2_AVAILABLE = False
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 logger = structlog.get_logger()
 
+def _decode_json(response: httpx.Response) -> Dict[str, Any]:
+    """Decode a JSON response body, using orjson when available.
+
+    Market pages run to hundreds of KB, where orjson decodes several times
+    faster than the stdlib json module behind ``response.json()``.
+    """
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
+
+_shared_session: Optional[httpx.Client] = None
+
+
+def _get_shared_session() -> httpx.Client:
+    """Get the process-wide Kalshi HTTP client, creating it on first use.
+
+    Every KalshiClient shares one keepalive connection pool (HTTP/2 when
+    ``h2`` is installed), so TLS setup is paid once per process rather than
+    once per client. The pool is closed at interpreter exit.
+    """
+    global _shared_session
+    if _shared_session is None:
+        _shared_session = httpx.Client(
+            http2=_HTTP2_AVAILABLE,
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=40),
+            timeout=10,
+        )
+        atexit.register(_shared_session.close)
+    return _shared_session
+
 
 class KalshiClient:
     """Client for Kalshi public market data API."""
 
-    def __init__(self, api_base: Optional[str] = None, api_key: Optional[str] = None, timeout: int = 10):
+    def __init__(
+        self,
+        api_base: Optional[str] = None,
+        api_key: Optional[str] = None,
+        timeout: int = 10,
+        session: Optional[httpx.Client] = None,
+    ):
         """Initialize Kalshi client.
 
         Args:
             api_base: API base URL (default from settings)
             api_key: API key for authentication (default from settings)
             timeout: Request timeout in seconds
+            session: HTTP client to use (default: process-wide shared client)
         """
+        settings = get_settings()
         self.api_base = api_base or settings.kalshi_api_base
         self.api_key = api_key or settings.kalshi_api_key
         self.timeout = timeout
 
-        # Set up headers with API key if provided
-        headers = {}
+        # Headers are sent per request since the session may be shared
+        self.headers = {}
         if self.api_key:
-            headers["Authorization"] = f"Bearer {self.api_key}"
+            self.headers["Authorization"] = f"Bearer {self.api_key}"
 
-        self.session = httpx.Client(timeout=timeout, headers=headers)
+        self.session = session or _get_shared_session()
 
     def _get(self, endpoint: str, params: Optional[Dict] = None) -> Dict[str, Any]:
         """Make GET request to Kalshi API.
@@ -51,9 +105,11 @@ class KalshiClient:
         url = f"{self.api_base}{endpoint}"
 
         try:
-            response = self.session.get(url, params=params)
+            response = self.session.get(
+                url, params=params, headers=self.headers, timeout=self.timeout
+            )
             response.raise_for_status()
-            return response.json()
+            return _decode_json(response)
 
         except httpx.HTTPStatusError as e:
             logger.error(
@@ -78,7 +134,8 @@ class KalshiClient:
         Returns:
             Exchange status info
         """
-        logger.debug("kalshi_get_exchange_status")
+        if is_debug_enabled():
+            logger.debug("kalshi_get_exchange_status")
         return self._get("/exchange/status")
 
     def get_events(
@@ -107,7 +164,8 @@ class KalshiClient:
         if series_ticker:
             params["series_ticker"] = series_ticker
 
-        logger.debug("kalshi_get_events", params=params)
+        if is_debug_enabled():
+            logger.debug("kalshi_get_events", params=params)
         return self._get("/events", params=params)
 
     def get_event(self, event_ticker: str) -> Dict[str, Any]:
@@ -119,7 +177,8 @@ class KalshiClient:
         Returns:
             Event data
         """
-        logger.debug("kalshi_get_event", event_ticker=event_ticker)
+        if is_debug_enabled():
+            logger.debug("kalshi_get_event", event_ticker=event_ticker)
         return self._get(f"/events/{event_ticker}")
 
     def get_markets(
@@ -164,7 +223,8 @@ class KalshiClient:
         if tickers:
             params["tickers"] = tickers
 
-        logger.debug("kalshi_get_markets", params=params)
+        if is_debug_enabled():
+            logger.debug("kalshi_get_markets", params=params)
         return self._get("/markets", params=params)
 
     def get_market(self, ticker: str) -> Dict[str, Any]:
@@ -176,7 +236,8 @@ class KalshiClient:
         Returns:
             Market data
         """
-        logger.debug("kalshi_get_market", ticker=ticker)
+        if is_debug_enabled():
+            logger.debug("kalshi_get_market", ticker=ticker)
         return self._get(f"/markets/{ticker}")
     
     def get_market_order_book(self, ticker: str) -> Dict[str, Any]:
@@ -188,7 +249,8 @@ class KalshiClient:
         Returns:
             Order book data with bids and asks
         """
-        logger.debug("kalshi_get_market_order_book", ticker=ticker)
+        if is_debug_enabled():
+            logger.debug("kalshi_get_market_order_book", ticker=ticker)
         # Note: Kalshi API may not have dedicated order book endpoint
         # This would use market data which includes yes_bid, yes_ask, etc.
         market_data = self.get_market(ticker)
@@ -236,10 +298,11 @@ class KalshiClient:
         if cursor:
             params["cursor"] = cursor
 
-        logger.debug("kalshi_get_series", params=params)
+        if is_debug_enabled():
+            logger.debug("kalshi_get_series", params=params)
         return self._get("/series", params=params)
 
-    def normalize_market(self, raw_market: Dict[str, Any]) -> Dict[str, Any]:
+    def normalize_market(self, raw_market: Dict[str, Any]) -> NormalizedMarket:
         """Normalize Kalshi market to internal format.
 
         Args:
@@ -248,71 +311,39 @@ class KalshiClient:
         Returns:
             Normalized market data
         """
-        # Extract basic info
-        ticker = raw_market.get("ticker")
-        title = raw_market.get("title", "")
-        subtitle = raw_market.get("subtitle", "")
-
-        # Combine title and subtitle for full description
-        full_title = f"{title}"
-        description = f"{title}. {subtitle}" if subtitle else title
-
-        # Extract timestamps
-        close_time = raw_market.get("close_time")
-        expiration_time = raw_market.get("expiration_time")
-        open_time = raw_market.get("open_time")
-
-        # Parse resolution date (use expiration_time)
-        resolution_date = expiration_time
-
-        # Determine outcome type (Kalshi markets are typically yes/no)
-        # Some markets have ranges, check subtitle
-        outcome_type = "yes_no"
-        outcomes = [
-            {"label": "Yes", "value": True},
-            {"label": "No", "value": False},
-        ]
-
-        # Extract category from series ticker or event
-        category = raw_market.get("category", "unknown")
-
-        # Market status
-        status_map = {
-            "open": "active",
-            "closed": "closed",
-            "settled": "resolved",
-        }
-        status = status_map.get(raw_market.get("status", "").lower(), "active")
-
-        # Build normalized format
-        normalized = {
-            "id": ticker,
-            "title": full_title,
-            "description": description,
-            "category": category.lower() if category else "unknown",
-            "resolution_date": resolution_date,
-            "resolution_source": "Kalshi",  # Kalshi resolves their own markets
-            "outcome_type": outcome_type,
-            "outcomes": outcomes,
-            "metadata": {
-                "liquidity": raw_market.get("liquidity", 0),
-                "volume": raw_market.get("volume", 0),
-                "open_time": open_time,
-                "close_time": close_time,
-                "event_ticker": raw_market.get("event_ticker"),
-                "series_ticker": raw_market.get("series_ticker"),
-            },
-        }
+        return normalize_kalshi_market(raw_market)
 
-        logger.debug(
-            "kalshi_market_normalized",
-            ticker=ticker,
-            category=category,
-        )
+    def _normalize_page(self, markets: List[Dict[str, Any]]) -> List[NormalizedMarket]:
+        """Normalize one page of raw markets, skipping ones that fail.
+
+        Args:
+            markets: Raw market data from one Kalshi page
 
-        return normalized
+        Returns:
+            Normalized markets
+        """
+        # Level check once per page rather than a debug call per market
+        debug_enabled = is_debug_enabled()
+        batch_normalized = []
+        for market in markets:
+            try:
+                normalized = self.normalize_market(market)
+                batch_normalized.append(normalized)
+                if debug_enabled:
+                    logger.debug(
+                        "kalshi_market_normalized",
+                        ticker=normalized.id,
+                        category=normalized.category,
+                    )
+            except Exception as e:
+                logger.error(
+                    "kalshi_market_normalization_failed",
+                    ticker=market.get("ticker"),
+                    error=str(e),
+                )
+        return batch_normalized
 
-    def fetch_all_active_markets(self, batch_callback=None) -> List[Dict[str, Any]]:
+    def fetch_all_active_markets(self, batch_callback=None) -> List[NormalizedMarket]:
         """Fetch all active markets with pagination and optional batch processing.
 
         Args:
@@ -326,6 +357,7 @@ class KalshiClient:
 
         all_markets = []
         cursor = None
+        seen_cursors = set()
         page = 0
 
         try:
@@ -342,17 +374,7 @@ class KalshiClient:
                     break
 
                 # Normalize each market in this batch
-                batch_normalized = []
-                for market in markets:
-                    try:
-                        normalized = self.normalize_market(market)
-                        batch_normalized.append(normalized)
-                    except Exception as e:
-                        logger.error(
-                            "kalshi_market_normalization_failed",
-                            ticker=market.get("ticker"),
-                            error=str(e),
-                        )
+                batch_normalized = self._normalize_page(markets)
 
                 # Process batch immediately if callback provided
                 if batch_callback and batch_normalized:
@@ -384,6 +406,12 @@ class KalshiClient:
                 if not cursor:
                     break
 
+                # Guard against the API echoing a cursor back, which would loop forever
+                if cursor in seen_cursors:
+                    logger.warning("kalshi_pagination_cursor_repeated", cursor=cursor, page=page)
+                    break
+                seen_cursors.add(cursor)
+
         except Exception as e:
             logger.error(
                 "kalshi_fetch_all_active_markets_failed",
@@ -399,8 +427,11 @@ class KalshiClient:
         return all_markets
 
     def close(self):
-        """Close HTTP session."""
-        self.session.close()
+        """Release the client.
+
+        The HTTP session is shared (or owned by the caller that passed it in),
+        so it stays open for other clients.
+        """
 
     def __enter__(self):
         """Context manager entry."""
@@ -409,3 +440,242 @@ class KalshiClient:
     def __exit__(self, exc_type, exc_val, exc_tb):
         """Context manager exit."""
         self.close()
+
+
+class AsyncKalshiClient:
+    """Async client for Kalshi market data, used for full-market crawls.
+
+    All requests share one pooled ``httpx.AsyncClient`` (HTTP/2 when the
+    ``h2`` package is installed). ``fetch_all_active_markets`` runs a page
+    producer and a normalizing consumer joined by a bounded queue, so page
+    requests keep going while earlier pages are normalized.
+    """
+
+    # Normalization is pure dict munging; share the sync implementation
+    normalize_market = KalshiClient.normalize_market
+    _normalize_page = KalshiClient._normalize_page
+
+    # Pages fetched ahead of normalization
+    page_queue_size = 4
+
+    def __init__(
+        self,
+        api_base: Optional[str] = None,
+        api_key: Optional[str] = None,
+        timeout: int = 10,
+        max_keepalive_connections: int = 10,
+    ):
+        """Initialize async Kalshi client.
+
+        Args:
+            api_base: API base URL (default from settings)
+            api_key: API key for authentication (default from settings)
+            timeout: Request timeout in seconds
+            max_keepalive_connections: Idle connections kept open for reuse
+        """
+        settings = get_settings()
+        self.api_base = api_base or settings.kalshi_api_base
+        self.api_key = api_key or settings.kalshi_api_key
+        self.timeout = timeout
+
+        headers = {}
+        if self.api_key:
+            headers["Authorization"] = f"Bearer {self.api_key}"
+
+        self.session = httpx.AsyncClient(
+            timeout=timeout,
+            headers=headers,
+            http2=_HTTP2_AVAILABLE,
+            limits=httpx.Limits(max_keepalive_connections=max_keepalive_connections),
+        )
+
+    async def _aget(self, endpoint: str, params: Optional[Dict] = None) -> Dict[str, Any]:
+        """Make async GET request to Kalshi API.
+
+        Args:
+            endpoint: API endpoint path
+            params: Query parameters
+
+        Returns:
+            Response JSON
+
+        Raises:
+            httpx.HTTPError: On request failure
+        """
+        url = f"{self.api_base}{endpoint}"
+
+        try:
+            response = await self.session.get(url, params=params)
+            response.raise_for_status()
+            return _decode_json(response)
+
+        except httpx.HTTPStatusError as e:
+            logger.error(
+                "kalshi_api_error",
+                endpoint=endpoint,
+                status_code=e.response.status_code,
+                error=str(e),
+            )
+            raise
+
+        except Exception as e:
+            logger.error(
+                "kalshi_request_failed",
+                endpoint=endpoint,
+                error=str(e),
+            )
+            raise
+
+    async def get_markets(
+        self,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        status: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Get markets.
+
+        Args:
+            limit: Number of markets to return (max 1000)
+            cursor: Pagination cursor
+            status: Filter by status (open, closed, settled)
+
+        Returns:
+            Markets data with pagination
+        """
+        params = {"limit": limit}
+        if cursor:
+            params["cursor"] = cursor
+        if status:
+            params["status"] = status
+
+        if is_debug_enabled():
+            logger.debug("kalshi_get_markets", params=params)
+        return await self._aget("/markets", params=params)
+
+    async def get_market(self, ticker: str) -> Dict[str, Any]:
+        """Get single market details.
+
+        Args:
+            ticker: Market ticker symbol
+
+        Returns:
+            Market data
+        """
+        if is_debug_enabled():
+            logger.debug("kalshi_get_market", ticker=ticker)
+        return await self._aget(f"/markets/{ticker}")
+
+    async def _paginate(self, queue: asyncio.Queue) -> None:
+        """Fetch active market pages into the queue, ending with a None sentinel.
+
+        Args:
+            queue: Queue receiving each page's raw market list
+        """
+        cursor = None
+        seen_cursors = set()
+        try:
+            while True:
+                response = await self.get_markets(limit=1000, cursor=cursor, status="open")
+
+                markets = response.get("markets", [])
+                if not markets:
+                    break
+
+                await queue.put(markets)
+
+                cursor = response.get("cursor")
+                if not cursor:
+                    break
+
+                # Guard against the API echoing a cursor back, which would loop forever
+                if cursor in seen_cursors:
+                    logger.warning("kalshi_pagination_cursor_repeated", cursor=cursor)
+                    break
+                seen_cursors.add(cursor)
+
+        except asyncio.CancelledError:
+            raise
+
+        except Exception:
+            await queue.put(None)
+            raise
+
+        await queue.put(None)
+
+    async def fetch_all_active_markets(self, batch_callback=None) -> List[NormalizedMarket]:
+        """Fetch all active markets, normalizing pages while later ones download.
+
+        Args:
+            batch_callback: Optional function to call with each batch of normalized markets
+                           for incremental processing (e.g., parallel ingestion)
+
+        Returns:
+            List of all normalized markets
+        """
+        logger.info("kalshi_fetch_all_active_markets_start")
+
+        all_markets = []
+        page = 0
+        queue = asyncio.Queue(maxsize=self.page_queue_size)
+        producer = asyncio.create_task(self._paginate(queue))
+
+        try:
+            while True:
+                markets = await queue.get()
+                if markets is None:
+                    break
+                page += 1
+
+                # Normalize off the event loop so the producer's requests progress
+                batch_normalized = await asyncio.to_thread(self._normalize_page, markets)
+
+                if batch_callback and batch_normalized:
+                    try:
+                        batch_callback(batch_normalized, "kalshi")
+                    except Exception as e:
+                        logger.error(
+                            "kalshi_batch_callback_failed",
+                            page=page,
+                            error=str(e),
+                        )
+
+                all_markets.extend(batch_normalized)
+
+                logger.info(
+                    "kalshi_markets_page_fetched",
+                    page=page,
+                    count=len(markets),
+                    total=len(all_markets),
+                )
+
+            # Surface pagination errors
+            await producer
+
+        except Exception as e:
+            logger.error(
+                "kalshi_fetch_all_active_markets_failed",
+                error=str(e),
+                markets_fetched=len(all_markets),
+            )
+
+        finally:
+            producer.cancel()
+
+        logger.info(
+            "kalshi_fetch_all_active_markets_complete",
+            total_markets=len(all_markets),
+        )
+
+        return all_markets
+
+    async def close(self):
+        """Close HTTP session."""
+        await self.session.aclose()
+
+    async def __aenter__(self):
+        """Async context manager entry."""
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit."""
+        await self.close()
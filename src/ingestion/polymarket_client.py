@@ -4,37 +4,146 @@ Gamma API: Market discovery and metadata
 CLOB API: Simplified markets with prices
 """
 
-from typing import List, Dict, Any, Optional
+from typing import Any, Callable, Dict, Iterator, List, NamedTuple, Optional, Tuple
+import asyncio
+import atexit
 import httpx
 import structlog
 import json
 
-from src.config import settings
+from src.config import get_settings
+from src.ingestion._normalize import _normalize_category
+from src.utils.log_level import is_debug_enabled
+
+try:
+    import h2  # noqa: F401  (installed by the httpx[http2] extra)
+    _HTTP2_AVAILABLE = True
+except ImportError:
+    _HTTP2_AVAILABLE = False
+
+# orjson decodes the large Gamma/CLOB payloads several times faster than the
+# stdlib; both accept bytes and raise json.JSONDecodeError subclasses.
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# Optional: simdjson parses the multi-MB simplified-markets payload lazily,
+# so building the CLOB index only materializes the fields it reads.
+try:
+    import simdjson
+except ImportError:
+    simdjson = None
 
 logger = structlog.get_logger()
 
 
+def _as_float(value: Any) -> float:
+    """Coerce a Gamma numeric field (number, numeric string, or null) to float."""
+    if type(value) is float:
+        return value
+    return float(value) if value else 0.0
+
+
+class _ClobQuote(NamedTuple):
+    """Prices for one CLOB market, validated once when the index is primed."""
+
+    prices: Tuple[float, ...]
+    labels: Tuple[Optional[str], ...]
+    accepting_orders: bool
+
+
+def _build_clob_quote(condition_id: str, tokens: Any, accepting_orders: Any, token_type: type = dict) -> _ClobQuote:
+    """Validate a CLOB market's tokens into a _ClobQuote.
+
+    Tokens pair with Gamma outcomes by position, so a malformed token ends
+    the quote there rather than shifting later prices onto wrong outcomes.
+
+    Args:
+        condition_id: Market condition ID (for logging)
+        tokens: Token objects from the simplified-markets payload
+        accepting_orders: Raw accepting_orders flag
+        token_type: Mapping type a valid token must have
+
+    Returns:
+        Validated quote
+    """
+    prices = []
+    labels = []
+
+    for token in tokens or ():
+        try:
+            if not isinstance(token, token_type):
+                raise TypeError(f"token is {type(token).__name__}")
+            prices.append(float(token.get("price", 0)))
+        except (TypeError, ValueError) as e:
+            logger.warning(
+                "clob_token_invalid",
+                condition_id=condition_id,
+                token_value=str(token)[:50],
+                error=str(e),
+            )
+            break
+        labels.append(token.get("outcome"))
+
+    return _ClobQuote(tuple(prices), tuple(labels), bool(accepting_orders))
+
+
+_shared_session: Optional[httpx.Client] = None
+
+
+def _get_shared_session() -> httpx.Client:
+    """Get the process-wide Polymarket HTTP client, creating it on first use.
+
+    Gamma and CLOB clients share one keepalive connection pool (HTTP/2 when
+    ``h2`` is installed), so each host's TLS handshake is paid once per
+    process instead of per client. The pool is closed at interpreter exit.
+    """
+    global _shared_session
+    if _shared_session is None:
+        _shared_session = httpx.Client(
+            http2=_HTTP2_AVAILABLE,
+            limits=httpx.Limits(
+                max_connections=50,
+                max_keepalive_connections=20,
+                keepalive_expiry=300,
+            ),
+            timeout=10,
+        )
+        atexit.register(_shared_session.close)
+    return _shared_session
+
+
 class PolymarketGammaClient:
     """Client for Polymarket Gamma API (market discovery)."""
 
-    def __init__(self, api_base: Optional[str] = None, api_key: Optional[str] = None, timeout: int = 10):
+    def __init__(
+        self,
+        api_base: Optional[str] = None,
+        api_key: Optional[str] = None,
+        timeout: int = 10,
+        session: Optional[httpx.Client] = None,
+    ):
         """Initialize Gamma client.
 
         Args:
             api_base: API base URL (default from settings)
             api_key: API key for authentication (default from settings)
             timeout: Request timeout in seconds
+            session: HTTP client to use (default: process-wide shared client)
         """
+        settings = get_settings()
         self.api_base = api_base or settings.polymarket_gamma_api_base
         self.api_key = api_key or settings.polymarket_api_key
         self.timeout = timeout
 
-        # Set up headers with API key if provided
-        headers = {}
+        # Headers are sent per request since the session may be shared
+        self.headers = {}
         if self.api_key:
-            headers["Authorization"] = f"Bearer {self.api_key}"
+            self.headers["Authorization"] = f"Bearer {self.api_key}"
 
-        self.session = httpx.Client(timeout=timeout, headers=headers)
+        self.session = session or _get_shared_session()
 
     def _get(self, endpoint: str, params: Optional[Dict] = None) -> Any:
         """Make GET request to Gamma API.
@@ -52,9 +161,11 @@ class PolymarketGammaClient:
         url = f"{self.api_base}{endpoint}"
 
         try:
-            response = self.session.get(url, params=params)
+            response = self.session.get(
+                url, params=params, headers=self.headers, timeout=self.timeout
+            )
             response.raise_for_status()
-            return response.json()
+            return _json_loads(response.content)
 
         except httpx.HTTPStatusError as e:
             logger.error(
@@ -114,14 +225,34 @@ class PolymarketGammaClient:
             Market data
         """
         logger.debug("gamma_get_market", condition_id=condition_id)
-        markets = self.get_markets(limit=1000)
+        markets = self._get(
+            "/markets",
+            params={"condition_ids": condition_id, "limit": 1},
+        )
 
-        # Find market by condition_id
-        for market in markets:
-            if market.get("conditionId") == condition_id:
-                return market
+        if not markets:
+            raise ValueError(f"Market not found: {condition_id}")
+
+        return markets[0]
+
+    def get_markets_by_ids(self, condition_ids: List[str]) -> List[Dict[str, Any]]:
+        """Get several markets by condition ID in one request.
+
+        Args:
+            condition_ids: Ethereum condition IDs
 
-        raise ValueError(f"Market not found: {condition_id}")
+        Returns:
+            Markets found (missing IDs are omitted; order follows the API)
+        """
+        if not condition_ids:
+            return []
+
+        logger.debug("gamma_get_markets_by_ids", count=len(condition_ids))
+        # httpx sends a list as repeated condition_ids=... parameters
+        return self._get(
+            "/markets",
+            params={"condition_ids": list(condition_ids), "limit": len(condition_ids)},
+        )
 
     def normalize_market(self, raw_market: Dict[str, Any]) -> Dict[str, Any]:
         """Normalize Gamma market to internal format.
@@ -132,85 +263,363 @@ class PolymarketGammaClient:
         Returns:
             Normalized market data
         """
-        # Extract basic info
-        condition_id = raw_market.get("conditionId")
-        question = raw_market.get("question", "")
-        description = raw_market.get("description", "")
+        return self.normalize_markets([raw_market])[0]
 
-        # Extract timestamps
-        end_date = raw_market.get("endDate")  # ISO 8601
+    def normalize_markets(self, raw_markets: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Normalize a page of Gamma markets to internal format.
 
-        # Parse CLOB token IDs (JSON string)
-        clob_token_ids = []
-        clob_token_ids_str = raw_market.get("clobTokenIds", "[]")
+        The loop runs once per market in a crawl, so globals and methods it
+        uses are bound to locals up front.
+
+        Args:
+            raw_markets: Raw market data from Gamma API
+
+        Returns:
+            Normalized market data, in input order
+        """
+        loads = _json_loads
+        decode_error = json.JSONDecodeError
+        normalize_category = _normalize_category
+        as_float = _as_float
+        debug = is_debug_enabled()
+
+        normalized_markets = []
+        append = normalized_markets.append
+
+        for raw_market in raw_markets:
+            get = raw_market.get
+
+            # Extract basic info
+            condition_id = get("conditionId")
+            question = get("question", "")
+            description = get("description", "")
+
+            # Parse CLOB token IDs (JSON string)
+            clob_token_ids = get("clobTokenIds", "[]")
+            if type(clob_token_ids) is str:
+                try:
+                    clob_token_ids = loads(clob_token_ids)
+                except decode_error:
+                    logger.warning(
+                        "gamma_clob_token_ids_parse_failed",
+                        condition_id=condition_id,
+                        value=clob_token_ids,
+                    )
+                    clob_token_ids = []
+            elif type(clob_token_ids) is not list:
+                clob_token_ids = []
+
+            # Extract category/tags
+            tags = get("tags", [])
+            category = tags[0] if tags else "unknown"
+
+            # Determine outcome type (typically yes/no for Polymarket)
+            # Outcomes are built per market: price enrichment writes into them
+            n_tokens = len(clob_token_ids)
+
+            # Build normalized format
+            append({
+                "id": condition_id,
+                "title": question,
+                "description": description or question,
+                "category": normalize_category(category) if category else "unknown",
+                "resolution_date": get("endDate"),  # ISO 8601
+                "resolution_source": get("resolutionSource", "Polymarket"),
+                "outcome_type": "yes_no",
+                "outcomes": [
+                    {"label": "Yes", "token_id": clob_token_ids[0] if n_tokens > 0 else None, "value": True},
+                    {"label": "No", "token_id": clob_token_ids[1] if n_tokens > 1 else None, "value": False},
+                ],
+                "metadata": {
+                    "liquidity": as_float(get("liquidity", 0)),
+                    "volume": as_float(get("volume", 0)),
+                    "clob_token_ids": clob_token_ids,
+                    "tags": tags,
+                    "market_slug": get("marketSlug"),
+                },
+            })
+
+            if debug:
+                logger.debug(
+                    "gamma_market_normalized",
+                    condition_id=condition_id,
+                    category=category,
+                )
+
+        return normalized_markets
+
+    def _normalize_page(self, markets: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Normalize one page of raw markets, skipping ones that fail.
+
+        The whole page goes through normalize_markets first; only a page
+        containing a malformed market falls back to per-market handling.
+
+        Args:
+            markets: Raw market data from one Gamma page
+
+        Returns:
+            Normalized markets
+        """
         try:
-            if isinstance(clob_token_ids_str, str):
-                clob_token_ids = json.loads(clob_token_ids_str)
-            elif isinstance(clob_token_ids_str, list):
-                clob_token_ids = clob_token_ids_str
-        except json.JSONDecodeError:
+            return self.normalize_markets(markets)
+        except Exception as e:
             logger.warning(
-                "gamma_clob_token_ids_parse_failed",
-                condition_id=condition_id,
-                value=clob_token_ids_str,
+                "gamma_page_normalization_failed",
+                count=len(markets),
+                error=str(e),
             )
 
-        # Status
-        active = raw_market.get("active", False)
-        closed = raw_market.get("closed", False)
+        batch_normalized = []
+        for market in markets:
+            try:
+                batch_normalized.append(self.normalize_market(market))
+            except Exception as e:
+                logger.error(
+                    "gamma_market_normalization_failed",
+                    condition_id=market.get("conditionId"),
+                    error=str(e),
+                )
+        return batch_normalized
 
-        if closed:
-            status = "closed"
-        elif active:
-            status = "active"
-        else:
-            status = "inactive"
-
-        # Extract category/tags
-        tags = raw_market.get("tags", [])
-        category = tags[0] if tags else "unknown"
-
-        # Determine outcome type (typically yes/no for Polymarket)
-        outcome_type = "yes_no"
-        outcomes = [
-            {"label": "Yes", "token_id": clob_token_ids[0] if len(clob_token_ids) > 0 else None, "value": True},
-            {"label": "No", "token_id": clob_token_ids[1] if len(clob_token_ids) > 1 else None, "value": False},
-        ]
-
-        # Extract volumes and liquidity
-        volume = raw_market.get("volume", 0)
-        liquidity = raw_market.get("liquidity", 0)
-
-        # Build normalized format
-        normalized = {
-            "id": condition_id,
-            "title": question,
-            "description": description or question,
-            "category": category.lower() if category else "unknown",
-            "resolution_date": end_date,
-            "resolution_source": raw_market.get("resolutionSource", "Polymarket"),
-            "outcome_type": outcome_type,
-            "outcomes": outcomes,
-            "metadata": {
-                "liquidity": float(liquidity) if liquidity else 0.0,
-                "volume": float(volume) if volume else 0.0,
-                "clob_token_ids": clob_token_ids,
-                "tags": tags,
-                "market_slug": raw_market.get("marketSlug"),
-            },
-        }
+    def iter_active_market_pages(self, limit: int = 100) -> Iterator[List[Dict[str, Any]]]:
+        """Yield normalized active markets one Gamma page at a time.
 
-        logger.debug(
-            "gamma_market_normalized",
-            condition_id=condition_id,
-            category=category,
-        )
+        Only the current page is held in memory. Iteration stops at the first
+        empty or short page, or after logging a failed request.
+
+        Args:
+            limit: Markets per page
+
+        Yields:
+            Normalized markets from one page
+        """
+        offset = 0
+        fetched = 0
+
+        while True:
+            try:
+                markets = self.get_markets(
+                    limit=limit,
+                    offset=offset,
+                    closed=False,  # Only open markets
+                )
+            except Exception as e:
+                logger.error(
+                    "gamma_fetch_all_active_markets_failed",
+                    error=str(e),
+                    markets_fetched=fetched,
+                )
+                return
 
-        return normalized
+            if not markets:
+                return
+
+            # Normalize each market in this batch
+            batch_normalized = self._normalize_page(markets)
+            fetched += len(batch_normalized)
+
+            logger.info(
+                "gamma_markets_batch_fetched",
+                offset=offset,
+                count=len(markets),
+                total=fetched,
+            )
+
+            if batch_normalized:
+                yield batch_normalized
+
+            # Check if we got less than limit (last page)
+            if len(markets) < limit:
+                return
+
+            offset += limit
+
+    def iter_active_markets(self) -> Iterator[Dict[str, Any]]:
+        """Yield normalized active markets one at a time.
+
+        Yields:
+            Normalized market
+        """
+        for page in self.iter_active_market_pages():
+            yield from page
 
     def fetch_all_active_markets(self, batch_callback=None) -> List[Dict[str, Any]]:
         """Fetch all active markets with pagination and optional batch processing.
 
+        Prefer iter_active_market_pages() when the full list isn't needed.
+
+        Args:
+            batch_callback: Optional function to call with each batch of normalized markets
+                           for incremental processing (e.g., parallel ingestion)
+
+        Returns:
+            List of all normalized markets
+        """
+        logger.info("gamma_fetch_all_active_markets_start")
+
+        all_markets = []
+
+        for batch_normalized in self.iter_active_market_pages():
+            # Process batch immediately if callback provided
+            if batch_callback:
+                try:
+                    batch_callback(batch_normalized, "polymarket")
+                except Exception as e:
+                    logger.error(
+                        "gamma_batch_callback_failed",
+                        total=len(all_markets),
+                        error=str(e),
+                    )
+
+            all_markets.extend(batch_normalized)
+
+        logger.info(
+            "gamma_fetch_all_active_markets_complete",
+            total_markets=len(all_markets),
+        )
+
+        return all_markets
+
+    def close(self):
+        """Release the client.
+
+        The HTTP session is shared (or owned by the caller that passed it in),
+        so it stays open for other clients.
+        """
+
+    def __enter__(self):
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit."""
+        self.close()
+
+
+class AsyncPolymarketGammaClient:
+    """Async Gamma client that fetches market pages concurrently.
+
+    Gamma paginates by offset, so page offsets are known up front and
+    ``fetch_all_active_markets`` requests several pages at once instead of
+    paying one round trip per page.
+    """
+
+    # Normalization is pure dict munging; share the sync implementation
+    normalize_market = PolymarketGammaClient.normalize_market
+    normalize_markets = PolymarketGammaClient.normalize_markets
+    _normalize_page = PolymarketGammaClient._normalize_page
+
+    def __init__(
+        self,
+        api_base: Optional[str] = None,
+        api_key: Optional[str] = None,
+        timeout: int = 10,
+        concurrency: int = 4,
+    ):
+        """Initialize async Gamma client.
+
+        Args:
+            api_base: API base URL (default from settings)
+            api_key: API key for authentication (default from settings)
+            timeout: Request timeout in seconds
+            concurrency: Pages requested at once during a full fetch
+        """
+        settings = get_settings()
+        self.api_base = api_base or settings.polymarket_gamma_api_base
+        self.api_key = api_key or settings.polymarket_api_key
+        self.timeout = timeout
+        self.concurrency = concurrency
+
+        headers = {}
+        if self.api_key:
+            headers["Authorization"] = f"Bearer {self.api_key}"
+
+        self.session = httpx.AsyncClient(
+            timeout=timeout,
+            headers=headers,
+            http2=_HTTP2_AVAILABLE,
+            limits=httpx.Limits(
+                max_connections=100,
+                max_keepalive_connections=20,
+                keepalive_expiry=300,
+            ),
+        )
+
+    async def _aget(self, endpoint: str, params: Optional[Dict] = None) -> Any:
+        """Make async GET request to Gamma API.
+
+        Args:
+            endpoint: API endpoint path
+            params: Query parameters
+
+        Returns:
+            Response JSON
+
+        Raises:
+            httpx.HTTPError: On request failure
+        """
+        url = f"{self.api_base}{endpoint}"
+
+        try:
+            response = await self.session.get(url, params=params)
+            response.raise_for_status()
+            return _json_loads(response.content)
+
+        except httpx.HTTPStatusError as e:
+            logger.error(
+                "gamma_api_error",
+                endpoint=endpoint,
+                status_code=e.response.status_code,
+                error=str(e),
+            )
+            raise
+
+        except Exception as e:
+            logger.error(
+                "gamma_request_failed",
+                endpoint=endpoint,
+                error=str(e),
+            )
+            raise
+
+    async def get_markets(
+        self,
+        limit: int = 100,
+        offset: int = 0,
+        closed: Optional[bool] = None,
+        active: Optional[bool] = None,
+    ) -> List[Dict[str, Any]]:
+        """Get markets from Gamma API.
+
+        Args:
+            limit: Number of markets to return
+            offset: Pagination offset
+            closed: Filter by closed status
+            active: Filter by active status
+
+        Returns:
+            List of markets
+        """
+        params = {
+            "limit": limit,
+            "offset": offset,
+        }
+
+        if closed is not None:
+            params["closed"] = str(closed).lower()
+        if active is not None:
+            params["active"] = str(active).lower()
+
+        logger.debug("gamma_get_markets", params=params)
+        return await self._aget("/markets", params=params)
+
+    async def fetch_all_active_markets(self, batch_callback=None) -> List[Dict[str, Any]]:
+        """Fetch all active markets, requesting ``concurrency`` pages at a time.
+
+        Pages are processed in offset order. Fetching stops at the first
+        empty or short page, so up to ``concurrency - 1`` trailing requests
+        may come back empty.
+
         Args:
             batch_callback: Optional function to call with each batch of normalized markets
                            for incremental processing (e.g., parallel ingestion)
@@ -223,61 +632,52 @@ class PolymarketGammaClient:
         all_markets = []
         offset = 0
         limit = 100
+        done = False
 
         try:
-            while True:
-                markets = self.get_markets(
-                    limit=limit,
-                    offset=offset,
-                    closed=False,  # Only open markets
+            while not done:
+                offsets = [offset + i * limit for i in range(self.concurrency)]
+                pages = await asyncio.gather(
+                    *(self.get_markets(limit=limit, offset=o, closed=False) for o in offsets),
+                    return_exceptions=True,
                 )
 
-                if not markets:
-                    break
-
-                # Normalize each market in this batch
-                batch_normalized = []
-                for market in markets:
-                    try:
-                        normalized = self.normalize_market(market)
-                        batch_normalized.append(normalized)
-                    except Exception as e:
-                        logger.error(
-                            "gamma_market_normalization_failed",
-                            condition_id=market.get("conditionId"),
-                            error=str(e),
-                        )
-
-                # Process batch immediately if callback provided
-                if batch_callback and batch_normalized:
-                    try:
-                        batch_callback(batch_normalized, "polymarket")
-                        logger.debug(
-                            "gamma_batch_callback_executed",
-                            offset=offset,
-                            batch_size=len(batch_normalized),
-                        )
-                    except Exception as e:
-                        logger.error(
-                            "gamma_batch_callback_failed",
-                            offset=offset,
-                            error=str(e),
-                        )
-
-                all_markets.extend(batch_normalized)
-
-                logger.info(
-                    "gamma_markets_batch_fetched",
-                    offset=offset,
-                    count=len(markets),
-                    total=len(all_markets),
-                )
+                for page_offset, markets in zip(offsets, pages):
+                    # Keep earlier pages when a later request fails
+                    if isinstance(markets, BaseException):
+                        raise markets
+
+                    if not markets:
+                        done = True
+                        break
+
+                    batch_normalized = self._normalize_page(markets)
+
+                    if batch_callback and batch_normalized:
+                        try:
+                            batch_callback(batch_normalized, "polymarket")
+                        except Exception as e:
+                            logger.error(
+                                "gamma_batch_callback_failed",
+                                offset=page_offset,
+                                error=str(e),
+                            )
+
+                    all_markets.extend(batch_normalized)
+
+                    logger.info(
+                        "gamma_markets_batch_fetched",
+                        offset=page_offset,
+                        count=len(markets),
+                        total=len(all_markets),
+                    )
 
-                # Check if we got less than limit (last page)
-                if len(markets) < limit:
-                    break
+                    # Check if we got less than limit (last page)
+                    if len(markets) < limit:
+                        done = True
+                        break
 
-                offset += limit
+                offset += self.concurrency * limit
 
         except Exception as e:
             logger.error(
@@ -293,47 +693,90 @@ class PolymarketGammaClient:
 
         return all_markets
 
-    def close(self):
+    async def close(self):
         """Close HTTP session."""
-        self.session.close()
+        await self.session.aclose()
 
-    def __enter__(self):
-        """Context manager entry."""
+    async def __aenter__(self):
+        """Async context manager entry."""
         return self
 
-    def __exit__(self, exc_type, exc_val, exc_tb):
-        """Context manager exit."""
-        self.close()
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit."""
+        await self.close()
+
+
+def fetch_all_active_gamma_markets(
+    batch_callback=None,
+    concurrency: int = 4,
+    **client_kwargs: Any,
+) -> List[Dict[str, Any]]:
+    """Fetch all active Gamma markets concurrently from synchronous code.
+
+    Args:
+        batch_callback: Optional function to call with each batch of normalized markets
+        concurrency: Pages requested at once
+        **client_kwargs: Passed to AsyncPolymarketGammaClient
+
+    Returns:
+        List of all normalized markets
+    """
+    async def run() -> List[Dict[str, Any]]:
+        async with AsyncPolymarketGammaClient(concurrency=concurrency, **client_kwargs) as client:
+            return await client.fetch_all_active_markets(batch_callback=batch_callback)
+
+    return asyncio.run(run())
 
 
 class PolymarketCLOBClient:
     """Client for Polymarket CLOB API (prices and order books)."""
 
-    def __init__(self, api_base: Optional[str] = None, api_key: Optional[str] = None, timeout: int = 10):
+    def __init__(
+        self,
+        api_base: Optional[str] = None,
+        api_key: Optional[str] = None,
+        timeout: int = 10,
+        session: Optional[httpx.Client] = None,
+    ):
         """Initialize CLOB client.
 
         Args:
             api_base: API base URL (default from settings)
             api_key: API key for authentication (default from settings)
             timeout: Request timeout in seconds
+            session: HTTP client to use (default: process-wide shared client)
         """
+        settings = get_settings()
         self.api_base = api_base or settings.polymarket_clob_api_base
         self.api_key = api_key or settings.polymarket_api_key
         self.timeout = timeout
 
-        # Set up headers with API key if provided
-        headers = {}
+        # Headers are sent per request since the session may be shared
+        self.headers = {}
         if self.api_key:
-            headers["Authorization"] = f"Bearer {self.api_key}"
+            self.headers["Authorization"] = f"Bearer {self.api_key}"
 
-        self.session = httpx.Client(timeout=timeout, headers=headers)
+        self.session = session or _get_shared_session()
 
-    def _get(self, endpoint: str, params: Optional[Dict] = None) -> Any:
+        # condition_id -> validated prices, built by prime_clob_index()
+        self._clob_index: Optional[Dict[str, _ClobQuote]] = None
+
+        # simdjson parsers are meant to be reused; each parse invalidates
+        # the previous document, so values are copied out before the next one
+        self._simdjson_parser = simdjson.Parser() if simdjson is not None else None
+
+    def _get(
+        self,
+        endpoint: str,
+        params: Optional[Dict] = None,
+        decode: Optional[Callable[[bytes], Any]] = None,
+    ) -> Any:
         """Make GET request to CLOB API.
 
         Args:
             endpoint: API endpoint path
             params: Query parameters
+            decode: Body decoder (default orjson/json loads)
 
         Returns:
             Response JSON
@@ -344,7 +787,9 @@ class PolymarketCLOBClient:
         url = f"{self.api_base}{endpoint}"
 
         try:
-            response = self.session.get(url, params=params)
+            response = self.session.get(
+                url, params=params, headers=self.headers, timeout=self.timeout
+            )
             response.raise_for_status()
 
             # Debug: log response details
@@ -356,7 +801,7 @@ class PolymarketCLOBClient:
                 content_length=len(response.content) if response.content else 0,
             )
 
-            json_data = response.json()
+            json_data = (decode or _json_loads)(response.content)
 
             # Debug: log parsed JSON structure
             logger.debug(
@@ -473,86 +918,141 @@ class PolymarketCLOBClient:
                 "asks": [],
             }
 
-    def enrich_market_with_prices(
-        self,
-        gamma_market: Dict[str, Any],
-    ) -> Dict[str, Any]:
-        """Enrich Gamma market data with CLOB prices.
+    def prime_clob_index(self) -> int:
+        """Fetch simplified markets once and index them by condition ID.
 
-        Args:
-            gamma_market: Normalized market from Gamma
+        Call this before enriching a batch of markets; enrichment then
+        looks prices up in memory instead of refetching the full list per
+        market. Calling it again refreshes the prices.
 
         Returns:
-            Market with price information
+            Number of indexed markets
         """
-        try:
-            # Get simplified markets
-            clob_markets = self.get_simplified_markets()
+        if self._simdjson_parser is not None:
+            return self._prime_clob_index_simdjson()
 
-            # Find matching market by condition_id
-            condition_id = gamma_market.get("id")
+        index: Dict[str, _ClobQuote] = {}
 
-            for clob_market in clob_markets:
+        try:
+            for clob_market in self.get_simplified_markets():
                 # Ensure clob_market is a dictionary
                 if not isinstance(clob_market, dict):
                     logger.warning(
                         "clob_market_not_dict",
-                        condition_id=condition_id,
                         market_type=type(clob_market).__name__,
                         market_value=str(clob_market)[:100],
                     )
                     continue
 
-                if clob_market.get("condition_id") == condition_id:
-                    # Extract prices from tokens
-                    tokens = clob_market.get("tokens", [])
-
-                    # Update outcomes with prices
-                    if "outcomes" in gamma_market:
-                        for i, outcome in enumerate(gamma_market["outcomes"]):
-                            if i < len(tokens):
-                                token = tokens[i]
-                                # Ensure token is a dictionary before accessing fields
-                                if isinstance(token, dict):
-                                    outcome["price"] = float(token.get("price", 0))
-                                    outcome["outcome_label"] = token.get("outcome")
-                                else:
-                                    logger.warning(
-                                        "clob_token_not_dict",
-                                        condition_id=condition_id,
-                                        token_type=type(token).__name__,
-                                        token_value=str(token)[:50],
-                                    )
-
-                    # Add accepting_orders flag
-                    if isinstance(gamma_market.get("metadata"), dict):
-                        gamma_market["metadata"]["accepting_orders"] = clob_market.get("accepting_orders", False)
-                    else:
-                        # Initialize metadata if it's not a dict
-                        gamma_market["metadata"] = {
-                            "accepting_orders": clob_market.get("accepting_orders", False)
-                        }
-
-                    logger.debug(
-                        "clob_market_enriched",
-                        condition_id=condition_id,
-                        tokens=len(tokens),
+                condition_id = clob_market.get("condition_id")
+                if condition_id is not None:
+                    index[condition_id] = _build_clob_quote(
+                        condition_id,
+                        clob_market.get("tokens"),
+                        clob_market.get("accepting_orders", False),
                     )
 
-                    break
+        except Exception as e:
+            # Leave an empty index so enrichment doesn't refetch per market
+            logger.error("clob_prime_index_failed", error=str(e))
+
+        self._clob_index = index
+        logger.info("clob_index_primed", markets=len(index))
+        return len(index)
+
+    def _prime_clob_index_simdjson(self) -> int:
+        """Build the CLOB index from a lazily parsed simdjson document.
+
+        Only the fields enrichment reads (condition_id, token price and
+        outcome, accepting_orders) are copied into Python objects.
+
+        Returns:
+            Number of indexed markets
+        """
+        index: Dict[str, _ClobQuote] = {}
+
+        try:
+            doc = self._get("/simplified-markets", decode=self._simdjson_parser.parse)
+
+            # Some APIs wrap the list in a dict with a "data" key
+            if isinstance(doc, simdjson.Object):
+                doc = doc.get("data") or ()
+
+            for clob_market in doc:
+                if not isinstance(clob_market, simdjson.Object):
+                    continue
+
+                condition_id = clob_market.get("condition_id")
+                if condition_id is None:
+                    continue
+
+                index[condition_id] = _build_clob_quote(
+                    condition_id,
+                    clob_market.get("tokens"),
+                    clob_market.get("accepting_orders", False),
+                    token_type=simdjson.Object,
+                )
 
         except Exception as e:
-            logger.error(
-                "clob_enrich_market_failed",
-                condition_id=gamma_market.get("id"),
-                error=str(e),
+            # Leave an empty index so enrichment doesn't refetch per market
+            logger.error("clob_prime_index_failed", error=str(e))
+
+        self._clob_index = index
+        logger.info("clob_index_primed", markets=len(index), parser="simdjson")
+        return len(index)
+
+    def enrich_market_with_prices(
+        self,
+        gamma_market: Dict[str, Any],
+    ) -> Dict[str, Any]:
+        """Enrich Gamma market data with CLOB prices.
+
+        Prices come from the index built by prime_clob_index(), which is
+        primed on first use if needed.
+
+        Args:
+            gamma_market: Normalized market from Gamma
+
+        Returns:
+            Market with price information
+        """
+        if self._clob_index is None:
+            self.prime_clob_index()
+
+        condition_id = gamma_market.get("id")
+
+        quote = self._clob_index.get(condition_id)
+        if quote is None:
+            return gamma_market
+
+        # Token shapes were validated when the index was primed
+        for outcome, price, label in zip(gamma_market.get("outcomes") or (), quote.prices, quote.labels):
+            outcome["price"] = price
+            outcome["outcome_label"] = label
+
+        # Add accepting_orders flag
+        metadata = gamma_market.get("metadata")
+        if isinstance(metadata, dict):
+            metadata["accepting_orders"] = quote.accepting_orders
+        else:
+            # Initialize metadata if it's not a dict
+            gamma_market["metadata"] = {"accepting_orders": quote.accepting_orders}
+
+        if is_debug_enabled():
+            logger.debug(
+                "clob_market_enriched",
+                condition_id=condition_id,
+                tokens=len(quote.prices),
             )
 
         return gamma_market
 
     def close(self):
-        """Close HTTP session."""
-        self.session.close()
+        """Release the client.
+
+        The HTTP session is shared (or owned by the caller that passed it in),
+        so it stays open for other clients.
+        """
 
     def __enter__(self):
         """Context manager entry."""
@@ -579,12 +1079,53 @@ class PolymarketClient:
             clob_api_base: CLOB API base URL
             timeout: Request timeout in seconds
         """
-        self.gamma = PolymarketGammaClient(gamma_api_base, timeout)
-        self.clob = PolymarketCLOBClient(clob_api_base, timeout)
+        self.gamma = PolymarketGammaClient(gamma_api_base, timeout=timeout)
+        self.clob = PolymarketCLOBClient(clob_api_base, timeout=timeout)
+
+    def _enrich_batch(self, markets_batch: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Enrich a batch of Gamma markets with CLOB prices.
+
+        Args:
+            markets_batch: Normalized Gamma markets
+
+        Returns:
+            Enriched markets (markets that fail enrichment are kept without prices)
+        """
+        enriched_batch = []
+        for market in markets_batch:
+            try:
+                enriched_batch.append(self.clob.enrich_market_with_prices(market))
+            except Exception as e:
+                logger.error(
+                    "polymarket_enrich_failed",
+                    market_id=market.get("id"),
+                    error=str(e),
+                )
+                # Include market without prices
+                enriched_batch.append(market)
+        return enriched_batch
+
+    def iter_active_market_batches_with_prices(self) -> Iterator[List[Dict[str, Any]]]:
+        """Yield active markets with current prices, one Gamma page at a time.
+
+        Pages are enriched as they stream in, so peak memory is one page
+        rather than the whole market list.
+
+        Yields:
+            Normalized markets with prices from one page
+        """
+        # One simplified-markets fetch serves every market in this run
+        self.clob.prime_clob_index()
+
+        for markets_batch in self.gamma.iter_active_market_pages():
+            yield self._enrich_batch(markets_batch)
 
     def fetch_all_active_markets_with_prices(self, batch_callback=None) -> List[Dict[str, Any]]:
         """Fetch all active markets with current prices and optional batch processing.
 
+        Prefer iter_active_market_batches_with_prices() when the full list
+        isn't needed.
+
         Args:
             batch_callback: Optional function to call with each batch of enriched markets
                            for incremental processing (e.g., parallel ingestion)
@@ -596,47 +1137,19 @@ class PolymarketClient:
 
         all_enriched_markets = []
 
-        def gamma_batch_callback(markets_batch, platform):
-            """Enrich batch with prices and forward to main callback."""
-            enriched_batch = []
-            for market in markets_batch:
-                try:
-                    enriched = self.clob.enrich_market_with_prices(market)
-                    enriched_batch.append(enriched)
-                except Exception as e:
-                    logger.error(
-                        "polymarket_enrich_failed",
-                        market_id=market.get("id"),
-                        error=str(e),
-                    )
-                    # Include market without prices
-                    enriched_batch.append(market)
-
+        for enriched_batch in self.iter_active_market_batches_with_prices():
             all_enriched_markets.extend(enriched_batch)
 
-            # Forward enriched batch to main callback if provided
+            # Forward enriched batch to callback if provided
             if batch_callback:
-                batch_callback(enriched_batch, platform)
-
-        # Fetch markets from Gamma with batch processing
-        markets = self.gamma.fetch_all_active_markets(
-            batch_callback=gamma_batch_callback if batch_callback else None
-        )
-
-        # If no callback was provided, enrich all markets now
-        if not batch_callback:
-            for market in markets:
                 try:
-                    enriched = self.clob.enrich_market_with_prices(market)
-                    all_enriched_markets.append(enriched)
+                    batch_callback(enriched_batch, "polymarket")
                 except Exception as e:
                     logger.error(
-                        "polymarket_enrich_failed",
-                        market_id=market.get("id"),
+                        "gamma_batch_callback_failed",
+                        total=len(all_enriched_markets),
                         error=str(e),
                     )
-                    # Include market without prices
-                    all_enriched_markets.append(market)
 
         logger.info(
             "polymarket_fetch_all_active_markets_with_prices_complete",
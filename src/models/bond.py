@@ -2,7 +2,7 @@
 
 from datetime import datetime
 from typing import Dict, Any
-from sqlalchemy import Column, String, Integer, Float, DateTime, ForeignKey, Index, CheckConstraint
+from sqlalchemy import Column, Computed, String, Integer, Float, DateTime, ForeignKey, Index, CheckConstraint
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import relationship
 from src.models.database import Base
@@ -35,6 +35,13 @@ class Bond(Base):
     feature_breakdown = Column(JSONB, nullable=False)
     # Format: {"text_similarity": 0.87, "entity_similarity": 0.92, ...}
 
+    # Hot feature promoted out of feature_breakdown for B-tree filtering and
+    # sorting; generated by Postgres, so writers only set feature_breakdown
+    text_similarity = Column(
+        Float,
+        Computed("(feature_breakdown->>'text_similarity')::double precision", persisted=True),
+    )
+
     # Status
     status = Column(String, default="active", nullable=False, index=True)
     # Values: "active", "paused", "retired"
@@ -54,6 +61,7 @@ class Bond(Base):
         Index('idx_bonds_kalshi', 'kalshi_market_id'),
         Index('idx_bonds_poly', 'polymarket_market_id'),
         Index('idx_bonds_active_tier', 'tier', 'status'),  # Composite for common query
+        Index('idx_bonds_text_sim', 'tier', 'text_similarity'),
     )
 
     def to_dict(self) -> Dict[str, Any]:
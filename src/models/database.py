@@ -1,13 +1,13 @@
 """Database connection and session management."""
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, text
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
-from src.config import settings
+from src.config import get_settings
 
 # Create engine with connection pooling
 engine = create_engine(
-    settings.database_url,
+    get_settings().database_url,
     pool_pre_ping=True,  # Verify connections before using
     pool_size=10,
     max_overflow=20,
@@ -27,3 +27,21 @@ def get_db():
         yield db
     finally:
         db.close()
+
+
+def set_hnsw_ef_search(db, limit: int) -> None:
+    """Size the pgvector HNSW search list for the current transaction.
+
+    An HNSW scan returns at most ``hnsw.ef_search`` rows (pgvector default
+    40), so queries with a larger LIMIT would silently come back short.
+
+    Args:
+        db: Database session
+        limit: LIMIT of the upcoming vector query
+    """
+    ef_search = max(get_settings().hnsw_ef_search, limit)
+    # SET can't take bind parameters; set_config(..., true) is transaction-local
+    db.execute(
+        text("SELECT set_config('hnsw.ef_search', :ef_search, true)"),
+        {"ef_search": str(ef_search)},
+    )
@@ -1,9 +1,9 @@
 """Market model for normalized market data."""
 
 from datetime import datetime
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Iterable, List
 from sqlalchemy import Column, String, Text, JSON, DateTime, Float, Index
-from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.dialects.postgresql import JSONB, insert as pg_insert
 from pgvector.sqlalchemy import Vector
 from src.models.database import Base
 
@@ -73,10 +73,59 @@ class Market(Base):
         Index('idx_markets_category', 'category'),
         Index('idx_markets_status', 'status'),
         Index('idx_markets_condition_id', 'condition_id'),
-        # Vector similarity index (created via migration)
-        # Index('idx_markets_embedding', 'text_embedding', postgresql_using='ivfflat', postgresql_ops={'text_embedding': 'vector_cosine_ops'}),
+        # Vector similarity index: HNSW with vector_ip_ops, created via
+        # migrations 002/004 (embeddings are unit-normalized)
     )
 
+    # Columns left untouched when bulk_upsert hits an existing market
+    UPSERT_PRESERVED_COLUMNS = ("id", "created_at")
+
+    @classmethod
+    def bulk_upsert(
+        cls,
+        session,
+        rows: List[Dict[str, Any]],
+        chunk_size: int = 500,
+        update_columns: Optional[Iterable[str]] = None,
+    ) -> int:
+        """Insert or update many markets with one statement per chunk.
+
+        Issues ``INSERT ... ON CONFLICT (id) DO UPDATE`` instead of a
+        query plus ORM object per market. Embedding values may be numpy
+        arrays; pgvector binds them directly. The caller commits.
+
+        Args:
+            session: Database session
+            rows: Column-name -> value dicts, all with the same keys
+            chunk_size: Rows per INSERT statement
+            update_columns: Columns to overwrite on conflict (default: every
+                column in the rows except id and created_at)
+
+        Returns:
+            Number of rows written (duplicate ids keep the last row)
+        """
+        # Postgres rejects a statement that upserts the same id twice
+        rows = list({row["id"]: row for row in rows}.values())
+        if not rows:
+            return 0
+
+        table = cls.__table__
+        if update_columns is None:
+            update_columns = [
+                name for name in rows[0] if name not in cls.UPSERT_PRESERVED_COLUMNS
+            ]
+        update_columns = list(update_columns)
+
+        for start in range(0, len(rows), chunk_size):
+            stmt = pg_insert(table).values(rows[start:start + chunk_size])
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[table.c.id],
+                set_={name: stmt.excluded[name] for name in update_columns},
+            )
+            session.execute(stmt)
+
+        return len(rows)
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert model to dictionary."""
         return {
@@ -0,0 +1,100 @@
+"""Single-pass title scan shared by the title classifiers.
+
+Each classifier looks for its own fixed set of terms in the lowercased
+title. Matching all of them in one scan and splitting the hits by
+classifier reads the title once instead of once per classifier.
+"""
+
+from dataclasses import dataclass
+from typing import Dict, Set
+
+from src.normalization.event_classifier import (
+    _GEO_SUBSTRINGS,
+    _GRANULARITY_WORDS,
+    _KEYWORD_INDEX,
+    _NEGATIVE_WORDS,
+    _PARLAY_KEYWORDS,
+    _SPORT_BY_MARKER,
+    _KeywordMatcher,
+)
+
+# Terms each classifier looks for, as substrings of the lowercased title
+_TERMS_BY_CLASSIFIER: Dict[str, tuple] = {
+    "event": tuple(_KEYWORD_INDEX),
+    "sport": tuple(_SPORT_BY_MARKER),
+    "parlay": _PARLAY_KEYWORDS,
+    "granularity": tuple(word for _, words in _GRANULARITY_WORDS for word in words),
+    "polarity": _NEGATIVE_WORDS,
+    "geo": _GEO_SUBSTRINGS,
+}
+
+
+def _build_classifier_index(terms_by_classifier: Dict[str, tuple]) -> Dict[str, tuple]:
+    """Map each term to the classifiers that look for it.
+
+    Args:
+        terms_by_classifier: Terms keyed by classifier
+
+    Returns:
+        Map of term to classifier names
+    """
+    index: Dict[str, list] = {}
+    for classifier, terms in terms_by_classifier.items():
+        for term in terms:
+            index.setdefault(term, []).append(classifier)
+    return {term: tuple(classifiers) for term, classifiers in index.items()}
+
+
+_CLASSIFIERS_BY_TERM = _build_classifier_index(_TERMS_BY_CLASSIFIER)
+_TITLE_TERMS = _KeywordMatcher(_CLASSIFIERS_BY_TERM)
+
+
+def scan_title(title_lower: str) -> Dict[str, frozenset]:
+    """Find every classifier term in a title with one scan.
+
+    Geo scope and polarity indicators match as whole words; their hits
+    here are substrings that tell the classifier which checks can be
+    skipped, not final matches.
+
+    Args:
+        title_lower: Lowercased clean market title
+
+    Returns:
+        Terms found in the title, keyed by classifier ("event", "sport",
+        "parlay", "granularity", "polarity", "geo")
+    """
+    found: Dict[str, Set[str]] = {classifier: set() for classifier in _TERMS_BY_CLASSIFIER}
+    for term in _TITLE_TERMS.match(title_lower):
+        for classifier in _CLASSIFIERS_BY_TERM[term]:
+            found[classifier].add(term)
+    return {classifier: frozenset(terms) for classifier, terms in found.items()}
+
+
+@dataclass(slots=True, frozen=True)
+class TitleFeatures:
+    """Everything the title classifiers read from one title, computed once.
+
+    Each term field holds the hits for that classifier, as returned by
+    scan_title.
+    """
+
+    lower: str
+    event: frozenset
+    sport: frozenset
+    parlay: frozenset
+    granularity: frozenset
+    polarity: frozenset
+    geo: frozenset
+
+
+def build_title_features(title: str) -> TitleFeatures:
+    """Lowercase and scan a clean title once for all classifiers.
+
+    Args:
+        title: Clean market title
+
+    Returns:
+        Title features to pass to each classifier
+    """
+    title_lower = title.lower()
+    return TitleFeatures(title_lower, **scan_title(title_lower))
@@ -1,60 +1,353 @@
 """Text embedding generation using sentence-transformers."""
 
+from collections import OrderedDict
 from typing import List, Optional
+import hashlib
+import os
+import sys
+import threading
 import numpy as np
 import structlog
 
+from src.config import get_settings
+from src.utils.log_level import is_debug_enabled
+
+try:
+    import diskcache
+except ImportError:
+    diskcache = None
+
 logger = structlog.get_logger()
 
 # Lazy load sentence transformer model
 _model = None
 
+# Device type to autocast on, set by get_model() when EMBEDDING_PRECISION=bf16
+_bf16_autocast_device = None
+
+# Embedding memo: blake2b(model, text) digest -> read-only float32 embedding.
+# Keys are 16-byte digests so the cache doesn't hold on to market texts.
+_embedding_cache: "OrderedDict[bytes, np.ndarray]" = OrderedDict()
+_embedding_cache_lock = threading.Lock()
+_disk_cache = None
+_disk_cache_opened = False
+
+
+class OnnxSentenceEncoder:
+    """ONNX Runtime stand-in for SentenceTransformer (mean-pooled MiniLM).
+
+    Implements the subset of ``SentenceTransformer.encode`` used in this
+    module, so callers don't change when ``EMBEDDING_BACKEND=onnx``.
+    """
+
+    def __init__(self, model_name: str, onnx_path: Optional[str] = None):
+        """Load the tokenizer and ONNX model.
+
+        Args:
+            model_name: Sentence transformer model name
+            onnx_path: Directory with a pre-exported ONNX model (exported from
+                the Hugging Face checkpoint when None)
+        """
+        from optimum.onnxruntime import ORTModelForFeatureExtraction
+        from transformers import AutoTokenizer
+
+        # Short sentence-transformers names live under that org on the Hub
+        model_id = model_name if "/" in model_name else f"sentence-transformers/{model_name}"
+
+        self.tokenizer = AutoTokenizer.from_pretrained(onnx_path or model_id)
+        self.model = ORTModelForFeatureExtraction.from_pretrained(
+            onnx_path or model_id,
+            export=onnx_path is None,
+            provider="CPUExecutionProvider",
+        )
+
+    def encode(
+        self,
+        sentences,
+        batch_size: int = 32,
+        convert_to_numpy: bool = True,
+        normalize_embeddings: bool = False,
+        show_progress_bar: bool = False,
+    ) -> np.ndarray:
+        """Encode one text or a list of texts.
+
+        Args:
+            sentences: Text or list of texts
+            batch_size: Texts per forward pass
+            convert_to_numpy: Accepted for compatibility (always numpy)
+            normalize_embeddings: Scale embeddings to unit length
+            show_progress_bar: Accepted for compatibility (ignored)
+
+        Returns:
+            (D,) embedding for one text, (N, D) for a list
+        """
+        single = isinstance(sentences, str)
+        texts = [sentences] if single else list(sentences)
+
+        chunks = []
+        for i in range(0, len(texts), batch_size):
+            inputs = self.tokenizer(
+                texts[i:i + batch_size],
+                padding=True,
+                truncation=True,
+                return_tensors="np",
+            )
+            token_embeddings = self.model(**inputs).last_hidden_state
+
+            # Mean pooling over non-padding tokens
+            mask = inputs["attention_mask"][..., None].astype(np.float32)
+            summed = (np.asarray(token_embeddings) * mask).sum(axis=1)
+            chunks.append(summed / np.clip(mask.sum(axis=1), 1e-9, None))
+
+        embeddings = np.concatenate(chunks).astype(np.float32) if chunks else np.empty((0, 0), np.float32)
+
+        if normalize_embeddings and len(embeddings):
+            norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+            embeddings = embeddings / np.clip(norms, 1e-12, None)
+
+        return embeddings[0] if single else embeddings
+
+
+def _apply_precision(model, precision: str):
+    """Set up reduced-precision inference for a SentenceTransformer.
+
+    fp16 converts the weights on GPU. bf16 autocasts inside encode on the
+    model's device (fast on AVX512-BF16/AMX CPUs). Unsupported combinations
+    stay fp32.
+
+    Args:
+        model: Loaded SentenceTransformer
+        precision: "fp32", "fp16" or "bf16"
+
+    Returns:
+        The model, converted if applicable
+    """
+    global _bf16_autocast_device
+
+    if precision == "fp32":
+        return model
+
+    device_type = model.device.type
+    if precision == "fp16" and device_type == "cuda":
+        return model.half()
+    if precision == "bf16":
+        import torch
+
+        torch.set_float32_matmul_precision("medium")
+        _bf16_autocast_device = device_type
+        return model
+
+    logger.warning("embedding_precision_unsupported", precision=precision, device=device_type)
+    return model
+
+
+def _encode(model, sentences, **kwargs) -> np.ndarray:
+    """Run model.encode, autocasting to bf16 when enabled.
+
+    Args:
+        model: Embedding model
+        sentences: Text or list of texts
+        **kwargs: Passed to model.encode
+
+    Returns:
+        Embeddings as a numpy array
+    """
+    if _bf16_autocast_device is None:
+        return model.encode(sentences, convert_to_numpy=True, **kwargs)
+
+    import torch
+
+    with torch.autocast(_bf16_autocast_device, dtype=torch.bfloat16):
+        embeddings = model.encode(sentences, convert_to_tensor=True, **kwargs)
+
+    # numpy has no bfloat16; cast back to float32 before leaving torch
+    return embeddings.float().cpu().numpy()
+
 
 def get_model():
-    """Get sentence transformer model (lazy loaded)."""
+    """Get sentence transformer model (lazy loaded).
+
+    ``EMBEDDING_BACKEND=onnx`` swaps in OnnxSentenceEncoder, which needs
+    ``optimum[onnxruntime]`` installed.
+    """
     global _model
     if _model is None:
         try:
-            from sentence_transformers import SentenceTransformer
-            from src.config import settings
+            settings = get_settings()
 
-            _model = SentenceTransformer(settings.embedding_model)
-            logger.info("embedding_model_loaded", model=settings.embedding_model)
+            if settings.embedding_backend == "onnx":
+                _model = OnnxSentenceEncoder(settings.embedding_model, settings.embedding_onnx_path)
+            else:
+                from sentence_transformers import SentenceTransformer
+
+                _model = _apply_precision(
+                    SentenceTransformer(settings.embedding_model),
+                    settings.embedding_precision,
+                )
+
+            logger.info(
+                "embedding_model_loaded",
+                model=settings.embedding_model,
+                backend=settings.embedding_backend,
+                precision=settings.embedding_precision,
+            )
         except Exception as e:
             logger.error("embedding_model_load_failed", error=str(e))
             raise
     return _model
 
 
-def generate_embedding(text: str) -> Optional[List[float]]:
+def _embedding_cache_key(text: str) -> bytes:
+    """Hash the model name and text into an embedding cache key."""
+    settings = get_settings()
+
+    # Including the model keeps persisted entries valid across model changes
+    data = f"{settings.embedding_model}\0{text}".encode("utf-8")
+    return hashlib.blake2b(data, digest_size=16).digest()
+
+
+def _get_disk_cache():
+    """Open the persistent embedding cache once, if configured and installed."""
+    global _disk_cache, _disk_cache_opened
+    if not _disk_cache_opened:
+        settings = get_settings()
+
+        _disk_cache_opened = True
+        if settings.embedding_cache_dir and diskcache is not None:
+            _disk_cache = diskcache.Cache(settings.embedding_cache_dir)
+            logger.info("embedding_disk_cache_opened", path=settings.embedding_cache_dir)
+    return _disk_cache
+
+
+def _cache_put(key: bytes, embedding: np.ndarray, persist: bool = True) -> np.ndarray:
+    """Store an embedding in the memory cache (and the disk cache if enabled).
+
+    Returns the stored read-only float32 copy.
+    """
+    settings = get_settings()
+
+    embedding = np.array(embedding, dtype=np.float32)
+    embedding.setflags(write=False)
+
+    with _embedding_cache_lock:
+        _embedding_cache[key] = embedding
+        _embedding_cache.move_to_end(key)
+        while len(_embedding_cache) > settings.embedding_cache_size:
+            _embedding_cache.popitem(last=False)
+
+    disk = _get_disk_cache() if persist else None
+    if disk is not None:
+        disk.set(key, embedding.tobytes())
+
+    return embedding
+
+
+def _cache_get(key: bytes) -> Optional[np.ndarray]:
+    """Look an embedding up in the memory cache, then the disk cache."""
+    with _embedding_cache_lock:
+        embedding = _embedding_cache.get(key)
+        if embedding is not None:
+            _embedding_cache.move_to_end(key)
+            return embedding
+
+    disk = _get_disk_cache()
+    if disk is not None:
+        data = disk.get(key)
+        if data is not None:
+            embedding = np.frombuffer(data, dtype=np.float32)
+            _cache_put(key, embedding, persist=False)
+            return embedding
+
+    return None
+
+
+def clear_embedding_cache() -> None:
+    """Drop all in-memory cached embeddings."""
+    with _embedding_cache_lock:
+        _embedding_cache.clear()
+
+
+def preload():
+    """Load the embedding model now, before worker processes are forked.
+
+    Forked workers then share the parent's weights copy-on-write instead of
+    each loading (~80 MB for MiniLM) on first use.
+
+    Returns:
+        The loaded model
+    """
+    return get_model()
+
+
+def is_fork_safe() -> bool:
+    """Whether forked workers can use the already-loaded model.
+
+    CUDA contexts don't survive fork; use a spawn pool when this is False.
+    """
+    device = getattr(_model, "device", None)
+    return getattr(device, "type", "cpu") != "cuda"
+
+
+def init_worker() -> None:
+    """Pool initializer for embedding workers.
+
+    Each pool process gets one torch thread so N workers don't each spin
+    up a thread per core.
+    """
+    torch = sys.modules.get("torch")
+    if torch is not None:
+        torch.set_num_threads(1)
+
+
+def _reset_model_after_fork() -> None:
+    """Drop a CUDA model in a forked child so it reloads instead of crashing."""
+    global _model
+    if not is_fork_safe():
+        _model = None
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_model_after_fork)
+
+
+def generate_embedding(text: str) -> Optional[np.ndarray]:
     """Generate text embedding.
 
+    The array is read-only and shared with the embedding cache. pgvector
+    binds numpy arrays directly; for JSON use
+    ``orjson.dumps(..., option=orjson.OPT_SERIALIZE_NUMPY)``.
+
     Args:
         text: Input text
 
     Returns:
-        384-dimensional embedding vector or None on failure
+        384-dimensional float32 embedding vector or None on failure
     """
     if not text:
         logger.warning("generate_embedding_empty_text")
         return None
 
     try:
-        model = get_model()
+        # Market texts rarely change between polls; reuse their embeddings
+        key = _embedding_cache_key(text)
+        embedding = _cache_get(key)
 
-        # Generate embedding
-        embedding = model.encode(text, convert_to_numpy=True)
+        if embedding is None:
+            model = get_model()
 
-        # Convert to list for JSON serialization
-        embedding_list = embedding.tolist()
+            # Generate embedding
+            # Unit-normalized so cosine similarity is a plain dot product
+            embedding = _encode(model, text, normalize_embeddings=True)
+            embedding = _cache_put(key, embedding)
 
-        logger.debug(
-            "embedding_generated",
-            text_length=len(text),
-            embedding_dims=len(embedding_list),
-        )
+        if is_debug_enabled():
+            logger.debug(
+                "embedding_generated",
+                text_length=len(text),
+                embedding_dims=len(embedding),
+            )
 
-        return embedding_list
+        return embedding
 
     except Exception as e:
         logger.error(
@@ -65,7 +358,7 @@ def generate_embedding(text: str) -> Optional[List[float]]:
         return None
 
 
-def generate_market_embedding(title: str, description: str) -> Optional[List[float]]:
+def generate_market_embedding(title: str, description: str) -> Optional[np.ndarray]:
     """Generate combined embedding for market title and description.
 
     Args:
@@ -73,22 +366,23 @@ def generate_market_embedding(title: str, description: str) -> Optional[List[flo
         description: Market description
 
     Returns:
-        384-dimensional embedding vector or None on failure
+        384-dimensional float32 embedding vector or None on failure
     """
     # Combine title and description with separator
     combined_text = f"{title} | {description}"
 
-    logger.debug(
-        "generate_market_embedding",
-        title_length=len(title),
-        description_length=len(description),
-        combined_length=len(combined_text),
-    )
+    if is_debug_enabled():
+        logger.debug(
+            "generate_market_embedding",
+            title_length=len(title),
+            description_length=len(description),
+            combined_length=len(combined_text),
+        )
 
     return generate_embedding(combined_text)
 
 
-def batch_generate_embeddings(texts: List[str], batch_size: int = 32) -> List[Optional[List[float]]]:
+def batch_generate_embeddings(texts: List[str], batch_size: int = 32) -> List[Optional[np.ndarray]]:
     """Generate embeddings for multiple texts in batches.
 
     Args:
@@ -96,64 +390,61 @@ def batch_generate_embeddings(texts: List[str], batch_size: int = 32) -> List[Op
         batch_size: Batch size for processing
 
     Returns:
-        List of embeddings (None for failures)
+        List of read-only float32 embeddings (None for failures)
     """
     if not texts:
         return []
 
     logger.info("batch_generate_embeddings_start", count=len(texts), batch_size=batch_size)
 
-    embeddings = []
+    embeddings = [None] * len(texts)
 
     try:
-        model = get_model()
-
-        # Process in batches
-        for i in range(0, len(texts), batch_size):
-            batch = texts[i:i + batch_size]
-
-            # Filter out empty texts
-            valid_texts = []
-            valid_indices = []
-            for j, text in enumerate(batch):
-                if text:
-                    valid_texts.append(text)
-                    valid_indices.append(j)
-
-            # Generate embeddings for valid texts
-            if valid_texts:
-                batch_embeddings = model.encode(valid_texts, convert_to_numpy=True)
-
-                # Map back to original batch
-                batch_results = [None] * len(batch)
-                for j, emb_idx in enumerate(valid_indices):
-                    batch_results[emb_idx] = batch_embeddings[j].tolist()
-
-                embeddings.extend(batch_results)
+        # Filter out empty texts and ones with cached embeddings
+        miss_indices = []
+        miss_keys = []
+        cached = 0
+        for i, text in enumerate(texts):
+            if not text:
+                continue
+            key = _embedding_cache_key(text)
+            embedding = _cache_get(key)
+            if embedding is not None:
+                embeddings[i] = embedding
+                cached += 1
             else:
-                embeddings.extend([None] * len(batch))
-
-            logger.debug(
-                "batch_embeddings_generated",
-                batch_start=i,
-                batch_size=len(batch),
-                valid=len(valid_texts),
+                miss_indices.append(i)
+                miss_keys.append(key)
+
+        # One encode call: sentence-transformers batches internally, so
+        # tokenization and padding aren't restarted for every chunk
+        if miss_indices:
+            model = get_model()
+            batch_embeddings = _encode(
+                model,
+                [texts[i] for i in miss_indices],
+                batch_size=batch_size,
+                normalize_embeddings=True,
+                show_progress_bar=False,
             )
 
+            # Map back to original positions
+            for j, text_idx in enumerate(miss_indices):
+                embeddings[text_idx] = _cache_put(miss_keys[j], batch_embeddings[j])
+
         logger.info(
             "batch_generate_embeddings_complete",
             total=len(embeddings),
-            successful=sum(1 for e in embeddings if e is not None),
+            successful=cached + len(miss_indices),
+            cached=cached,
         )
 
     except Exception as e:
         logger.error(
             "batch_generate_embeddings_failed",
             error=str(e),
-            processed=len(embeddings),
         )
-        # Pad with None for remaining
-        embeddings.extend([None] * (len(texts) - len(embeddings)))
+        embeddings = [None] * len(texts)
 
     return embeddings
 
@@ -169,8 +460,9 @@ def cosine_similarity(emb1: List[float], emb2: List[float]) -> float:
         Cosine similarity [0, 1]
     """
     try:
-        vec1 = np.array(emb1)
-        vec2 = np.array(emb2)
+        # asarray skips the copy when given float32 arrays already
+        vec1 = np.asarray(emb1, dtype=np.float32)
+        vec2 = np.asarray(emb2, dtype=np.float32)
 
         dot_product = np.dot(vec1, vec2)
         norm1 = np.linalg.norm(vec1)
@@ -181,8 +473,28 @@ def cosine_similarity(emb1: List[float], emb2: List[float]) -> float:
 
         # Cosine similarity is in [-1, 1], normalize to [0, 1]
         similarity = dot_product / (norm1 * norm2)
-        return (similarity + 1) / 2
+        return float((similarity + 1) / 2)
 
     except Exception as e:
         logger.error("cosine_similarity_failed", error=str(e))
         return 0.0
+
+
+def pairwise_cosine(embeddings1: np.ndarray, embeddings2: np.ndarray) -> np.ndarray:
+    """Calculate cosine similarity between every pair of rows in one matmul.
+
+    Rows must be unit-normalized, as generate_embedding and
+    batch_generate_embeddings produce them; stack them once with np.stack.
+
+    Args:
+        embeddings1: (N, D) unit-normalized embeddings
+        embeddings2: (M, D) unit-normalized embeddings
+
+    Returns:
+        (N, M) float32 cosine similarities [0, 1]
+    """
+    a = np.asarray(embeddings1, dtype=np.float32)
+    b = np.asarray(embeddings2, dtype=np.float32)
+
+    # Cosine similarity is in [-1, 1], normalize to [0, 1]
+    return (a @ b.T + 1) * 0.5
@@ -1,14 +1,40 @@
-"""Entity extraction using spaCy NER and custom patterns."""
+"""Entity extraction using spaCy NER and custom patterns.
+
+Only doc.ents is read, so the spaCy pipeline is loaded with just tok2vec
+and ner; the tagger, parser, lemmatizer, attribute_ruler and senter are
+excluded.
+"""
 
 import re
-from typing import Dict, List, Set
+from functools import lru_cache
+from typing import Dict, List, Optional, Set, Tuple
 import structlog
 
+from src.config import get_settings
+from src.utils.log_level import is_debug_enabled
+
+# Optional: google-re2 matches the known-term alternations as a true DFA
+# (linear time, no backtracking); falls back to the stdlib engine.
+try:
+    import re2 as _re
+except ImportError:
+    _re = re
+
+# Optional: threadpoolctl (a scikit-learn dependency) caps BLAS threads at
+# runtime, which still works after numpy has already been imported.
+try:
+    from threadpoolctl import threadpool_limits
+except ImportError:
+    threadpool_limits = None
+
 logger = structlog.get_logger()
 
 # Lazy load spaCy model
 _nlp = None
 
+# Pipeline components the extractors never read (NER only needs tok2vec)
+_SPACY_EXCLUDE = ["tagger", "parser", "lemmatizer", "attribute_ruler", "senter"]
+
 
 def get_nlp():
     """Get spaCy NLP model (lazy loaded)."""
@@ -16,10 +42,24 @@ def get_nlp():
     if _nlp is None:
         try:
             import spacy
-            from src.config import settings
-
-            _nlp = spacy.load(settings.spacy_model)
-            logger.info("spacy_model_loaded", model=settings.spacy_model)
+            settings = get_settings()
+
+            # Must run before spacy.load so the model is allocated on the GPU
+            using_gpu = spacy.prefer_gpu() if settings.spacy_use_gpu else False
+
+            # Normalizer pools run one spaCy per process; letting each one
+            # spawn a BLAS thread per core oversubscribes the CPU
+            if settings.spacy_blas_threads and threadpool_limits is not None:
+                threadpool_limits(limits=settings.spacy_blas_threads, user_api="blas")
+
+            _nlp = spacy.load(settings.spacy_model, exclude=_SPACY_EXCLUDE)
+            logger.info(
+                "spacy_model_loaded",
+                model=settings.spacy_model,
+                pipes=_nlp.pipe_names,
+                gpu=using_gpu,
+                blas_threads=settings.spacy_blas_threads,
+            )
         except Exception as e:
             logger.error("spacy_model_load_failed", error=str(e))
             raise
@@ -50,40 +90,118 @@ KNOWN_COUNTRIES = {
 }
 
 
-def extract_tickers(text: str) -> Set[str]:
+def _compile_terms(terms: Set[str]):
+    """Compile known terms into one word-bounded alternation.
+
+    Longer terms come first so a multi-word term wins over any shorter
+    term it starts with.
+
+    Args:
+        terms: Lowercase known terms
+
+    Returns:
+        Compiled pattern matching any term in lowercase text
+    """
+    alternation = "|".join(_re.escape(term) for term in sorted(terms, key=len, reverse=True))
+    return _re.compile(r'\b(?:' + alternation + r')\b')
+
+
+# One scan per category instead of one regex search per known term. With a
+# few dozen terms per set the alternation compiles to a compact prefix-shared
+# program; revisit a trie/Aho-Corasick scanner if a set grows into the
+# hundreds.
+_TICKER_RE = _compile_terms(KNOWN_TICKERS)
+_ORG_RE = _compile_terms(KNOWN_ORGANIZATIONS)
+_COUNTRY_RE = _compile_terms(KNOWN_COUNTRIES)
+
+# Display forms for matched terms: short symbols/abbreviations upper-cased,
+# longer names title-cased
+_TICKER_CANON = {t: t.upper() if len(t) <= 5 else t.title() for t in KNOWN_TICKERS}
+_ORG_CANON = {o: o.upper() if len(o) <= 5 else o.title() for o in KNOWN_ORGANIZATIONS}
+_COUNTRY_CANON = {c: c.upper() if len(c) <= 3 else c.title() for c in KNOWN_COUNTRIES}
+
+# Specific events and fiscal quarters picked up alongside NER misc entities
+_MISC_EVENT_RE = _re.compile(r'\b(super bowl|world cup|olympics|election|q[1-4]|quarter [1-4])\b')
+
+
+def extract_tickers(text: str, text_lower: Optional[str] = None) -> Set[str]:
     """Extract financial tickers from text.
 
     Args:
         text: Input text
+        text_lower: text.lower(), if the caller already computed it
 
     Returns:
         Set of ticker symbols
     """
     tickers = set()
 
-    text_lower = text.lower()
-
-    # Check for known tickers
-    for ticker in KNOWN_TICKERS:
-        # Word boundary match
-        pattern = r'\b' + re.escape(ticker) + r'\b'
-        if re.search(pattern, text_lower):
-            # Normalize to uppercase for tickers
-            tickers.add(ticker.upper() if len(ticker) <= 5 else ticker.title())
+    if text_lower is None:
+        text_lower = text.lower()
 
-    # Look for ticker patterns: $XXX or uppercase 2-5 letter words
-    ticker_pattern = r'\$([A-Z]{2,5})\b|\b([A-Z]{2,5})\b'
-    matches = re.findall(ticker_pattern, text)
-    for match in matches:
-        ticker = match[0] or match[1]
-        if ticker and ticker in KNOWN_TICKERS:
-            tickers.add(ticker)
+    # Check for known tickers; this also covers $XXX and uppercase symbols,
+    # since only known tickers are kept either way
+    tickers.update(map(_TICKER_CANON.__getitem__, _TICKER_RE.findall(text_lower)))
 
-    logger.debug("tickers_extracted", count=len(tickers), tickers=list(tickers))
+    if is_debug_enabled():
+        logger.debug("tickers_extracted", count=len(tickers), tickers=list(tickers))
 
     return tickers
 
 
+def _known_organizations(text_lower: str) -> Set[str]:
+    """Match known organizations in lowercased text."""
+    return set(map(_ORG_CANON.__getitem__, _ORG_RE.findall(text_lower)))
+
+
+def _known_countries(text_lower: str) -> Set[str]:
+    """Match known countries in lowercased text."""
+    return set(map(_COUNTRY_CANON.__getitem__, _COUNTRY_RE.findall(text_lower)))
+
+
+def _people_from_doc(doc) -> Set[str]:
+    """Collect PERSON entities from a parsed spaCy Doc."""
+    return {ent.text.strip() for ent in doc.ents if ent.label_ == "PERSON"}
+
+
+def _organizations_from_doc(doc) -> Set[str]:
+    """Collect organization-like entities from a parsed spaCy Doc."""
+    organizations = set()
+    for ent in doc.ents:
+        if ent.label_ in ["ORG", "FAC", "GPE"]:  # Organization, Facility, Geo-political entity
+            org_name = ent.text.strip().lower()
+            # Filter out countries (handled separately)
+            if org_name not in KNOWN_COUNTRIES:
+                organizations.add(ent.text.strip())
+    return organizations
+
+
+def _countries_from_doc(doc) -> Set[str]:
+    """Collect country entities from a parsed spaCy Doc."""
+    countries = set()
+    for ent in doc.ents:
+        if ent.label_ == "GPE":  # Geo-political entity
+            country_name = ent.text.strip().lower()
+            if country_name in KNOWN_COUNTRIES or len(ent.text) > 3:
+                countries.add(ent.text.strip())
+    return countries
+
+
+def _misc_from_doc(doc, text_lower: str) -> Set[str]:
+    """Collect event/product entities from a Doc plus known event patterns."""
+    misc = set()
+
+    for ent in doc.ents:
+        if ent.label_ in ["EVENT", "PRODUCT", "WORK_OF_ART"]:
+            misc.add(ent.text.strip())
+
+    # Extract specific events
+    for match in _MISC_EVENT_RE.findall(text_lower):
+        misc.add(match.title())
+
+    return misc
+
+
 def extract_people(text: str) -> Set[str]:
     """Extract people names using spaCy NER.
 
@@ -97,13 +215,10 @@ def extract_people(text: str) -> Set[str]:
 
     try:
         nlp = get_nlp()
-        doc = nlp(text)
+        people = _people_from_doc(nlp(text))
 
-        for ent in doc.ents:
-            if ent.label_ == "PERSON":
-                people.add(ent.text.strip())
-
-        logger.debug("people_extracted", count=len(people), people=list(people))
+        if is_debug_enabled():
+            logger.debug("people_extracted", count=len(people), people=list(people))
 
     except Exception as e:
         logger.error("people_extraction_failed", error=str(e))
@@ -111,38 +226,26 @@ def extract_people(text: str) -> Set[str]:
     return people
 
 
-def extract_organizations(text: str) -> Set[str]:
+def extract_organizations(text: str, text_lower: Optional[str] = None) -> Set[str]:
     """Extract organizations using spaCy NER and known patterns.
 
     Args:
         text: Input text
+        text_lower: text.lower(), if the caller already computed it
 
     Returns:
         Set of organization names
     """
-    organizations = set()
-
-    text_lower = text.lower()
-
     # Check for known organizations
-    for org in KNOWN_ORGANIZATIONS:
-        pattern = r'\b' + re.escape(org) + r'\b'
-        if re.search(pattern, text_lower):
-            organizations.add(org.upper() if len(org) <= 5 else org.title())
+    organizations = _known_organizations(text.lower() if text_lower is None else text_lower)
 
     # Use spaCy NER for additional organizations
     try:
         nlp = get_nlp()
-        doc = nlp(text)
-
-        for ent in doc.ents:
-            if ent.label_ in ["ORG", "FAC", "GPE"]:  # Organization, Facility, Geo-political entity
-                org_name = ent.text.strip().lower()
-                # Filter out countries (handled separately)
-                if org_name not in KNOWN_COUNTRIES:
-                    organizations.add(ent.text.strip())
+        organizations |= _organizations_from_doc(nlp(text))
 
-        logger.debug("organizations_extracted", count=len(organizations), orgs=list(organizations))
+        if is_debug_enabled():
+            logger.debug("organizations_extracted", count=len(organizations), orgs=list(organizations))
 
     except Exception as e:
         logger.error("organizations_extraction_failed", error=str(e))
@@ -150,37 +253,26 @@ def extract_organizations(text: str) -> Set[str]:
     return organizations
 
 
-def extract_countries(text: str) -> Set[str]:
+def extract_countries(text: str, text_lower: Optional[str] = None) -> Set[str]:
     """Extract country names.
 
     Args:
         text: Input text
+        text_lower: text.lower(), if the caller already computed it
 
     Returns:
         Set of country names
     """
-    countries = set()
-
-    text_lower = text.lower()
-
     # Check for known countries
-    for country in KNOWN_COUNTRIES:
-        pattern = r'\b' + re.escape(country) + r'\b'
-        if re.search(pattern, text_lower):
-            countries.add(country.upper() if len(country) <= 3 else country.title())
+    countries = _known_countries(text.lower() if text_lower is None else text_lower)
 
     # Use spaCy NER for additional countries
     try:
         nlp = get_nlp()
-        doc = nlp(text)
+        countries |= _countries_from_doc(nlp(text))
 
-        for ent in doc.ents:
-            if ent.label_ == "GPE":  # Geo-political entity
-                country_name = ent.text.strip().lower()
-                if country_name in KNOWN_COUNTRIES or len(ent.text) > 3:
-                    countries.add(ent.text.strip())
-
-        logger.debug("countries_extracted", count=len(countries), countries=list(countries))
+        if is_debug_enabled():
+            logger.debug("countries_extracted", count=len(countries), countries=list(countries))
 
     except Exception as e:
         logger.error("countries_extraction_failed", error=str(e))
@@ -188,11 +280,12 @@ def extract_countries(text: str) -> Set[str]:
     return countries
 
 
-def extract_misc_entities(text: str) -> Set[str]:
+def extract_misc_entities(text: str, text_lower: Optional[str] = None) -> Set[str]:
     """Extract miscellaneous entities (events, dates, etc.).
 
     Args:
         text: Input text
+        text_lower: text.lower(), if the caller already computed it
 
     Returns:
         Set of misc entities
@@ -201,29 +294,10 @@ def extract_misc_entities(text: str) -> Set[str]:
 
     try:
         nlp = get_nlp()
-        doc = nlp(text)
-
-        for ent in doc.ents:
-            if ent.label_ in ["EVENT", "PRODUCT", "WORK_OF_ART"]:
-                misc.add(ent.text.strip())
-
-        # Extract specific events
-        event_patterns = [
-            r'\b(super bowl)\b',
-            r'\b(world cup)\b',
-            r'\b(olympics)\b',
-            r'\b(election)\b',
-            r'\b(q[1-4])\b',
-            r'\b(quarter [1-4])\b',
-        ]
-
-        text_lower = text.lower()
-        for pattern in event_patterns:
-            matches = re.findall(pattern, text_lower)
-            for match in matches:
-                misc.add(match.title())
+        misc = _misc_from_doc(nlp(text), text.lower() if text_lower is None else text_lower)
 
-        logger.debug("misc_entities_extracted", count=len(misc), entities=list(misc))
+        if is_debug_enabled():
+            logger.debug("misc_entities_extracted", count=len(misc), entities=list(misc))
 
     except Exception as e:
         logger.error("misc_extraction_failed", error=str(e))
@@ -231,6 +305,89 @@ def extract_misc_entities(text: str) -> Set[str]:
     return misc
 
 
+# Entity types in the order of the tuples built by _entities_from_doc
+_ENTITY_TYPES = ("tickers", "people", "organizations", "countries", "misc")
+
+
+def _entities_from_doc(text: str, doc) -> Tuple[Tuple[str, ...], ...]:
+    """Extract all entity types for a text from its parsed spaCy Doc.
+
+    Args:
+        text: Input text
+        doc: spaCy Doc for text, or None if NER is unavailable
+
+    Returns:
+        Tuple of entity tuples, ordered as _ENTITY_TYPES
+    """
+    text_lower = text.lower()
+    organizations = _known_organizations(text_lower)
+    countries = _known_countries(text_lower)
+    people: Set[str] = set()
+    misc: Set[str] = set()
+
+    if doc is not None:
+        people = _people_from_doc(doc)
+        organizations |= _organizations_from_doc(doc)
+        countries |= _countries_from_doc(doc)
+        misc = _misc_from_doc(doc, text_lower)
+
+    return (
+        tuple(extract_tickers(text, text_lower)),
+        tuple(people),
+        tuple(organizations),
+        tuple(countries),
+        tuple(misc),
+    )
+
+
+def _as_entity_dict(extracted: Tuple[Tuple[str, ...], ...]) -> Dict[str, List[str]]:
+    """Turn _ENTITY_TYPES-ordered entity tuples into fresh entity lists."""
+    return {entity_type: list(values) for entity_type, values in zip(_ENTITY_TYPES, extracted)}
+
+
+def _extract_from_doc(text: str, doc) -> Tuple[Tuple[str, ...], ...]:
+    """Extract all entities from text and its parsed Doc, and log the totals.
+
+    Args:
+        text: Input text (title + description)
+        doc: spaCy Doc for the text, or None to use the known-term lists only
+
+    Returns:
+        Tuple of entity tuples, ordered as _ENTITY_TYPES
+    """
+    extracted = _entities_from_doc(text, doc)
+
+    logger.info(
+        "extract_entities_complete",
+        total=sum(len(v) for v in extracted),
+        breakdown={k: len(v) for k, v in zip(_ENTITY_TYPES, extracted)},
+    )
+
+    return extracted
+
+
+@lru_cache(maxsize=8192)
+def _extract_entities_cached(text: str) -> Tuple[Tuple[str, ...], ...]:
+    """Extract all entities from text, memoized by text.
+
+    The text is parsed by spaCy once and the Doc shared by every entity
+    type. Titles and descriptions repeat across polling snapshots of the
+    same market, so repeats skip spaCy entirely. Results are tuples so
+    cached values can't be mutated by callers. A spaCy failure raises out
+    of here, so only successful parses are cached.
+
+    Args:
+        text: Input text (title + description)
+
+    Returns:
+        Tuple of entity tuples, ordered as _ENTITY_TYPES
+    """
+    if is_debug_enabled():
+        logger.debug("extract_entities_start", text_length=len(text))
+
+    return _extract_from_doc(text, get_nlp()(text))
+
+
 def extract_entities(text: str) -> Dict[str, List[str]]:
     """Extract all entities from text.
 
@@ -240,22 +397,56 @@ def extract_entities(text: str) -> Dict[str, List[str]]:
     Returns:
         Dictionary of entity lists by type
     """
-    logger.debug("extract_entities_start", text_length=len(text))
+    try:
+        extracted = _extract_entities_cached(text)
+    except Exception as e:
+        # Not cached: a transient NER failure shouldn't stick to this text
+        logger.error("entity_ner_failed", error=str(e))
+        extracted = _extract_from_doc(text, None)
+
+    return _as_entity_dict(extracted)
+
+
+def clear_entity_cache() -> None:
+    """Drop all memoized entity extraction results."""
+    _extract_entities_cached.cache_clear()
 
-    entities = {
-        "tickers": list(extract_tickers(text)),
-        "people": list(extract_people(text)),
-        "organizations": list(extract_organizations(text)),
-        "countries": list(extract_countries(text)),
-        "misc": list(extract_misc_entities(text)),
-    }
 
-    total_entities = sum(len(v) for v in entities.values())
+def extract_entities_batch(texts: List[str]) -> List[Dict[str, List[str]]]:
+    """Extract entities from many texts with one batched spaCy pass.
+
+    Each text is parsed once via nlp.pipe and the Doc is shared by all
+    entity types, instead of one nlp() call per type per text. Texts are
+    fed longest first so each batch pads to similar lengths.
+
+    Args:
+        texts: Input texts (title + description each)
+
+    Returns:
+        Entity dictionaries, one per input text, in input order
+    """
+    if not texts:
+        return []
+
+    settings = get_settings()
+
+    try:
+        nlp = get_nlp()
+        order = sorted(range(len(texts)), key=lambda i: len(texts[i]), reverse=True)
+        docs = [None] * len(texts)
+        parsed = nlp.pipe((texts[i] for i in order), batch_size=settings.spacy_batch_size)
+        for i, doc in zip(order, parsed):
+            docs[i] = doc
+    except Exception as e:
+        logger.error("entity_batch_extraction_failed", count=len(texts), error=str(e))
+        docs = [None] * len(texts)
+
+    results = [_as_entity_dict(_entities_from_doc(text, doc)) for text, doc in zip(texts, docs)]
 
     logger.info(
-        "extract_entities_complete",
-        total=total_entities,
-        breakdown={k: len(v) for k, v in entities.items()},
+        "extract_entities_batch_complete",
+        count=len(texts),
+        total=sum(len(v) for entities in results for v in entities.values()),
     )
 
-    return entities
+    return results
@@ -1,8 +1,24 @@
 """Event type and geo scope classification."""
 
-from typing import Dict, List, Optional
+from functools import lru_cache
+from typing import Dict, List, Optional, Set, Tuple
+import re
 import structlog
 
+from src.utils.log_level import is_debug_enabled
+
+# Optional: pyahocorasick finds every rule keyword in a title in one pass.
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+# Optional: google-re2 runs the geo scope alternations as a true DFA.
+try:
+    import re2 as _re
+except ImportError:
+    _re = re
+
 logger = structlog.get_logger()
 
 
@@ -172,98 +188,312 @@ EVENT_TYPE_RULES = {
 }
 
 
-def classify_event_type(category: str, entities: Dict[str, List[str]], title: str) -> str:
-    """Classify event type based on category, entities, and title with exclusion logic.
+def _freeze_rules(rules: Dict[str, Dict]) -> None:
+    """Turn each rule's term lists into tuples, in place.
+
+    The rules are read-only after import; tuples make that explicit and
+    let the keyword index and scoring tables share the same strings.
 
     Args:
-        category: Market category
-        entities: Extracted entities dictionary
-        title: Clean market title
+        rules: Event type rules, as in EVENT_TYPE_RULES
+    """
+    for rule in rules.values():
+        for field in ("keywords", "exclusions", "categories", "entities"):
+            if field in rule:
+                rule[field] = tuple(rule[field])
+
+
+_freeze_rules(EVENT_TYPE_RULES)
+
+
+def _build_keyword_index(rules: Dict[str, Dict]) -> Dict[str, List[Tuple[str, bool]]]:
+    """Index rule keywords and exclusions by the event types that use them.
+
+    Args:
+        rules: Event type rules, as in EVENT_TYPE_RULES
 
     Returns:
-        Event type string
+        Map of keyword to (event_type, is_exclusion) pairs
     """
-    title_lower = title.lower()
-    category_lower = category.lower()
+    index: Dict[str, List[Tuple[str, bool]]] = {}
+    for event_type, rule in rules.items():
+        for keyword in rule.get("keywords", []):
+            index.setdefault(keyword, []).append((event_type, False))
+        for exclusion in rule.get("exclusions", []):
+            index.setdefault(exclusion, []).append((event_type, True))
+    return index
+
+
+_KEYWORD_INDEX = _build_keyword_index(EVENT_TYPE_RULES)
+
+# Per-type scoring inputs, normalized once: (event_type, categories, entity_types, boost)
+_RULES: Tuple[Tuple[str, frozenset, Tuple[str, ...], int], ...] = tuple(
+    (
+        event_type,
+        frozenset(rules.get("categories", [])),
+        tuple(rules.get("entities", [])),
+        rules.get("boost", 1),
+    )
+    for event_type, rules in EVENT_TYPE_RULES.items()
+)
 
-    # Score each event type
-    scores = {}
-
-    for event_type, rules in EVENT_TYPE_RULES.items():
-        score = 0
-
-        # FIRST: Check exclusions - if any exclusion keyword present, set score to -1000
-        exclusions = rules.get("exclusions", [])
-        if exclusions:
-            has_exclusion = any(excl in title_lower for excl in exclusions)
-            if has_exclusion:
-                scores[event_type] = -1000
-                logger.debug(
-                    "event_type_excluded",
-                    event_type=event_type,
-                    exclusion_detected=True,
-                    title_preview=title[:50],
-                )
-                continue  # Skip to next event type
-
-        # Check category match
-        if category_lower in rules.get("categories", []):
-            score += 3
-
-        # Check keyword match
-        keywords = rules.get("keywords", [])
-        keyword_matches = sum(1 for keyword in keywords if keyword in title_lower)
-        score += keyword_matches * 2
-
-        # Check entity type match
-        required_entity_types = rules.get("entities", [])
-        for entity_type in required_entity_types:
-            if entities.get(entity_type):
-                score += 1
-
-        # Apply boost multiplier if specified
-        boost = rules.get("boost", 1)
-        score = score * boost
-
-        scores[event_type] = score
-
-    # Get highest scoring event type (excluding negative scores from exclusions)
-    valid_scores = {k: v for k, v in scores.items() if v > 0}
-
-    if valid_scores:
-        best_event_type = max(valid_scores, key=valid_scores.get)
-        best_score = valid_scores[best_event_type]
 
-        logger.debug(
-            "event_type_classified",
-            event_type=best_event_type,
-            score=best_score,
-            title_preview=title[:50],
+def _build_score_tables(keyword_index: Dict[str, List[Tuple[str, bool]]]):
+    """Precompute each scoring signal's boosted contribution per event type.
+
+    A type's score is (3 * category match + 2 * keyword hits + entity
+    matches) * boost, which distributes over its terms. Every keyword,
+    category and entity type therefore maps straight to the
+    (type index, points) pairs it adds, with the boost already applied.
+
+    Args:
+        keyword_index: Output of _build_keyword_index
+
+    Returns:
+        Tuple of (keyword points, exclusion type indexes, category points,
+        entity points) lookup tables
+    """
+    type_ids = {event_type: i for i, (event_type, _, _, _) in enumerate(_RULES)}
+
+    keyword_points: Dict[str, Tuple[Tuple[int, int], ...]] = {}
+    exclusion_types: Dict[str, Tuple[int, ...]] = {}
+    for term, uses in keyword_index.items():
+        points = tuple(
+            (type_ids[event_type], 2 * _RULES[type_ids[event_type]][3])
+            for event_type, is_exclusion in uses
+            if not is_exclusion
         )
-        return best_event_type
+        excludes = tuple(type_ids[event_type] for event_type, is_exclusion in uses if is_exclusion)
+        if points:
+            keyword_points[term] = points
+        if excludes:
+            exclusion_types[term] = excludes
+
+    category_points: Dict[str, List[Tuple[int, int]]] = {}
+    entity_points: Dict[str, List[Tuple[int, int]]] = {}
+    for i, (_, categories, entity_types, boost) in enumerate(_RULES):
+        for category in categories:
+            category_points.setdefault(category, []).append((i, 3 * boost))
+        for entity_type in entity_types:
+            entity_points.setdefault(entity_type, []).append((i, boost))
+
+    return keyword_points, exclusion_types, category_points, entity_points
+
+
+_KEYWORD_POINTS, _EXCLUSION_TYPES, _CATEGORY_POINTS, _ENTITY_POINTS = _build_score_tables(_KEYWORD_INDEX)
+
+
+# Runs of letters/digits; a keyword's first run is its "gate"
+_WORD_RE = re.compile(r'[a-z0-9]+')
+
+
+def _build_keyword_gates(keywords) -> Tuple[Dict[str, List[str]], Tuple[str, ...]]:
+    """Group keywords by their first alphanumeric run.
+
+    A keyword can only occur in a title if that run occurs inside a single
+    word of the title, so looking gates up per word narrows the substring
+    tests down to a few candidates.
+
+    Args:
+        keywords: Keywords to match as substrings
+
+    Returns:
+        Tuple of (keywords by gate, keywords with no alphanumeric run)
+    """
+    by_gate: Dict[str, List[str]] = {}
+    ungated = []
+    for keyword in keywords:
+        match = _WORD_RE.search(keyword)
+        if match is None:
+            ungated.append(keyword)
+        else:
+            by_gate.setdefault(match.group(), []).append(keyword)
+    return by_gate, tuple(ungated)
+
+
+def _build_keyword_automaton(keywords):
+    """Build an Aho-Corasick automaton over the keywords, if available.
+
+    Args:
+        keywords: Keywords to match as substrings
+
+    Returns:
+        Automaton whose values are the keywords, or None without pyahocorasick
+    """
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for keyword in keywords:
+        automaton.add_word(keyword, keyword)
+    automaton.make_automaton()
+    return automaton
+
+
+class _KeywordMatcher:
+    """Find which of a fixed set of keywords occur in a text, in one scan.
+
+    Keywords match as substrings, overlapping ones included, so the result
+    is the same as testing `keyword in text_lower` for each keyword. Uses
+    an Aho-Corasick automaton when pyahocorasick is installed, otherwise
+    per-word gate lookups.
+    """
+
+    def __init__(self, keywords):
+        """Index the keywords for matching.
+
+        Args:
+            keywords: Keywords to match as substrings
+        """
+        keywords = list(keywords)
+        self.automaton = _build_keyword_automaton(keywords)
+        self.by_gate, self.ungated = _build_keyword_gates(keywords)
+        gates = frozenset(self.by_gate)
+
+        @lru_cache(maxsize=65536)
+        def gates_in_word(word: str) -> frozenset:
+            """Return the keyword gates occurring in one word (memoized per word)."""
+            return frozenset(gate for gate in gates if gate in word)
+
+        self.gates_in_word = gates_in_word
+
+    def match(self, text_lower: str) -> Set[str]:
+        """Find every keyword occurring in a text.
+
+        Args:
+            text_lower: Lowercased text
+
+        Returns:
+            Set of keywords present in the text
+        """
+        if self.automaton is not None:
+            return {keyword for _, keyword in self.automaton.iter(text_lower)}
+
+        gates: Set[str] = set()
+        for word in set(_WORD_RE.findall(text_lower)):
+            gates |= self.gates_in_word(word)
+
+        # A keyword equal to its gate is already known to be present; anything
+        # longer (phrases, punctuation) still needs one substring test
+        matched = {
+            keyword
+            for gate in gates
+            for keyword in self.by_gate[gate]
+            if keyword == gate or keyword in text_lower
+        }
+        matched.update(keyword for keyword in self.ungated if keyword in text_lower)
+        return matched
+
+
+_EVENT_KEYWORDS = _KeywordMatcher(_KEYWORD_INDEX)
+
+
+def _match_keywords(title_lower: str) -> frozenset:
+    """Find every rule keyword or exclusion occurring in a title.
+
+    Args:
+        title_lower: Lowercased market title
+
+    Returns:
+        Set of keywords present in the title
+    """
+    return frozenset(_EVENT_KEYWORDS.match(title_lower))
+
+
+@lru_cache(maxsize=16384)
+def _classify_cached(
+    category_lower: str, keywords: frozenset, entity_types: Tuple[str, ...]
+) -> Tuple[str, int]:
+    """Classify an event type from normalized inputs, memoized.
+
+    Only which keywords and entity types are present affects the score,
+    not the title text or entity names, so repeats hit across markets.
+
+    Args:
+        category_lower: Lowercased market category
+        keywords: Rule keywords and exclusions found in the title
+        entity_types: Entity types with at least one entity, in _ENTITY_POINTS order
+
+    Returns:
+        Tuple of (event type, winning score)
+    """
+    # Accumulate every event type's boosted score from the precomputed tables
+    scores = [0] * len(_RULES)
+    excluded: Set[int] = set()
+
+    for term in keywords:
+        for index, points in _KEYWORD_POINTS.get(term, ()):
+            scores[index] += points
+        excluded.update(_EXCLUSION_TYPES.get(term, ()))
+
+    for index, points in _CATEGORY_POINTS.get(category_lower, ()):
+        scores[index] += points
+
+    for entity_type in entity_types:
+        for index, points in _ENTITY_POINTS[entity_type]:
+            scores[index] += points
+
+    debug_enabled = is_debug_enabled()
+
+    # Excluded types can't be selected; logged on cache misses only
+    for index in excluded:
+        scores[index] = -1000
+        if debug_enabled:
+            logger.debug(
+                "event_type_excluded",
+                event_type=_RULES[index][0],
+                exclusion_detected=True,
+            )
+
+    # max() returns the first maximum, so ties go to the earliest type
+    best_index = max(range(len(scores)), key=scores.__getitem__)
+    best_score = scores[best_index]
+
+    if best_score > 0:
+        return _RULES[best_index][0], best_score
 
     # Default
-    logger.debug(
-        "event_type_classified_default",
-        category=category,
-        title_preview=title[:50],
-    )
-    return "general"
+    return "general", best_score
 
 
-def classify_sport_type(title: str) -> Optional[str]:
-    """Detect specific sport type (NFL, NHL, NBA, MLB, etc.).
+def classify_event_type(
+    category: str,
+    entities: Dict[str, List[str]],
+    title: str,
+    title_lower: Optional[str] = None,
+    keywords: Optional[frozenset] = None,
+) -> str:
+    """Classify event type based on category, entities, and title with exclusion logic.
 
     Args:
+        category: Market category
+        entities: Extracted entities dictionary
         title: Clean market title
+        title_lower: title.lower(), if the caller already computed it
+        keywords: Rule keywords found in the title, if the caller already scanned it
 
     Returns:
-        Sport type string or None if not sports
+        Event type string
     """
-    title_lower = title.lower()
+    if keywords is None:
+        keywords = _match_keywords(title.lower() if title_lower is None else title_lower)
+    entity_types = tuple(entity_type for entity_type in _ENTITY_POINTS if entities.get(entity_type))
+    category_lower = category.lower()
+    event_type, score = _classify_cached(category_lower, keywords, entity_types)
 
-    # NFL markers (most distinctive first)
-    nfl_markers = [
+    # Logged here rather than in _classify_cached so cache hits log too
+    if is_debug_enabled():
+        logger.debug(
+            "event_type_classified",
+            event_type=event_type,
+            score=score,
+            category=category_lower,
+        )
+    return event_type
+
+
+# Sport markers, in tie-break order (most distinctive first within each sport)
+_SPORT_MARKERS: Dict[str, Tuple[str, ...]] = {
+    "NFL": (
         # NFL-specific terms
         "nfl", "super bowl", "quarterback", "qb", "running back", "wide receiver",
         "tight end", "yards", "touchdowns", "passing yards", "rushing yards",
@@ -273,25 +503,21 @@ def classify_sport_type(title: str) -> Optional[str]:
         "steelers", "texans", "colts", "jaguars", "titans", "broncos", "chiefs",
         "raiders", "chargers", "cowboys", "giants", "eagles", "commanders",
         "bears", "lions", "packers", "vikings", "falcons", "panthers", "saints",
-        "buccaneers", "cardinals", "rams", "49ers", "seahawks"
-    ]
-
-    # NHL markers
-    nhl_markers = [
+        "buccaneers", "cardinals", "rams", "49ers", "seahawks",
+    ),
+    "NHL": (
         # NHL-specific terms
         "nhl", "stanley cup", "hockey", "puck", "goalie", "hat trick",
         "power play", "shootout", "overtime goal", "ice hockey",
-        # NHL teams (distinctive names that won't overlap with NFL)
+        # NHL teams
         "avalanche", "flames", "oilers", "canucks", "maple leafs", "senators",
         "canadiens", "bruins", "sabres", "red wings", "blackhawks", "blues",
         "predators", "jets", "wild", "penguins", "capitals", "blue jackets",
         "hurricanes", "devils", "islanders", "rangers", "flyers", "sharks",
         "ducks", "kings", "golden knights", "coyotes", "kraken", "lightning",
-        "panthers"
-    ]
-
-    # NBA markers
-    nba_markers = [
+        "panthers",
+    ),
+    "NBA": (
         # NBA-specific terms
         "nba", "basketball", "three-pointer", "free throw", "rebounds",
         "assists", "blocks", "steals", "dunks", "playoff series",
@@ -300,39 +526,75 @@ def classify_sport_type(title: str) -> Optional[str]:
         "pistons", "pacers", "bucks", "hawks", "hornets", "heat", "magic",
         "wizards", "nuggets", "timberwolves", "thunder", "trail blazers", "jazz",
         "warriors", "clippers", "lakers", "suns", "kings", "mavericks", "rockets",
-        "grizzlies", "pelicans", "spurs"
-    ]
-
-    # MLB markers
-    mlb_markers = [
+        "grizzlies", "pelicans", "spurs",
+    ),
+    "MLB": (
         # MLB-specific terms
         "mlb", "baseball", "home run", "strikeout", "innings", "pitcher",
         "batting average", "rbi", "world series", "playoff game",
-        # MLB teams (distinctive names)
+        # MLB teams
         "yankees", "red sox", "orioles", "rays", "blue jays", "white sox",
         "guardians", "tigers", "royals", "twins", "astros", "angels", "athletics",
         "mariners", "mets", "phillies", "braves", "marlins", "nationals", "cubs",
         "brewers", "pirates", "reds", "rockies", "dodgers", "padres", "giants",
-        "diamondbacks", "rangers"
-    ]
-
-    # Count markers for each sport
-    nfl_count = sum(1 for marker in nfl_markers if marker in title_lower)
-    nhl_count = sum(1 for marker in nhl_markers if marker in title_lower)
-    nba_count = sum(1 for marker in nba_markers if marker in title_lower)
-    mlb_count = sum(1 for marker in mlb_markers if marker in title_lower)
-
-    # Return sport with most markers
-    counts = {
-        "NFL": nfl_count,
-        "NHL": nhl_count,
-        "NBA": nba_count,
-        "MLB": mlb_count,
+        "diamondbacks", "rangers",
+    ),
+}
+
+
+def _build_sport_index(markers_by_sport: Dict[str, Tuple[str, ...]]) -> Dict[str, str]:
+    """Map each marker to the one sport it identifies.
+
+    Team names shared between leagues (jets, giants, kings, rangers,
+    panthers) say nothing about which sport a title is about, so they are
+    left out rather than counted for every league that uses them.
+
+    Args:
+        markers_by_sport: Marker lists keyed by sport
+
+    Returns:
+        Map of unambiguous marker to sport
+    """
+    sports_by_marker: Dict[str, Set[str]] = {}
+    for sport, markers in markers_by_sport.items():
+        for marker in markers:
+            sports_by_marker.setdefault(marker, set()).add(sport)
+    return {
+        marker: next(iter(sports))
+        for marker, sports in sports_by_marker.items()
+        if len(sports) == 1
     }
 
+
+_SPORT_BY_MARKER = _build_sport_index(_SPORT_MARKERS)
+_SPORT_KEYWORDS = _KeywordMatcher(_SPORT_BY_MARKER)
+
+
+def classify_sport_type(
+    title: str,
+    title_lower: Optional[str] = None,
+    markers: Optional[frozenset] = None,
+) -> Optional[str]:
+    """Detect specific sport type (NFL, NHL, NBA, MLB, etc.).
+
+    Args:
+        title: Clean market title
+        title_lower: title.lower(), if the caller already computed it
+        markers: Sport markers found in the title, if the caller already scanned it
+
+    Returns:
+        Sport type string or None if not sports
+    """
+    if markers is None:
+        markers = _SPORT_KEYWORDS.match(title.lower() if title_lower is None else title_lower)
+
+    counts = dict.fromkeys(_SPORT_MARKERS, 0)
+    for marker in markers:
+        counts[_SPORT_BY_MARKER[marker]] += 1
+
+    # Return sport with most markers, first in declaration order on ties
     max_count = max(counts.values())
     if max_count >= 1:
-        # Get sport with highest count
         for sport, count in counts.items():
             if count == max_count:
                 return sport
@@ -341,82 +603,147 @@ def classify_sport_type(title: str) -> Optional[str]:
     return None
 
 
-def detect_parlay_market(title: str) -> bool:
+# Parlay indicators
+_PARLAY_KEYWORDS = (
+    "parlay", "multi-game", "multigame", "both teams", "all teams",
+    "and", " & ", "combo", "combined", "multiple games",
+)
+
+
+def detect_parlay_market(
+    title: str,
+    title_lower: Optional[str] = None,
+    keywords: Optional[frozenset] = None,
+) -> bool:
     """Detect if market is a parlay (multi-game/multi-outcome market).
 
     Args:
         title: Clean market title
+        title_lower: title.lower(), if the caller already computed it
+        keywords: Parlay keywords found in the title, if the caller already scanned it
 
     Returns:
         True if market appears to be a parlay
     """
-    title_lower = title.lower()
-
-    # Parlay indicators
-    parlay_keywords = [
-        "parlay", "multi-game", "multigame", "both teams", "all teams",
-        "and", " & ", "combo", "combined", "multiple games"
-    ]
+    if title_lower is None:
+        title_lower = title.lower()
 
     # Check for explicit parlay keywords
-    if any(keyword in title_lower for keyword in parlay_keywords):
+    if keywords is not None:
+        if keywords:
+            return True
+    elif any(keyword in title_lower for keyword in _PARLAY_KEYWORDS):
         return True
 
     # Check for multiple team names (indicates multi-game parlay)
-    # Count occurrences of outcome separators (with or without spaces)
-    outcome_separators = title_lower.count(",yes") + title_lower.count(", yes")
-    outcome_separators += title_lower.count(",no") + title_lower.count(", no")
-
+    # Count occurrences of outcome separators (with or without spaces);
+    # folding ", " into "," counts both spellings with one search each
     # If 3+ outcome separators, likely a parlay
     # NOTE: Lowered from 3 to 2 to catch 2-game parlays
-    if outcome_separators >= 2:
-        return True
+    if "," in title_lower:
+        separators = title_lower.replace(", ", ",")
+        outcome_separators = separators.count(",yes")
+        if outcome_separators >= 2:
+            return True
+        if outcome_separators + separators.count(",no") >= 2:
+            return True
 
     # Check for multiple "vs" or "vs." (multiple games)
-    vs_count = title_lower.count(" vs ") + title_lower.count(" vs. ")
-    if vs_count >= 2:
+    vs_count = title_lower.count(" vs ")
+    if vs_count >= 2 or vs_count + title_lower.count(" vs. ") >= 2:
         return True
 
     return False
 
 
-def determine_geo_scope(entities: Dict[str, List[str]], title: str) -> str:
+# Time granularity indicators, checked in order (used by pipeline.infer_granularity)
+_GRANULARITY_WORDS: Tuple[Tuple[str, Tuple[str, ...]], ...] = (
+    ("day", ("daily", "today", "by end of day", "eod")),
+    ("week", ("week", "weekly")),
+    ("month", ("month", "monthly")),
+    ("quarter", ("quarter", "q1", "q2", "q3", "q4", "quarterly")),
+    ("year", ("year", "annual", "yearly", "eoy", "end of year")),
+)
+
+# Negative polarity indicators (used by pipeline.infer_polarity)
+_NEGATIVE_WORDS = ("not", "won't", "will not", "fails to", "doesn't", "does not", "reject")
+
+
+# Geo scope indicators, matched as whole words in the lowercased title
+_US_RE = _re.compile(r'\b(?:us|usa|united states|america|americans?)\b')
+_EU_RE = _re.compile(r'\b(?:eu|europe|europeans?)\b')
+_GLOBAL_RE = _re.compile(r'\b(?:global|world|worldwide|international)\b')
+
+# Substrings every match of the geo regex above contains, so a title
+# scanned without any of them can skip that regex
+_US_SUBSTRINGS = ("us", "america", "united states")
+_EU_SUBSTRINGS = ("eu",)
+_GLOBAL_SUBSTRINGS = ("global", "world", "international")
+_GEO_SUBSTRINGS = _US_SUBSTRINGS + _EU_SUBSTRINGS + _GLOBAL_SUBSTRINGS
+
+# Country entities (lowercased) that mean a US-scoped market
+_US_COUNTRIES = frozenset({"us", "usa", "united states"})
+
+
+def _geo_match(pattern, substrings, title_lower: str, indicators: Optional[frozenset]) -> bool:
+    """Search for a geo indicator, skipping the regex when a scan ruled it out.
+
+    Args:
+        pattern: Compiled whole-word indicator pattern
+        substrings: Substrings every match of the pattern contains
+        title_lower: Lowercased clean market title
+        indicators: _GEO_SUBSTRINGS found in the title, if the caller already scanned it
+
+    Returns:
+        True if the pattern matches the title
+    """
+    if indicators is not None and indicators.isdisjoint(substrings):
+        return False
+    return pattern.search(title_lower) is not None
+
+
+def determine_geo_scope(
+    entities: Dict[str, List[str]],
+    title: str,
+    title_lower: Optional[str] = None,
+    indicators: Optional[frozenset] = None,
+) -> str:
     """Determine geographic scope of market.
 
     Args:
         entities: Extracted entities dictionary
         title: Clean market title
+        title_lower: title.lower(), if the caller already computed it
+        indicators: _GEO_SUBSTRINGS found in the title, if the caller already scanned it
 
     Returns:
         Geo scope ("global", "US", "EU", "specific_country", etc.)
     """
-    title_lower = title.lower()
-    countries = [c.lower() for c in entities.get("countries", [])]
+    if title_lower is None:
+        title_lower = title.lower()
+    countries = frozenset(map(str.lower, entities.get("countries", ())))
 
-    # Check for US-specific
-    us_indicators = ["us", "usa", "united states", "america", "american"]
-    if any(indicator in title_lower for indicator in us_indicators):
+    # Check for US-specific (entity set first, it's the cheaper test)
+    if not countries.isdisjoint(_US_COUNTRIES):
         return "US"
 
-    if any(country in ["us", "usa", "united states"] for country in countries):
+    if _geo_match(_US_RE, _US_SUBSTRINGS, title_lower, indicators):
         return "US"
 
     # Check for EU-specific
-    eu_indicators = ["eu", "europe", "european"]
-    if any(indicator in title_lower for indicator in eu_indicators):
+    if _geo_match(_EU_RE, _EU_SUBSTRINGS, title_lower, indicators):
         return "EU"
 
     # Check for specific country
     if len(countries) == 1:
-        return countries[0].upper()
+        return next(iter(countries)).upper()
 
     # Check for multiple countries or global
     if len(countries) > 1:
         return "multi_country"
 
     # Check for global indicators
-    global_indicators = ["global", "world", "worldwide", "international"]
-    if any(indicator in title_lower for indicator in global_indicators):
+    if _geo_match(_GLOBAL_RE, _GLOBAL_SUBSTRINGS, title_lower, indicators):
         return "global"
 
     # Default to US (most common for prediction markets)
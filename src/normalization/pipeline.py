@@ -1,33 +1,93 @@
 """Complete normalization pipeline for market data."""
 
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 from datetime import datetime
+import re
+import time
 import structlog
 
 from src.normalization.text_cleaner import clean_title, clean_description
-from src.normalization.entity_extractor import extract_entities
-from src.normalization.embedding_generator import generate_market_embedding
-from src.normalization.event_classifier import classify_event_type, determine_geo_scope
+from src.normalization.entity_extractor import extract_entities, extract_entities_batch
+from src.normalization.embedding_generator import (
+    batch_generate_embeddings,
+    generate_market_embedding,
+)
+from src.normalization.event_classifier import (
+    _GRANULARITY_WORDS,
+    classify_event_type,
+    determine_geo_scope,
+)
+from src.normalization._fused_classifier import build_title_features
+from src.utils.log_level import is_debug_enabled
 
 logger = structlog.get_logger()
 
+# Rank of each granularity indicator, in _GRANULARITY_WORDS order
+_GRANULARITY_RANK = {
+    indicator: rank
+    for rank, (_, indicators) in enumerate(_GRANULARITY_WORDS)
+    for indicator in indicators
+}
 
-def normalize_market(raw_market: Dict[str, Any], platform: str) -> Dict[str, Any]:
+# Every granularity indicator in one pattern (plain alternation; named groups
+# would defeat the regex engine's literal prefix scan). Indicators of different
+# granularities only overlap where "year" follows a word ending in "y", and
+# year ranks last, so a non-overlapping scan finds the same best granularity
+# as testing each indicator as a substring.
+_GRANULARITY_RE = re.compile(
+    "|".join(map(re.escape, sorted(_GRANULARITY_RANK, key=len, reverse=True)))
+)
+
+# Negative polarity indicators matched as whole words; "will not" and
+# "does not" are covered by "not". Every one contains a _NEGATIVE_WORDS
+# entry, so a title with no _NEGATIVE_WORDS substring has none of them.
+_NEGATIVE_TOKENS = frozenset({"not", "won't", "doesn't", "reject", "rejects", "rejected"})
+_NEGATIVE_PHRASES = ("fails to",)
+_POLARITY_TOKEN_RE = re.compile(r"[a-z']+")
+
+# Marks a precomputed embedding that wasn't passed in (None means it failed)
+_NOT_GIVEN = object()
+
+# Last normalized_at timestamp as [epoch seconds, ISO string]
+_timestamp_cache = [0.0, ""]
+
+
+def _now_iso() -> str:
+    """Return the current UTC time in ISO format, refreshed at most once per second.
+
+    Markets normalized in the same second share one timestamp instead of
+    formatting a new one each.
+
+    Returns:
+        ISO 8601 UTC timestamp
+    """
+    now = time.time()
+    if now - _timestamp_cache[0] >= 1.0:
+        _timestamp_cache[0] = now
+        _timestamp_cache[1] = datetime.utcfromtimestamp(now).isoformat()
+    return _timestamp_cache[1]
+
+
+def normalize_market(
+    raw_market: Dict[str, Any],
+    platform: str,
+    *,
+    entities: Optional[Dict[str, List[str]]] = None,
+    text_embedding: Any = _NOT_GIVEN,
+) -> Dict[str, Any]:
     """Normalize raw market data to internal schema.
 
     Args:
         raw_market: Raw market data (from API client)
         platform: Platform name ("kalshi" or "polymarket")
+        entities: Entities already extracted for this market, if batched
+        text_embedding: Embedding already generated for this market, if batched
 
     Returns:
         Fully normalized market data ready for database
     """
-    logger.info(
-        "normalize_market_start",
-        platform=platform,
-        market_id=raw_market.get("id"),
-    )
-
+    # One INFO line per market: normalize_market_complete carries the id,
+    # and normalize_market_failed reports it if a step raises
     try:
         # Step 1: Extract raw fields
         market_id = raw_market.get("id")
@@ -44,49 +104,62 @@ def normalize_market(raw_market: Dict[str, Any], platform: str) -> Dict[str, Any
         clean_title_text = clean_title(raw_title)
         clean_description_text = clean_description(raw_description)
 
-        logger.debug(
-            "normalize_market_text_cleaned",
-            market_id=market_id,
-            title_length=len(clean_title_text),
-            desc_length=len(clean_description_text),
-        )
+        # Lowercase and scan the title once; every classifier reads from this
+        features = build_title_features(clean_title_text)
+
+        # Per-step logging is debug-only; skip building its fields otherwise
+        debug_enabled = is_debug_enabled()
+        if debug_enabled:
+            logger.debug(
+                "normalize_market_text_cleaned",
+                market_id=market_id,
+                title_length=len(clean_title_text),
+                desc_length=len(clean_description_text),
+            )
 
         # Step 3: Extract entities
-        combined_text = f"{raw_title} {raw_description}"
-        entities = extract_entities(combined_text)
+        if entities is None:
+            entities = extract_entities(f"{raw_title} {raw_description}")
 
-        logger.debug(
-            "normalize_market_entities_extracted",
-            market_id=market_id,
-            total_entities=sum(len(v) for v in entities.values()),
-        )
+        if debug_enabled:
+            logger.debug(
+                "normalize_market_entities_extracted",
+                market_id=market_id,
+                total_entities=sum(len(v) for v in entities.values()),
+            )
 
         # Step 4: Generate embedding
-        text_embedding = generate_market_embedding(clean_title_text, clean_description_text)
+        if text_embedding is _NOT_GIVEN:
+            text_embedding = generate_market_embedding(clean_title_text, clean_description_text)
 
-        if text_embedding:
+        if text_embedding is None:
+            logger.warning(
+                "normalize_market_embedding_failed",
+                market_id=market_id,
+            )
+        elif debug_enabled:
             logger.debug(
                 "normalize_market_embedding_generated",
                 market_id=market_id,
                 embedding_dims=len(text_embedding),
             )
-        else:
-            logger.warning(
-                "normalize_market_embedding_failed",
-                market_id=market_id,
-            )
 
         # Step 5: Classify event type
-        event_type = classify_event_type(category, entities, clean_title_text)
-
-        logger.debug(
-            "normalize_market_event_classified",
-            market_id=market_id,
-            event_type=event_type,
+        event_type = classify_event_type(
+            category, entities, clean_title_text, features.lower, keywords=features.event,
         )
 
+        if debug_enabled:
+            logger.debug(
+                "normalize_market_event_classified",
+                market_id=market_id,
+                event_type=event_type,
+            )
+
         # Step 6: Determine geo scope
-        geo_scope = determine_geo_scope(entities, clean_title_text)
+        geo_scope = determine_geo_scope(
+            entities, clean_title_text, features.lower, indicators=features.geo,
+        )
 
         # Step 7: Build normalized schema
         normalized = {
@@ -104,19 +177,21 @@ def normalize_market(raw_market: Dict[str, Any], platform: str) -> Dict[str, Any
             "geo_scope": geo_scope,
             "time_window": {
                 "resolution_date": resolution_date,
-                "granularity": infer_granularity(clean_title_text, resolution_date),
+                "granularity": infer_granularity(
+                    clean_title_text, resolution_date, features.lower, words=features.granularity,
+                ),
             },
             "resolution_source": resolution_source,
             "outcome_schema": {
                 "type": outcome_type,
-                "polarity": infer_polarity(clean_title_text),
+                "polarity": infer_polarity(clean_title_text, features.lower, words=features.polarity),
                 "outcomes": outcomes,
             },
             "text_embedding": text_embedding,
             "metadata": {
                 **metadata,
                 "ingestion_version": "v1.0.0",
-                "normalized_at": datetime.utcnow().isoformat(),
+                "normalized_at": _now_iso(),
             },
         }
 
@@ -140,55 +215,106 @@ def normalize_market(raw_market: Dict[str, Any], platform: str) -> Dict[str, Any
         raise
 
 
-def infer_granularity(title: str, resolution_date: Optional[str]) -> str:
+def normalize_markets(raw_markets: List[Dict[str, Any]], platform: str) -> List[Dict[str, Any]]:
+    """Normalize a batch of raw markets to internal schema.
+
+    Entity extraction and embedding generation, the expensive steps, run
+    once over the whole batch (one spaCy pipe, one model encode) instead
+    of once per market; the rest is the per-market normalize_market path.
+
+    Args:
+        raw_markets: Raw market data (from API client)
+        platform: Platform name ("kalshi" or "polymarket")
+
+    Returns:
+        Normalized market data, in input order
+    """
+    if len(raw_markets) <= 1:
+        return [normalize_market(raw_market, platform) for raw_market in raw_markets]
+
+    logger.info("normalize_markets_start", platform=platform, count=len(raw_markets))
+
+    raw_texts = []
+    embedding_texts = []
+    for raw_market in raw_markets:
+        raw_title = raw_market.get("title", "")
+        raw_description = raw_market.get("description", "")
+        raw_texts.append(f"{raw_title} {raw_description}")
+        # Same text generate_market_embedding builds, so the cache is shared
+        embedding_texts.append(f"{clean_title(raw_title)} | {clean_description(raw_description)}")
+
+    entities_batch = extract_entities_batch(raw_texts)
+    embeddings = batch_generate_embeddings(embedding_texts)
+
+    return [
+        normalize_market(raw_market, platform, entities=entities, text_embedding=embedding)
+        for raw_market, entities, embedding in zip(raw_markets, entities_batch, embeddings)
+    ]
+
+
+def infer_granularity(
+    title: str,
+    resolution_date: Optional[str],
+    title_lower: Optional[str] = None,
+    words: Optional[frozenset] = None,
+) -> str:
     """Infer time granularity from title and resolution date.
 
     Args:
         title: Market title
         resolution_date: Resolution date string
+        title_lower: title.lower(), if the caller already computed it
+        words: Granularity words found in the title, if the caller already scanned it
 
     Returns:
         Granularity ("day", "week", "month", "quarter", "year")
     """
-    title_lower = title.lower()
-
-    # Check for explicit granularity indicators
-    if any(word in title_lower for word in ["daily", "today", "by end of day", "eod"]):
-        return "day"
-
-    if any(word in title_lower for word in ["week", "weekly"]):
+    # Check for explicit granularity indicators, in _GRANULARITY_WORDS order
+    if words is not None:
+        for granularity, indicators in _GRANULARITY_WORDS:
+            if not words.isdisjoint(indicators):
+                return granularity
         return "week"
 
-    if any(word in title_lower for word in ["month", "monthly"]):
-        return "month"
-
-    if any(word in title_lower for word in ["quarter", "q1", "q2", "q3", "q4", "quarterly"]):
-        return "quarter"
+    if title_lower is None:
+        title_lower = title.lower()
 
-    if any(word in title_lower for word in ["year", "annual", "yearly", "eoy", "end of year"]):
-        return "year"
+    found = _GRANULARITY_RE.findall(title_lower)
+    if found:
+        return _GRANULARITY_WORDS[min(map(_GRANULARITY_RANK.__getitem__, found))][0]
 
     # Default to week
     return "week"
 
 
-def infer_polarity(title: str) -> str:
+def infer_polarity(
+    title: str,
+    title_lower: Optional[str] = None,
+    words: Optional[frozenset] = None,
+) -> str:
     """Infer polarity for yes/no markets.
 
     Args:
         title: Market title
+        title_lower: title.lower(), if the caller already computed it
+        words: _NEGATIVE_WORDS substrings found in the title, if the caller already scanned it
 
     Returns:
         Polarity ("positive" or "negative")
     """
-    title_lower = title.lower()
+    # Most titles contain no negative indicator even as a substring
+    if words is not None and not words:
+        return "positive"
+
+    if title_lower is None:
+        title_lower = title.lower()
 
-    # Check for negative indicators
-    negative_words = ["not", "won't", "will not", "fails to", "doesn't", "does not", "reject"]
+    # Check for negative indicators as whole words ("not", but not "notable")
+    if not _NEGATIVE_TOKENS.isdisjoint(_POLARITY_TOKEN_RE.findall(title_lower)):
+        return "negative"
 
-    for word in negative_words:
-        if word in title_lower:
-            return "negative"
+    if any(phrase in title_lower for phrase in _NEGATIVE_PHRASES):
+        return "negative"
 
     # Default to positive
     return "positive"
@@ -1,10 +1,13 @@
 """Text cleaning and normalization utilities."""
 
 import re
+from functools import lru_cache
 from typing import Optional, Set
 import structlog
 from difflib import SequenceMatcher
 
+from src.utils.log_level import is_debug_enabled
+
 logger = structlog.get_logger()
 
 
@@ -28,6 +31,38 @@ ABBREVIATIONS = {
     "nasdaq": "nasdaq",
 }
 
+# Patterns compiled once at import
+_HTML_TAG_RE = re.compile(r'<[^>]+>')
+_WHITESPACE_RE = re.compile(r'\s+')
+_WORD_RE = re.compile(r'\b\w+\b')
+
+# Common stopwords dropped by extract_key_terms
+_STOPWORDS = frozenset({
+    "the", "a", "an", "and", "or", "but", "in", "on", "at", "to", "for",
+    "of", "with", "by", "from", "as", "is", "was", "are", "were", "be",
+    "been", "being", "have", "has", "had", "do", "does", "did", "will",
+    "would", "should", "could", "may", "might", "must", "can", "this",
+    "that", "these", "those", "what", "which", "who", "when", "where",
+    "why", "how", "end",
+})
+
+# Prefixes are stripped in this order, each at most once (e.g. "Kalshi: Will ...")
+_PLATFORM_PREFIX_RE = re.compile(
+    r'^(?:kalshi:\s*)?(?:polymarket:\s*)?(?:will\s+)?(?:does\s+)?'
+    r'(?:is\s+)?(?:what\s+)?(?:who\s+)?(?:when\s+)?',
+    re.IGNORECASE,
+)
+
+# No expansion contains another abbreviation, so one pass expands them all
+_ABBREVIATION_RE = re.compile(
+    r'\b(?:' + '|'.join(re.escape(abbr) for abbr in sorted(ABBREVIATIONS, key=len, reverse=True)) + r')\b'
+)
+
+
+def _expand_match(match: "re.Match[str]") -> str:
+    """Replacement callback for _ABBREVIATION_RE."""
+    return ABBREVIATIONS[match.group(0)]
+
 
 def strip_html(text: str) -> str:
     """Remove HTML tags from text.
@@ -42,7 +77,7 @@ def strip_html(text: str) -> str:
         return ""
 
     # Remove HTML tags
-    clean = re.sub(r'<[^>]+>', '', text)
+    clean = _HTML_TAG_RE.sub('', text)
 
     return clean
 
@@ -60,7 +95,7 @@ def normalize_whitespace(text: str) -> str:
         return ""
 
     # Replace multiple spaces with single space
-    clean = re.sub(r'\s+', ' ', text)
+    clean = _WHITESPACE_RE.sub(' ', text)
 
     # Strip leading/trailing whitespace
     clean = clean.strip()
@@ -81,22 +116,7 @@ def remove_platform_prefixes(text: str) -> str:
         return ""
 
     # Common prefixes to remove
-    prefixes = [
-        r'^kalshi:\s*',
-        r'^polymarket:\s*',
-        r'^will\s+',
-        r'^does\s+',
-        r'^is\s+',
-        r'^what\s+',
-        r'^who\s+',
-        r'^when\s+',
-    ]
-
-    clean = text
-    for prefix in prefixes:
-        clean = re.sub(prefix, '', clean, flags=re.IGNORECASE)
-
-    return clean
+    return _PLATFORM_PREFIX_RE.sub('', text, count=1)
 
 
 def expand_abbreviations(text: str) -> str:
@@ -114,11 +134,7 @@ def expand_abbreviations(text: str) -> str:
     clean = text.lower()
 
     # Replace abbreviations (word boundaries)
-    for abbr, expansion in ABBREVIATIONS.items():
-        pattern = r'\b' + re.escape(abbr) + r'\b'
-        clean = re.sub(pattern, expansion, clean)
-
-    return clean
+    return _ABBREVIATION_RE.sub(_expand_match, clean)
 
 
 def clean_text(text: Optional[str], expand_abbr: bool = True) -> str:
@@ -154,11 +170,12 @@ def clean_text(text: Optional[str], expand_abbr: bool = True) -> str:
         # Step 6: Final whitespace normalization
         clean = normalize_whitespace(clean)
 
-        logger.debug(
-            "text_cleaned",
-            original_length=len(text),
-            cleaned_length=len(clean),
-        )
+        if is_debug_enabled():
+            logger.debug(
+                "text_cleaned",
+                original_length=len(text),
+                cleaned_length=len(clean),
+            )
 
         return clean
 
@@ -171,6 +188,22 @@ def clean_text(text: Optional[str], expand_abbr: bool = True) -> str:
         return text or ""
 
 
+@lru_cache(maxsize=4096)
+def _clean_text_cached(text: str) -> str:
+    """Clean text with abbreviation expansion, memoized.
+
+    Titles and descriptions repeat a lot across series markets and
+    platform templates, and cleaning is deterministic.
+
+    Args:
+        text: Input text
+
+    Returns:
+        Cleaned text
+    """
+    return clean_text(text, expand_abbr=True)
+
+
 def clean_title(title: str) -> str:
     """Clean market title.
 
@@ -180,7 +213,9 @@ def clean_title(title: str) -> str:
     Returns:
         Cleaned title
     """
-    return clean_text(title, expand_abbr=True)
+    if not title:
+        return ""
+    return _clean_text_cached(str(title))
 
 
 def clean_description(description: str) -> str:
@@ -192,7 +227,14 @@ def clean_description(description: str) -> str:
     Returns:
         Cleaned description
     """
-    return clean_text(description, expand_abbr=True)
+    if not description:
+        return ""
+    return _clean_text_cached(str(description))
+
+
+def clear_text_cache() -> None:
+    """Drop all memoized title/description cleaning results."""
+    _clean_text_cached.cache_clear()
 
 
 def extract_key_terms(text: str, min_length: int = 3) -> Set[str]:
@@ -210,19 +252,9 @@ def extract_key_terms(text: str, min_length: int = 3) -> Set[str]:
     if not text:
         return set()
     
-    # Common stopwords to remove
-    stopwords = {
-        "the", "a", "an", "and", "or", "but", "in", "on", "at", "to", "for",
-        "of", "with", "by", "from", "as", "is", "was", "are", "were", "be",
-        "been", "being", "have", "has", "had", "do", "does", "did", "will",
-        "would", "should", "could", "may", "might", "must", "can", "this",
-        "that", "these", "those", "what", "which", "who", "when", "where",
-        "why", "how", "will", "be", "by", "end", "of", "on", "in", "at",
-    }
-    
     # Tokenize and clean
-    words = re.findall(r'\b\w+\b', text.lower())
-    terms = {w for w in words if len(w) >= min_length and w not in stopwords}
+    words = _WORD_RE.findall(text.lower())
+    terms = {w for w in words if len(w) >= min_length and w not in _STOPWORDS}
     
     return terms
 
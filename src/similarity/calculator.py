@@ -1,11 +1,13 @@
 """Main similarity calculator that aggregates all features."""
 
-from typing import Dict, Any
+from functools import lru_cache
+from typing import Dict, Any, Tuple
 import math
+import numpy as np
 import structlog
 
 from src.models import Market
-from src.config import settings
+from src.config import get_settings
 from src.similarity.features import (
     calculate_text_similarity,
     calculate_entity_similarity,
@@ -16,6 +18,33 @@ from src.similarity.features import (
 
 logger = structlog.get_logger()
 
+@lru_cache(maxsize=1)
+def _feature_weights() -> Tuple[float, ...]:
+    """Feature weights in text, entity, time, outcome, resolution order.
+
+    Settings are frozen, so per-pair weights are bound once on first use
+    instead of going through the Pydantic attribute protocol on every pair.
+    """
+    settings = get_settings()
+    return (
+        settings.weight_text,
+        settings.weight_entity,
+        settings.weight_time,
+        settings.weight_outcome,
+        settings.weight_resolution,
+    )
+
+
+@lru_cache(maxsize=1)
+def _hard_constraint_thresholds() -> Tuple[float, ...]:
+    """Minimum text score, minimum entity score and maximum time delta (days)."""
+    settings = get_settings()
+    return (
+        settings.hard_constraint_min_text_score,
+        settings.hard_constraint_min_entity_score,
+        settings.hard_constraint_max_time_delta_days,
+    )
+
 
 def check_hard_constraints(
     market_k: Market,
@@ -44,6 +73,7 @@ def check_hard_constraints(
     has_exact_match = (bonus_ticker >= 1.0) or (bonus_person >= 1.0)
 
     # Hard constraint checks
+    min_text_score, min_entity_score, max_time_delta_days = _hard_constraint_thresholds()
     violations = []
 
     # 0. Event type mismatch (CRITICAL: don't match sports with politics)
@@ -53,16 +83,16 @@ def check_hard_constraints(
             violations.append(f"event_type_mismatch: {market_k.event_type} != {market_p.event_type}")
 
     # 1. Text similarity too low
-    if score_text < settings.hard_constraint_min_text_score:
-        violations.append(f"text_score={score_text:.3f} < {settings.hard_constraint_min_text_score}")
+    if score_text < min_text_score:
+        violations.append(f"text_score={score_text:.3f} < {min_text_score}")
 
     # 2. Entity disjoint (unless exact match)
-    if score_entity < settings.hard_constraint_min_entity_score and not has_exact_match:
-        violations.append(f"entity_score={score_entity:.3f} < {settings.hard_constraint_min_entity_score} (no exact match)")
+    if score_entity < min_entity_score and not has_exact_match:
+        violations.append(f"entity_score={score_entity:.3f} < {min_entity_score} (no exact match)")
 
     # 3. Time skew too large
-    if delta_days > settings.hard_constraint_max_time_delta_days:
-        violations.append(f"delta_days={delta_days} > {settings.hard_constraint_max_time_delta_days}")
+    if delta_days > max_time_delta_days:
+        violations.append(f"delta_days={delta_days} > {max_time_delta_days}")
 
     # 4. Outcome incompatibility
     if score_outcome == 0.0:
@@ -205,17 +235,31 @@ def calculate_weighted_score(features: Dict[str, Any]) -> float:
     score_resolution = features.get("resolution", {}).get("score_resolution", 0.0)
 
     # Weighted sum
+    w_text, w_entity, w_time, w_outcome, w_resolution = _feature_weights()
     score = (
-        settings.weight_text * score_text +
-        settings.weight_entity * score_entity +
-        settings.weight_time * score_time +
-        settings.weight_outcome * score_outcome +
-        settings.weight_resolution * score_resolution
+        w_text * score_text +
+        w_entity * score_entity +
+        w_time * score_time +
+        w_outcome * score_outcome +
+        w_resolution * score_resolution
     )
 
     return score
 
 
+def calculate_weighted_scores(feature_scores: np.ndarray) -> np.ndarray:
+    """Calculate weighted similarity scores for a batch of pairs.
+
+    Args:
+        feature_scores: (N, 5) array of text, entity, time, outcome and
+            resolution scores, one row per pair
+
+    Returns:
+        (N,) array of weighted scores
+    """
+    return np.asarray(feature_scores, dtype=np.float64) @ get_settings().weights_vector
+
+
 def calculate_match_probability(features: Dict[str, Any]) -> float:
     """Calculate match probability using logistic regression.
 
@@ -1,12 +1,16 @@
 """Tier assignment logic for bonded pairs."""
 
 from typing import Dict, Any, Optional
+import numpy as np
 import structlog
 
-from src.config import settings
+from src.config import get_settings
 
 logger = structlog.get_logger()
 
+# Column order of score matrices passed to assign_tiers
+TIER_SCORE_COLUMNS = ("similarity_score", "p_match", "text", "entity", "outcome", "time", "resolution")
+
 
 def assign_tier(
     p_match: float,
@@ -58,6 +62,8 @@ def assign_tier(
     # This is the weighted average of all features and MUST meet minimum threshold
     similarity_score = similarity_result.get("similarity_score", 0.0) if similarity_result else 0.0
 
+    settings = get_settings()
+
     # Tier 1: Auto Bond (highest confidence)
     # CRITICAL FIX: Added similarity_score check that was previously missing!
     tier1_criteria = [
@@ -165,6 +171,28 @@ def assign_tier(
     return 3
 
 
+def assign_tiers(scores: np.ndarray, hard_constraints_violated: np.ndarray) -> np.ndarray:
+    """Assign tiers to a batch of pairs with vectorized threshold checks.
+
+    Applies the same criteria as assign_tier, without per-pair logging.
+
+    Args:
+        scores: (N, 7) array of scores in TIER_SCORE_COLUMNS order
+        hard_constraints_violated: (N,) boolean array
+
+    Returns:
+        (N,) array of tiers (1, 2, or 3)
+    """
+    scores = np.asarray(scores, dtype=np.float64)
+    eligible = ~np.asarray(hard_constraints_violated, dtype=bool)
+
+    settings = get_settings()
+    tiers = np.full(len(scores), 3, dtype=np.int8)
+    tiers[eligible & (scores >= settings.tier2_thresholds).all(axis=1)] = 2
+    tiers[eligible & (scores >= settings.tier1_thresholds).all(axis=1)] = 1
+    return tiers
+
+
 def get_tier_description(tier: int) -> Dict[str, Any]:
     """Get description and trading parameters for a tier.
 
@@ -9,7 +9,7 @@ from enum import Enum
 import structlog
 import requests
 
-from src.config import settings
+from src.config import get_settings
 
 logger = structlog.get_logger()
 
@@ -35,6 +35,7 @@ class OrderManager:
 
     def __init__(self):
         """Initialize order manager."""
+        settings = get_settings()
         self.kalshi_api_base = settings.kalshi_api_base
         self.kalshi_api_key = settings.kalshi_api_key
         self.polymarket_api_base = settings.polymarket_clob_api_base
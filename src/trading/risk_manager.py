@@ -8,8 +8,6 @@ from datetime import datetime, timedelta
 from dataclasses import dataclass
 import structlog
 
-from src.config import settings
-
 logger = structlog.get_logger()
 
 
@@ -6,7 +6,7 @@ import functools
 import redis
 import structlog
 
-from src.config import settings
+from src.config import get_settings
 
 logger = structlog.get_logger()
 
@@ -20,7 +20,7 @@ class CacheClient:
         Args:
             redis_url: Redis connection URL (default from settings)
         """
-        self.redis_url = redis_url or settings.redis_url
+        self.redis_url = redis_url or get_settings().redis_url
         self._client = None
 
     @property
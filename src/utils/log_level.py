@@ -0,0 +1,22 @@
+"""Log level checks for hot paths."""
+
+import logging
+from functools import lru_cache
+
+from src.config import get_settings
+
+
+@lru_cache(maxsize=1)
+def is_debug_enabled() -> bool:
+    """Return True if the configured LOG_LEVEL lets debug events through.
+
+    Hot paths check this before building the fields of a debug event.
+    The pinned structlog's bound loggers have no is_enabled_for, so the
+    level is read from settings (as src.api.main does when configuring
+    structlog) and cached for the life of the process.
+
+    Returns:
+        Whether debug logging is enabled
+    """
+    level = getattr(logging, get_settings().log_level.upper(), logging.INFO)
+    return level <= logging.DEBUG
@@ -1,17 +1,19 @@
 """Market polling service for automatic ingestion."""
 
 import time
+import threading
 import multiprocessing as mp
 from concurrent.futures import ThreadPoolExecutor, as_completed
-from typing import List, Dict, Any, Tuple
+from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime
 from sqlalchemy.orm import Session
 import structlog
 
-from src.config import settings
+from src.config import get_settings
 from src.models import Market, get_db
 from src.ingestion.kalshi_client import KalshiClient
 from src.ingestion.polymarket_client import PolymarketClient
+from src.normalization import embedding_generator
 from src.normalization.pipeline import normalize_market
 from src.utils.metrics import record_market_ingestion
 
@@ -102,6 +104,80 @@ def process_market_worker(args: Tuple[Dict[str, Any], str]) -> Tuple[bool, str,
         return (False, platform, raw_market.get("id", "unknown"))
 
 
+# Columns refreshed when a market is re-ingested (platform, status and
+# condition_id keep their first-seen values, as in process_market_worker)
+_MARKET_UPDATE_COLUMNS = (
+    "raw_title",
+    "raw_description",
+    "clean_title",
+    "clean_description",
+    "category",
+    "event_type",
+    "entities",
+    "geo_scope",
+    "time_window",
+    "resolution_source",
+    "outcome_schema",
+    "text_embedding",
+    "market_metadata",
+    "updated_at",
+)
+
+
+def normalize_market_worker(
+    args: Tuple[Dict[str, Any], str],
+) -> Tuple[bool, str, str, Optional[Dict[str, Any]]]:
+    """Worker function to normalize a single market into a markets row.
+
+    Only the CPU-bound normalization runs in the worker; the parent writes
+    all rows of a batch with one Market.bulk_upsert.
+
+    Args:
+        args: Tuple of (raw_market, platform)
+
+    Returns:
+        Tuple of (success, platform, market_id, row or None on failure)
+    """
+    raw_market, platform = args
+
+    try:
+        normalized = normalize_market(raw_market, platform)
+        now = datetime.utcnow()
+
+        row = {
+            "id": normalized["id"],
+            "platform": normalized["platform"],
+            "condition_id": normalized["condition_id"],
+            "status": normalized["status"],
+            "raw_title": normalized["raw_title"],
+            "raw_description": normalized["raw_description"],
+            "clean_title": normalized["clean_title"],
+            "clean_description": normalized["clean_description"],
+            "category": normalized["category"],
+            "event_type": normalized["event_type"],
+            "entities": normalized["entities"],
+            "geo_scope": normalized["geo_scope"],
+            "time_window": normalized["time_window"],
+            "resolution_source": normalized["resolution_source"],
+            "outcome_schema": normalized["outcome_schema"],
+            "text_embedding": normalized["text_embedding"],
+            "market_metadata": normalized["metadata"],
+            "created_at": now,
+            "updated_at": now,
+        }
+
+        return (True, platform, row["id"], row)
+
+    except Exception as e:
+        logger.error(
+            "worker_normalize_market_failed",
+            platform=platform,
+            market_id=raw_market.get("id", "unknown"),
+            error=str(e),
+        )
+        return (False, platform, raw_market.get("id", "unknown"), None)
+
+
 class MarketPoller:
     """Poll external APIs and ingest markets."""
 
@@ -115,9 +191,45 @@ class MarketPoller:
         self.poly_client = PolymarketClient()
         self.running = False
         self.num_workers = num_workers or mp.cpu_count()
+        self._pool = None
+        # poll_once runs both platform polls in threads that share the pool
+        self._pool_lock = threading.Lock()
 
         logger.info("market_poller_initialized", num_workers=self.num_workers)
 
+    def _get_pool(self):
+        """Get the normalization worker pool, creating it on first use.
+
+        The embedding model is loaded before the pool forks, so workers share
+        its weights copy-on-write and the pool is reused across batches
+        instead of reloading the model in fresh workers every page.
+        """
+        with self._pool_lock:
+            if self._pool is None:
+                # Build settings once here so forked workers inherit them
+                get_settings()
+
+                try:
+                    embedding_generator.preload()
+                except Exception as e:
+                    # Workers fall back to loading the model lazily
+                    logger.warning("embedding_preload_failed", error=str(e))
+
+                start_method = "fork" if embedding_generator.is_fork_safe() else "spawn"
+                if start_method not in mp.get_all_start_methods():
+                    start_method = "spawn"
+
+                self._pool = mp.get_context(start_method).Pool(
+                    processes=self.num_workers,
+                    initializer=embedding_generator.init_worker,
+                )
+                logger.info(
+                    "market_poller_pool_started",
+                    num_workers=self.num_workers,
+                    start_method=start_method,
+                )
+        return self._pool
+
     def ingest_market(self, raw_market: Dict[str, Any], platform: str, db: Session) -> bool:
         """Ingest a single market (legacy serial method).
 
@@ -223,17 +335,37 @@ class MarketPoller:
         # Prepare arguments for workers
         worker_args = [(market, platform) for market in markets]
 
-        # Process markets in parallel
-        with mp.Pool(processes=self.num_workers) as pool:
-            results = pool.map(process_market_worker, worker_args)
+        # Normalize markets in parallel
+        results = self._get_pool().map(normalize_market_worker, worker_args)
+
+        # Write the whole batch with one upsert per chunk instead of a
+        # query and an ORM insert/update per market
+        rows = [row for success, _, _, row in results if success]
+        written = True
+        if rows:
+            db = next(get_db())
+            try:
+                Market.bulk_upsert(db, rows, update_columns=_MARKET_UPDATE_COLUMNS)
+                db.commit()
+            except Exception as e:
+                db.rollback()
+                written = False
+                logger.error(
+                    "ingest_markets_bulk_upsert_failed",
+                    platform=platform,
+                    rows=len(rows),
+                    error=str(e),
+                )
+            finally:
+                db.close()
 
         # Count successes and record metrics
-        success_count = sum(1 for success, _, _ in results if success)
+        success_count = len(rows) if written else 0
         fail_count = len(results) - success_count
 
         # Record metrics
-        for success, plat, market_id in results:
-            record_market_ingestion(plat, success=success)
+        for success, plat, market_id, _ in results:
+            record_market_ingestion(plat, success=success and written)
 
         duration = time.time() - start_time
 
@@ -292,24 +424,27 @@ class MarketPoller:
         """
         logger.info("poll_polymarket_start")
 
+        total_fetched = 0
         total_ingested = 0
 
-        def batch_callback(markets_batch, platform):
-            """Process each batch as it's fetched."""
-            nonlocal total_ingested
-            ingested = self.ingest_markets_parallel(markets_batch, platform)
-            total_ingested += ingested
-
         try:
-            # Fetch all active markets with batch processing callback
-            # Markets are ingested immediately as each page is fetched
-            markets = self.poly_client.fetch_all_active_markets_with_prices(
-                batch_callback=batch_callback
-            )
+            # Stream pages: each one is ingested as soon as it is fetched and
+            # priced, and the full market list is never held in memory
+            for markets_batch in self.poly_client.iter_active_market_batches_with_prices():
+                total_fetched += len(markets_batch)
+                try:
+                    total_ingested += self.ingest_markets_parallel(markets_batch, "polymarket")
+                except Exception as e:
+                    # A failed batch shouldn't stop the remaining pages
+                    logger.error(
+                        "poll_polymarket_batch_failed",
+                        batch_size=len(markets_batch),
+                        error=str(e),
+                    )
 
             logger.info(
                 "poll_polymarket_complete",
-                total_fetched=len(markets),
+                total_fetched=total_fetched,
                 total_ingested=total_ingested,
             )
 
@@ -356,6 +491,7 @@ class MarketPoller:
 
     def run_continuous(self):
         """Run continuous polling loop."""
+        settings = get_settings()
         logger.info(
             "poll_continuous_start",
             kalshi_interval=settings.kalshi_poll_interval_sec,
@@ -401,6 +537,11 @@ class MarketPoller:
         self.running = False
 
     def close(self):
-        """Close API clients."""
+        """Close API clients and the worker pool."""
         self.kalshi_client.close()
         self.poly_client.close()
+
+        if self._pool is not None:
+            self._pool.close()
+            self._pool.join()
+            self._pool = None
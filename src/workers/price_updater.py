@@ -12,7 +12,7 @@ from sqlalchemy.orm import Session
 from sqlalchemy.orm.attributes import flag_modified
 import structlog
 
-from src.config import settings
+from src.config import get_settings
 from src.models import Market, Bond, get_db
 from src.ingestion.kalshi_client import KalshiClient
 from src.ingestion.polymarket_client import PolymarketGammaClient, PolymarketCLOBClient
@@ -396,7 +396,7 @@ class PriceUpdater:
             interval_seconds: Seconds between updates (default from settings.price_update_interval_sec)
         """
         if interval_seconds is None:
-            interval_seconds = settings.price_update_interval_sec
+            interval_seconds = get_settings().price_update_interval_sec
         logger.info(
             "price_updater_start_continuous",
             interval_seconds=interval_seconds,
@@ -133,6 +133,27 @@ def analyze_module_structure():
     return True
 
 
+def validate_single_settings():
+    """Validate Settings is defined in exactly one module."""
+    print("Validating settings definition...")
+
+    definitions = []
+    for py_file in Path("src").rglob("*.py"):
+        with open(py_file, 'r') as f:
+            tree = ast.parse(f.read())
+        for node in ast.walk(tree):
+            if isinstance(node, ast.ClassDef) and node.name == "Settings":
+                definitions.append(str(py_file))
+
+    if definitions != ["src/config.py"]:
+        print(f"  ❌ Settings defined in: {definitions or 'nowhere'}")
+        return False
+
+    print("  ✓ src/config.py")
+    print("\n✅ Single settings definition\n")
+    return True
+
+
 def count_lines_of_code():
     """Count lines of code."""
     print("Counting lines of code...")
@@ -265,6 +286,7 @@ def run_validation():
         ("File Structure", validate_file_structure),
         ("Python Syntax", validate_python_files),
         ("Module Structure", analyze_module_structure),
+        ("Settings Definition", validate_single_settings),
         ("Lines of Code", count_lines_of_code),
         ("API Endpoints", validate_api_endpoints),
         ("Similarity Features", validate_feature_completeness),
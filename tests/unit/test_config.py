@@ -0,0 +1,79 @@
+"""Unit tests for application settings."""
+
+import pytest
+from pydantic import ValidationError
+
+from src.config import Settings
+
+
+@pytest.mark.unit
+class TestSettings:
+    """Test settings validation."""
+
+    def test_default_weights_sum_to_one(self):
+        """Test default settings construct without error."""
+        settings = Settings()
+        total = (
+            settings.weight_text
+            + settings.weight_entity
+            + settings.weight_time
+            + settings.weight_outcome
+            + settings.weight_resolution
+        )
+        assert total == pytest.approx(1.0)
+
+    def test_weights_not_summing_to_one_rejected(self):
+        """Test weight sum is validated on every construction."""
+        with pytest.raises(ValidationError, match="must sum to 1.0"):
+            Settings(weight_text=0.9)
+
+    def test_negative_weight_rejected(self):
+        """Test negative weights are rejected."""
+        with pytest.raises(ValidationError, match="greater than or equal to 0"):
+            Settings(weight_text=-0.1, weight_entity=0.7)
+
+    def test_settings_frozen(self):
+        """Test settings cannot be mutated after load."""
+        settings = Settings()
+        with pytest.raises(ValidationError):
+            settings.candidate_limit = 10
+
+    def test_get_settings_cached(self):
+        """Test get_settings returns the shared instance."""
+        from src.config import get_settings, settings
+
+        assert get_settings() is get_settings()
+        assert get_settings() is settings
+
+    def test_fast_load_defaults(self, tmp_path, monkeypatch):
+        """Test fast_load without overrides matches a validated load."""
+        monkeypatch.chdir(tmp_path)
+        fast = Settings.fast_load(env={})
+
+        assert fast == Settings.model_validate({})
+
+    def test_fast_load_validates_overrides(self, tmp_path, monkeypatch):
+        """Test fast_load applies and validates overrides."""
+        monkeypatch.chdir(tmp_path)
+
+        assert Settings.fast_load(env={"CANDIDATE_LIMIT": "10"}).candidate_limit == 10
+        with pytest.raises(ValidationError):
+            Settings.fast_load(env={"WEIGHT_TEXT": "0.9"})
+
+    def test_secrets_read_from_secrets_dir(self, tmp_path, monkeypatch):
+        """Test secrets load from files, env taking priority."""
+        (tmp_path / "kalshi_api_key").write_text("k-secret\n")
+        (tmp_path / "polymarket_api_key").write_text("p-secret\n")
+        monkeypatch.setenv("POLYMARKET_API_KEY", "p-env")
+
+        settings = Settings(_secrets_dir=str(tmp_path))
+
+        assert settings.kalshi_api_key == "k-secret"
+        assert settings.polymarket_api_key == "p-env"
+
+    def test_weights_vector(self):
+        """Test weights vector follows feature order and is read-only."""
+        settings = Settings()
+
+        assert list(settings.weights_vector) == [0.35, 0.25, 0.15, 0.20, 0.05]
+        assert not settings.weights_vector.flags.writeable
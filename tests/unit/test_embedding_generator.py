@@ -0,0 +1,65 @@
+"""Unit tests for embedding generation."""
+
+import numpy as np
+import pytest
+
+from src.normalization import embedding_generator
+
+
+class _FakeModel:
+    """Stand-in for SentenceTransformer that records encode calls."""
+
+    def __init__(self):
+        self.calls = []
+
+    def encode(self, texts, **kwargs):
+        if isinstance(texts, str):
+            self.calls.append((texts, kwargs))
+            return np.array([float(len(texts)), 0.0], dtype=np.float32)
+        self.calls.append((list(texts), kwargs))
+        return np.array([[float(len(t)), 0.0] for t in texts], dtype=np.float32)
+
+
+@pytest.fixture
+def fake_model(monkeypatch):
+    """Install a fake embedding model."""
+    model = _FakeModel()
+    monkeypatch.setattr(embedding_generator, "_model", model)
+    embedding_generator.clear_embedding_cache()
+    yield model
+    embedding_generator.clear_embedding_cache()
+
+
+@pytest.mark.unit
+class TestBatchGenerateEmbeddings:
+    """Test batch embedding generation."""
+
+    def test_single_encode_call(self, fake_model):
+        """Test valid texts are encoded in one call and mapped back by position."""
+        result = embedding_generator.batch_generate_embeddings(["ab", "", "abcd"], batch_size=1)
+
+        assert len(fake_model.calls) == 1
+        texts, kwargs = fake_model.calls[0]
+        assert texts == ["ab", "abcd"]
+        assert kwargs["batch_size"] == 1
+        assert result[1] is None
+        assert result[0][0] == 2.0
+        assert result[2][0] == 4.0
+        assert result[0].dtype == np.float32
+        assert not result[0].flags.writeable
+
+    def test_all_empty(self, fake_model):
+        """Test empty texts skip the model entirely."""
+        assert embedding_generator.batch_generate_embeddings(["", ""]) == [None, None]
+        assert fake_model.calls == []
+
+    def test_cached_texts_skip_model(self, fake_model):
+        """Test texts embedded before are served from the cache."""
+        first = embedding_generator.generate_embedding("abc")
+        result = embedding_generator.batch_generate_embeddings(["abc", "de"])
+
+        assert result[0] is first
+        assert result[1].tolist() == [2.0, 0.0]
+        assert [texts for texts, _ in fake_model.calls] == ["abc", ["de"]]
+        assert embedding_generator.generate_embedding("de").tolist() == [2.0, 0.0]
+        assert len(fake_model.calls) == 2
@@ -0,0 +1,167 @@
+"""Unit tests for enhanced arbitrage calculator."""
+
+import pytest
+import numpy as np
+from datetime import datetime
+
+from src.arbitrage.enhanced_calculator import (
+    OrderBook,
+    calculate_enhanced_arbitrage,
+    estimate_order_book_from_prices,
+    get_order_book_depth,
+    scan_enhanced_arbitrage,
+)
+from src.models import Market
+
+
+def _order_book(bids, asks):
+    """Build an order book from (price, size) level lists."""
+    return OrderBook(
+        bids=np.array(bids, dtype=np.float64).T,
+        asks=np.array(asks, dtype=np.float64).T,
+        timestamp=datetime.utcnow(),
+        market_id="test",
+        platform="kalshi",
+    )
+
+
+@pytest.mark.unit
+class TestOrderBookDepth:
+    """Test order book depth calculation."""
+
+    def test_compares_by_identity(self):
+        """Test books can be compared and hashed despite their array fields."""
+        book = _order_book(bids=[(0.55, 100.0)], asks=[(0.56, 100.0)])
+        other = _order_book(bids=[(0.55, 100.0)], asks=[(0.56, 100.0)])
+
+        assert book == book and book != other
+        assert len({book, other}) == 2
+
+    def test_bid_depth(self):
+        """Test bid depth sums levels at or above target price."""
+        book = _order_book(
+            bids=[(0.55, 100.0), (0.54, 200.0), (0.50, 400.0)],
+            asks=[(0.56, 100.0)],
+        )
+        assert get_order_book_depth(book, 0.54, "bid") == pytest.approx(300.0)
+
+    def test_ask_depth(self):
+        """Test ask depth sums levels at or below target price."""
+        book = _order_book(
+            bids=[(0.55, 100.0)],
+            asks=[(0.56, 100.0), (0.57, 50.0), (0.60, 400.0)],
+        )
+        assert get_order_book_depth(book, 0.57, "ask") == pytest.approx(150.0)
+
+    def test_unsorted_levels(self):
+        """Test levels are sorted on construction."""
+        book = _order_book(
+            bids=[(0.50, 400.0), (0.55, 100.0), (0.54, 200.0)],
+            asks=[(0.60, 400.0), (0.56, 100.0)],
+        )
+        assert list(book.bids[0]) == [0.55, 0.54, 0.50]
+        assert list(book.asks[0]) == [0.56, 0.60]
+        assert get_order_book_depth(book, 0.54, "bid") == pytest.approx(300.0)
+        assert not book.bids.flags.writeable
+
+    def test_empty_side(self):
+        """Test an empty side has no depth."""
+        book = _order_book(bids=[], asks=[(0.56, 100.0)])
+        assert book.bids.shape == (2, 0)
+        assert get_order_book_depth(book, 0.10, "bid") == 0.0
+
+    def test_no_depth_at_price(self):
+        """Test depth is zero when no level crosses the target price."""
+        book = _order_book(bids=[(0.40, 100.0)], asks=[(0.60, 100.0)])
+        assert get_order_book_depth(book, 0.50, "bid") == 0.0
+        assert get_order_book_depth(book, 0.50, "ask") == 0.0
+
+
+@pytest.mark.unit
+class TestEstimatedOrderBook:
+    """Test order book estimation from mid prices."""
+
+    def test_estimated_levels(self):
+        """Test estimated book brackets the mid price on both sides."""
+        market = Market(id="test_k", platform="kalshi")
+        book = estimate_order_book_from_prices(market, 0.50, spread_pct=0.01)
+
+        assert book.bids.shape == (2, 3)
+        assert book.asks.shape == (2, 3)
+        assert book.bids[0, 0] == pytest.approx(0.495)
+        assert book.asks[0, 0] == pytest.approx(0.505)
+        assert np.all(np.diff(book.bids[0]) < 0)
+        assert np.all(np.diff(book.asks[0]) > 0)
+        assert np.all(book.bids[1] == 1000.0)
+
+
+def _market(market_id, platform, yes_price, **metadata):
+    """Build a market with a yes price and optional metadata."""
+    return Market(
+        id=market_id,
+        platform=platform,
+        raw_title=f"{platform} market",
+        outcome_schema={"outcomes": [{"label": "Yes", "value": True, "price": yes_price}]},
+        market_metadata=metadata or None,
+    )
+
+
+@pytest.mark.unit
+class TestCalculateEnhancedArbitrage:
+    """Test end-to-end enhanced arbitrage calculation."""
+
+    def test_missing_prices(self):
+        """Test markets without prices produce no opportunity."""
+        market_k = Market(id="test_k", platform="kalshi")
+        market_p = _market("test_p", "polymarket", 0.5)
+
+        opportunity = calculate_enhanced_arbitrage(market_k, market_p)
+
+        assert opportunity.opportunity_type == "none"
+        assert opportunity.warnings == ["Missing price data"]
+
+    def test_no_spread(self):
+        """Test identical prices are rejected."""
+        opportunity = calculate_enhanced_arbitrage(
+            _market("test_k", "kalshi", 0.5),
+            _market("test_p", "polymarket", 0.5),
+        )
+
+        assert opportunity.opportunity_type == "none"
+        assert opportunity.kalshi_market_id == "test_k"
+        assert opportunity.polymarket_market_id == "test_p"
+        assert opportunity.warnings == ["No profitable arbitrage after costs"]
+
+    def test_wide_spread(self):
+        """Test a wide spread produces a buy-Kalshi/sell-Polymarket trade."""
+        opportunity = calculate_enhanced_arbitrage(
+            _market("test_k", "kalshi", 0.30, volume=100000, liquidity=50000),
+            _market("test_p", "polymarket", 0.70, volume=100000, liquidity=50000),
+        )
+
+        assert opportunity.opportunity_type == "direct_spread"
+        assert opportunity.direction == "buy_k_sell_p"
+        assert opportunity.net_profit_per_share > 0
+        legs = opportunity.trade_instructions["legs"]
+        assert [leg["exchange"] for leg in legs] == ["kalshi", "polymarket"]
+        assert legs[0]["price"] == pytest.approx(opportunity.kalshi_ask)
+        assert legs[1]["price"] == pytest.approx(opportunity.polymarket_bid)
+
+
+@pytest.mark.unit
+class TestScanEnhancedArbitrage:
+    """Test batch arbitrage scans."""
+
+    def test_scan_preserves_order(self):
+        """Test pooled and inline scans return identical, ordered results."""
+        pairs = [
+            (_market(f"k{i}", "kalshi", 0.30), _market(f"p{i}", "polymarket", 0.70 if i % 2 else 0.30))
+            for i in range(6)
+        ]
+
+        inline = scan_enhanced_arbitrage(pairs, max_workers=1)
+        pooled = scan_enhanced_arbitrage(pairs, max_workers=2, chunk_size=2)
+
+        assert [o.kalshi_market_id for o in pooled] == [f"k{i}" for i in range(6)]
+        assert [o.opportunity_type for o in pooled] == [o.opportunity_type for o in inline]
+        assert [o.opportunity_type for o in inline][:2] == ["none", "direct_spread"]
@@ -0,0 +1,121 @@
+"""Unit tests for entity extraction."""
+
+from types import SimpleNamespace
+
+import pytest
+
+from src.normalization import entity_extractor
+
+
+class _FakeNLP:
+    """Stand-in for a spaCy pipeline returning fixed entities."""
+
+    def __init__(self, ents=()):
+        self.ents = [SimpleNamespace(text=text, label_=label) for text, label in ents]
+        self.calls = []
+        self.pipe_calls = []
+
+    def __call__(self, text):
+        self.calls.append(text)
+        return SimpleNamespace(ents=self.ents)
+
+    def pipe(self, texts, batch_size=None):
+        texts = list(texts)
+        self.pipe_calls.append((texts, batch_size))
+        return (SimpleNamespace(ents=self.ents) for _ in texts)
+
+
+@pytest.fixture
+def fake_nlp(monkeypatch):
+    """Install a fake spaCy pipeline with fixed entities."""
+    nlp = _FakeNLP([("Jerome Powell", "PERSON"), ("Canada", "GPE"), ("Super Bowl LX", "EVENT")])
+    monkeypatch.setattr(entity_extractor, "_nlp", nlp)
+    entity_extractor.clear_entity_cache()
+    yield nlp
+    entity_extractor.clear_entity_cache()
+
+
+@pytest.mark.unit
+class TestKnownTermMatching:
+    """Test matching against the known term lists."""
+
+    def test_tickers(self):
+        """Test known tickers are matched on word boundaries."""
+        tickers = entity_extractor.extract_tickers("Will Bitcoin beat ETH and S&P by year end?")
+
+        assert tickers == {"Bitcoin", "ETH", "S&P"}
+
+    def test_ticker_symbols(self):
+        """Test $-prefixed and uppercase symbols resolve to known tickers only."""
+        tickers = entity_extractor.extract_tickers("Will $NVDA outperform TSLA and XYZ?")
+
+        assert tickers == {"NVDA", "TSLA"}
+
+    def test_ticker_inside_word_ignored(self):
+        """Test a ticker embedded in a longer word is not matched."""
+        assert entity_extractor.extract_tickers("Spyware metadata leak") == set()
+
+    def test_longest_term_wins(self, fake_nlp):
+        """Test a multi-word term is preferred over its shorter prefix."""
+        countries = entity_extractor.extract_countries("Will the United States and UK sign?")
+        organizations = entity_extractor.extract_organizations("Federal Reserve and the SEC")
+
+        assert countries == {"United States", "UK", "Canada"}
+        assert organizations == {"Federal Reserve", "SEC"}
+
+
+@pytest.mark.unit
+class TestExtractEntities:
+    """Test combined entity extraction."""
+
+    def test_repeat_text_is_cached(self, fake_nlp):
+        """Test a text is parsed once and a repeat is served from the cache."""
+        first = entity_extractor.extract_entities("Will BTC hit 100k?")
+        second = entity_extractor.extract_entities("Will BTC hit 100k?")
+
+        assert fake_nlp.calls == ["Will BTC hit 100k?"]
+        assert second == first
+        assert first["tickers"] == ["BTC"]
+
+    def test_cached_result_not_shared(self, fake_nlp):
+        """Test mutating a returned dict doesn't leak into the cache."""
+        entity_extractor.extract_entities("Will BTC hit 100k?")["tickers"].append("ETH")
+
+        assert entity_extractor.extract_entities("Will BTC hit 100k?")["tickers"] == ["BTC"]
+
+    def test_ner_failure_not_cached(self, fake_nlp, monkeypatch):
+        """Test a failed parse falls back to known terms and is retried next time."""
+        def fail(text):
+            raise RuntimeError("spaCy down")
+
+        monkeypatch.setattr(entity_extractor, "_nlp", fail)
+        degraded = entity_extractor.extract_entities("Jerome Powell on BTC")
+
+        monkeypatch.setattr(entity_extractor, "_nlp", fake_nlp)
+        recovered = entity_extractor.extract_entities("Jerome Powell on BTC")
+
+        assert degraded["tickers"] == ["BTC"] and degraded["people"] == []
+        assert recovered["people"] == ["Jerome Powell"]
+        assert fake_nlp.calls == ["Jerome Powell on BTC"]
+
+    def test_batch_matches_single(self, fake_nlp):
+        """Test batched extraction parses once per text and matches extract_entities."""
+        texts = ["Will BTC beat ETH?", "Will the Fed cut rates in Q3?"]
+
+        batched = entity_extractor.extract_entities_batch(texts)
+
+        assert len(fake_nlp.pipe_calls) == 1
+        assert fake_nlp.pipe_calls[0][0] == texts[::-1]  # longest first
+        assert fake_nlp.calls == []
+        for text, entities in zip(texts, batched):
+            expected = entity_extractor.extract_entities(text)
+            assert {k: sorted(v) for k, v in entities.items()} == {
+                k: sorted(v) for k, v in expected.items()
+            }
+        assert "Q3" in batched[1]["misc"]
+        assert batched[0]["tickers"] and not batched[1]["tickers"]
+
+    def test_batch_empty(self, fake_nlp):
+        """Test an empty batch skips spaCy."""
+        assert entity_extractor.extract_entities_batch([]) == []
+        assert fake_nlp.pipe_calls == []
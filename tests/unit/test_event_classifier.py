@@ -0,0 +1,199 @@
+"""Unit tests for event type and geo scope classification."""
+
+import random
+
+import pytest
+from structlog.testing import capture_logs
+
+from src.normalization import event_classifier
+from src.normalization.event_classifier import (
+    EVENT_TYPE_RULES,
+    classify_event_type,
+    classify_sport_type,
+    detect_parlay_market,
+    determine_geo_scope,
+)
+
+
+class _FakeAutomaton:
+    """Brute-force stand-in for ahocorasick.Automaton."""
+
+    def __init__(self):
+        self.words = {}
+        self.built = False
+
+    def add_word(self, key, value):
+        self.words[key] = value
+
+    def make_automaton(self):
+        self.built = True
+
+    def iter(self, haystack):
+        assert self.built
+        for key, value in self.words.items():
+            start = haystack.find(key)
+            while start != -1:
+                yield start + len(key) - 1, value
+                start = haystack.find(key, start + 1)
+
+
+def _reference_classify(category, entities, title):
+    """Score event types with one substring test per rule keyword."""
+    title_lower = title.lower()
+    scores = {}
+    for event_type, rules in EVENT_TYPE_RULES.items():
+        if any(excl in title_lower for excl in rules.get("exclusions", [])):
+            continue
+        score = 3 if category.lower() in rules.get("categories", []) else 0
+        score += 2 * sum(1 for keyword in rules["keywords"] if keyword in title_lower)
+        score += sum(1 for entity_type in rules.get("entities", []) if entities.get(entity_type))
+        scores[event_type] = score * rules.get("boost", 1)
+    valid = {k: v for k, v in scores.items() if v > 0}
+    return max(valid, key=valid.get) if valid else "general"
+
+
+CASES = [
+    ("sports", {"people": ["Mahomes"]}, "Will Mahomes throw over 250 passing yards vs. the Bills?"),
+    ("entertainment", {"people": ["Emma Stone"]}, "Will Emma Stone win Best Actress at the Oscars?"),
+    ("politics", {"people": ["Trump"]}, "Will Trump be indicted before the primary?"),
+    ("crypto", {"tickers": ["BTC"]}, "Will BTC trade above $100k?"),
+    ("economics", {"organizations": ["FED"]}, "Will the Fed cut rates by 50 bps?"),
+    ("politics", {"countries": ["Russia"]}, "Russia Ukraine ceasefire by June?"),
+    ("finance", {}, "Apple quarterly earnings beat"),
+    ("other", {}, "Something unrelated"),
+    ("sports", {}, "Chiefs win the AFC title with 100+ rushing yards?"),
+]
+
+
+@pytest.mark.unit
+class TestClassifyEventType:
+    """Test event type classification."""
+
+    @pytest.mark.parametrize("category,entities,title", CASES)
+    def test_matches_reference_scoring(self, category, entities, title):
+        """Test the single-scan tally scores like per-keyword substring tests."""
+        assert classify_event_type(category, entities, title) == _reference_classify(
+            category, entities, title
+        )
+
+    def test_random_titles_match_reference(self):
+        """Test pruned scoring picks the same type, ties included, on random titles."""
+        rng = random.Random(0)
+        keywords = sorted({k for rules in EVENT_TYPE_RULES.values() for k in rules["keywords"]})
+        exclusions = sorted({k for rules in EVENT_TYPE_RULES.values() for k in rules["exclusions"]})
+        categories = ["sports", "politics", "crypto", "finance", "economics", "entertainment", "other"]
+        entity_types = ["people", "organizations", "countries", "tickers"]
+
+        for _ in range(500):
+            words = rng.sample(keywords, rng.randint(0, 4)) + rng.sample(exclusions, rng.randint(0, 1))
+            title = " ".join(rng.sample(words, len(words)))
+            entities = {t: ["x"] for t in entity_types if rng.random() < 0.4}
+            category = rng.choice(categories)
+
+            assert classify_event_type(category, entities, title) == _reference_classify(
+                category, entities, title
+            ), title
+
+    def test_memoized_by_entity_presence(self):
+        """Test repeats with different entity names reuse the cached result."""
+        event_classifier._classify_cached.cache_clear()
+        title = "Will the Fed cut rates in March?"
+
+        first = classify_event_type("Economics", {"organizations": ["FED"], "people": []}, title)
+        second = classify_event_type("economics", {"organizations": ["Federal Reserve"]}, title)
+
+        assert first == second == "rate_decision"
+        assert event_classifier._classify_cached.cache_info().hits == 1
+
+    def test_cache_hits_still_log(self, monkeypatch):
+        """Test every call logs its classification, not just cache misses."""
+        monkeypatch.setattr(event_classifier, "is_debug_enabled", lambda: True)
+        event_classifier._classify_cached.cache_clear()
+        title = "Will the Fed cut rates in March?"
+
+        with capture_logs() as logs:
+            for _ in range(2):
+                classify_event_type("Economics", {"organizations": ["FED"]}, title)
+
+        classified = [log for log in logs if log["event"] == "event_type_classified"]
+        assert [log["event_type"] for log in classified] == ["rate_decision"] * 2
+
+    def test_overlapping_keywords_all_match(self):
+        """Test keywords nested in or overlapping others are each found."""
+        matched = event_classifier._match_keywords("over 20 yards vs. dallas")
+
+        assert {"over", "over ", "yard", "yards", "vs", "vs."} <= matched
+
+    def test_automaton_path(self, monkeypatch):
+        """Test the Aho-Corasick scan finds the same keywords as the fallback."""
+        fake = type("ahocorasick", (), {"Automaton": _FakeAutomaton})
+        monkeypatch.setattr(event_classifier, "ahocorasick", fake)
+        matcher = event_classifier._KeywordMatcher(event_classifier._KEYWORD_INDEX)
+        title = "over 20 yards vs. dallas, o/u 3.5 goals"
+
+        expected = event_classifier._match_keywords(title)
+        monkeypatch.setattr(event_classifier, "_EVENT_KEYWORDS", matcher)
+
+        assert matcher.automaton is not None
+        assert event_classifier._match_keywords(title) == expected
+
+    def test_exclusion(self):
+        """Test an exclusion keyword removes sports from contention."""
+        title = "Will the quarterback be arrested before the game?"
+
+        assert classify_event_type("sports", {}, title) == "regulatory"
+
+
+@pytest.mark.unit
+class TestClassifySportType:
+    """Test sport type detection."""
+
+    @pytest.mark.parametrize("title,expected", [
+        ("Will the Chiefs cover vs. the Bills?", "NFL"),
+        ("Jets vs Patriots: over 250 passing yards?", "NFL"),
+        ("Rangers vs Bruins, Stanley Cup game 3", "NHL"),
+        ("Kings vs Lakers total rebounds", "NBA"),
+        ("Giants vs Dodgers home run in the 9th?", "MLB"),
+        ("Jets vs Kings tonight?", None),
+        ("Will it rain tomorrow?", None),
+    ])
+    def test_sport(self, title, expected):
+        """Test markers are counted per sport and shared team names ignored."""
+        assert classify_sport_type(title) == expected
+
+
+@pytest.mark.unit
+class TestDetectParlayMarket:
+    """Test parlay detection."""
+
+    @pytest.mark.parametrize("title,expected", [
+        ("Chiefs ML parlay", True),
+        ("Chiefs,yes, Bills, no", True),
+        ("Chiefs, yes,Bills,yes", True),
+        ("Chiefs, yes", False),
+        ("Chiefs vs Bills, Jets vs. Rams", True),
+        ("Chiefs vs Bills, winner?", False),
+        ("Chiefs, none", False),
+    ])
+    def test_parlay(self, title, expected):
+        """Test keywords, outcome separators and repeated matchups."""
+        assert detect_parlay_market(title) is expected
+
+
+@pytest.mark.unit
+class TestDetermineGeoScope:
+    """Test geographic scope detection."""
+
+    @pytest.mark.parametrize("countries,title,expected", [
+        ([], "Will the US enter a recession?", "US"),
+        ([], "American airline merger approved?", "US"),
+        ([], "Will the EU ban TikTok?", "EU"),
+        ([], "Global temperature record in 2025?", "global"),
+        (["Russia"], "Will Russia hold elections?", "RUSSIA"),
+        (["China", "Japan"], "China Japan trade deal?", "multi_country"),
+        ([], "Worldwide business slowdown?", "global"),
+    ])
+    def test_scope(self, countries, title, expected):
+        """Test indicators are matched as whole words."""
+        assert determine_geo_scope({"countries": countries}, title) == expected
+        assert determine_geo_scope({"countries": countries}, title, title.lower()) == expected
@@ -0,0 +1,58 @@
+"""Unit tests for the fused title scan."""
+
+import pytest
+
+from src.normalization._fused_classifier import build_title_features, scan_title
+from src.normalization.event_classifier import (
+    classify_event_type,
+    classify_sport_type,
+    detect_parlay_market,
+    determine_geo_scope,
+)
+from src.normalization.pipeline import infer_granularity, infer_polarity
+
+TITLES = [
+    "Will Mahomes throw over 250 passing yards vs. the Bills?",
+    "Will the Fed not cut rates in Q3?",
+    "Rangers vs Bruins and Kings vs Lakers parlay",
+    "Will BTC trade above $100k by end of year?",
+    "Something unrelated",
+    "Will the US or the EU lead global bonus pay?",
+    "Europe worldwide campus tour",
+]
+
+
+@pytest.mark.unit
+class TestScanTitle:
+    """Test the single scan feeds each classifier its own terms."""
+
+    def test_terms_split_by_classifier(self):
+        """Test a term shared by two classifiers lands in both buckets."""
+        terms = scan_title("will the fed not cut rates in q3?")
+
+        assert "q3" in terms["granularity"]
+        assert "not" in terms["polarity"]
+        assert "fed" in terms["event"]
+        assert not terms["sport"]
+
+    @pytest.mark.parametrize("title", TITLES)
+    def test_matches_unfused_classifiers(self, title):
+        """Test classifying from the scan agrees with each classifier's own scan."""
+        terms = scan_title(title.lower())
+
+        assert classify_event_type("sports", {}, title, keywords=terms["event"]) == (
+            classify_event_type("sports", {}, title)
+        )
+        assert classify_sport_type(title, markers=terms["sport"]) == classify_sport_type(title)
+        assert detect_parlay_market(title, keywords=terms["parlay"]) == detect_parlay_market(title)
+        assert infer_granularity(title, None, words=terms["granularity"]) == infer_granularity(title, None)
+        assert infer_polarity(title, words=terms["polarity"]) == infer_polarity(title)
+        assert determine_geo_scope({}, title, indicators=terms["geo"]) == determine_geo_scope({}, title)
+
+    def test_title_features(self):
+        """Test the features struct carries the lowercased title and each classifier's hits."""
+        features = build_title_features("Will the Fed NOT cut rates in Q3?")
+
+        assert features.lower == "will the fed not cut rates in q3?"
+        assert features.polarity == scan_title(features.lower)["polarity"]
+        assert "q3" in features.granularity
@@ -0,0 +1,148 @@
+"""Unit tests for Kalshi client pagination."""
+
+import asyncio
+
+import httpx
+import pytest
+
+from src.ingestion.kalshi_client import AsyncKalshiClient, KalshiClient
+
+
+def _pages_handler(pages, requests_seen):
+    """Build a mock transport handler serving cursor-keyed pages."""
+    def handler(request: httpx.Request) -> httpx.Response:
+        cursor = request.url.params.get("cursor", "")
+        requests_seen.append(cursor)
+        return httpx.Response(200, json=pages[cursor])
+    return handler
+
+
+@pytest.mark.unit
+class TestAsyncKalshiClient:
+    """Test async full-market crawl."""
+
+    def test_fetch_all_active_markets_paginates(self):
+        """Test every page is fetched and normalized in order."""
+        pages = {
+            "": {"markets": [{"ticker": "A", "title": "A?"}], "cursor": "c1"},
+            "c1": {"markets": [{"ticker": "B", "title": "B?", "status": "closed"}], "cursor": "c2"},
+            "c2": {"markets": [], "cursor": ""},
+        }
+        requests_seen = []
+        batches = []
+
+        async def run():
+            async with AsyncKalshiClient(api_base="https://kalshi.test") as client:
+                await client.session.aclose()
+                client.session = httpx.AsyncClient(
+                    transport=httpx.MockTransport(_pages_handler(pages, requests_seen))
+                )
+                return await client.fetch_all_active_markets(
+                    batch_callback=lambda batch, platform: batches.append(len(batch))
+                )
+
+        markets = asyncio.run(run())
+
+        assert [m["id"] for m in markets] == ["A", "B"]
+        assert markets[1]["title"] == "B?"
+        assert requests_seen == ["", "c1", "c2"]
+        assert batches == [1, 1]
+
+    def test_fetch_all_active_markets_keeps_pages_before_error(self):
+        """Test a failing page request returns the markets fetched so far."""
+        pages = {"": {"markets": [{"ticker": "A", "title": "A?"}], "cursor": "c1"}}
+        requests_seen = []
+
+        async def run():
+            async with AsyncKalshiClient(api_base="https://kalshi.test") as client:
+                await client.session.aclose()
+                client.session = httpx.AsyncClient(
+                    transport=httpx.MockTransport(_pages_handler(pages, requests_seen))
+                )
+                return await client.fetch_all_active_markets()
+
+        markets = asyncio.run(run())
+
+        assert [m["id"] for m in markets] == ["A"]
+        assert requests_seen == ["", "c1"]
+
+    def test_fetch_all_active_markets_stops_on_repeated_cursor(self):
+        """Test pagination stops when the API repeats a cursor."""
+        pages = {
+            "": {"markets": [{"ticker": "A", "title": "A?"}], "cursor": "c1"},
+            "c1": {"markets": [{"ticker": "B", "title": "B?"}], "cursor": "c1"},
+        }
+        requests_seen = []
+
+        async def run():
+            async with AsyncKalshiClient(api_base="https://kalshi.test") as client:
+                await client.session.aclose()
+                client.session = httpx.AsyncClient(
+                    transport=httpx.MockTransport(_pages_handler(pages, requests_seen))
+                )
+                return await client.fetch_all_active_markets()
+
+        markets = asyncio.run(run())
+
+        assert [m["id"] for m in markets] == ["A", "B"]
+        assert requests_seen == ["", "c1"]
+
+    def test_sync_fetch_stops_on_repeated_cursor(self):
+        """Test the sync client also stops on a repeated cursor."""
+        pages = {
+            "": {"markets": [{"ticker": "A", "title": "A?"}], "cursor": "c1"},
+            "c1": {"markets": [{"ticker": "B", "title": "B?"}], "cursor": "c1"},
+        }
+        requests_seen = []
+        session = httpx.Client(transport=httpx.MockTransport(_pages_handler(pages, requests_seen)))
+
+        markets = KalshiClient(api_base="https://kalshi.test", session=session).fetch_all_active_markets()
+
+        assert [m["id"] for m in markets] == ["A", "B"]
+        assert requests_seen == ["", "c1"]
+
+
+@pytest.mark.unit
+class TestNormalizeMarket:
+    """Test Kalshi market normalization."""
+
+    def test_normalize_market(self):
+        """Test fields and dict-style access on normalized markets."""
+        market = KalshiClient(api_base="https://kalshi.test").normalize_market({
+            "ticker": "FED-25DEC",
+            "title": "Fed cuts rates?",
+            "subtitle": "December meeting",
+            "category": "Economics",
+            "volume": 10,
+        })
+
+        assert market.id == "FED-25DEC"
+        assert market["description"] == "Fed cuts rates?. December meeting"
+        assert market.get("category") == "economics"
+        assert market["metadata"]["volume"] == 10
+        assert market.get("missing", "default") == "default"
+        with pytest.raises(KeyError):
+            market["missing"]
+
+
+@pytest.mark.unit
+class TestKalshiClientSession:
+    """Test HTTP session sharing."""
+
+    def test_clients_share_session(self):
+        """Test clients reuse one connection pool and send their own auth."""
+        seen = []
+
+        def handler(request):
+            seen.append(request.headers.get("Authorization"))
+            return httpx.Response(200, json={"ticker": "A"})
+
+        session = httpx.Client(transport=httpx.MockTransport(handler))
+        with KalshiClient(api_base="https://kalshi.test", api_key="k1", session=session) as one:
+            one.get_market("A")
+        with KalshiClient(api_base="https://kalshi.test", api_key="k2", session=session) as two:
+            two.get_market("A")
+
+        assert seen == ["Bearer k1", "Bearer k2"]
+        assert not session.is_closed
+        assert KalshiClient(api_base="x").session is KalshiClient(api_base="y").session
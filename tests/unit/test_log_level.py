@@ -0,0 +1,36 @@
+"""Unit tests for log level checks."""
+
+from types import SimpleNamespace
+
+import pytest
+
+from src.utils import log_level
+
+
+@pytest.fixture
+def configured_level(monkeypatch):
+    """Set the configured LOG_LEVEL and reset the cached check around the test."""
+    def configure(level):
+        monkeypatch.setattr(log_level, "get_settings", lambda: SimpleNamespace(log_level=level))
+        log_level.is_debug_enabled.cache_clear()
+
+    yield configure
+    log_level.is_debug_enabled.cache_clear()
+
+
+@pytest.mark.unit
+class TestIsDebugEnabled:
+    """Test the debug gate follows LOG_LEVEL."""
+
+    @pytest.mark.parametrize("level,expected", [
+        ("DEBUG", True),
+        ("debug", True),
+        ("INFO", False),
+        ("WARNING", False),
+        ("bogus", False),
+    ])
+    def test_level(self, configured_level, level, expected):
+        """Test only a DEBUG level enables debug events."""
+        configured_level(level)
+
+        assert log_level.is_debug_enabled() is expected
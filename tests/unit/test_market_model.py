@@ -0,0 +1,51 @@
+"""Unit tests for the Market model."""
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from src.models import Market
+
+
+class _RecordingSession:
+    """Session stand-in that records executed statements."""
+
+    def __init__(self):
+        self.statements = []
+
+    def execute(self, stmt):
+        self.statements.append(stmt)
+
+
+@pytest.mark.unit
+class TestMarketBulkUpsert:
+    """Test bulk market upserts."""
+
+    def test_chunks_and_conflict_update(self):
+        """Test rows are chunked into ON CONFLICT statements, deduplicated by id."""
+        rows = [{"id": f"m{i}", "platform": "kalshi", "status": "active", "raw_title": "t"} for i in range(5)]
+        rows.append({"id": "m0", "platform": "kalshi", "status": "active", "raw_title": "new"})
+        session = _RecordingSession()
+
+        written = Market.bulk_upsert(session, rows, chunk_size=2, update_columns=["raw_title"])
+
+        assert written == 5
+        assert len(session.statements) == 3
+        sql = str(session.statements[0].compile(dialect=postgresql.dialect()))
+        assert "ON CONFLICT (id) DO UPDATE SET raw_title = excluded.raw_title" in sql
+        assert session.statements[0].compile(dialect=postgresql.dialect()).params["raw_title_m0"] == "new"
+
+    def test_default_update_columns(self):
+        """Test id and created_at are never overwritten by default."""
+        session = _RecordingSession()
+
+        Market.bulk_upsert(session, [{"id": "m0", "status": "active", "created_at": None}])
+
+        sql = str(session.statements[0].compile(dialect=postgresql.dialect()))
+        assert "SET status = excluded.status" in sql
+        assert "excluded.created_at" not in sql
+
+    def test_empty(self):
+        """Test no statement is issued for no rows."""
+        session = _RecordingSession()
+        assert Market.bulk_upsert(session, []) == 0
+        assert session.statements == []
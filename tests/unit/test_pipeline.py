@@ -0,0 +1,103 @@
+"""Unit tests for the normalization pipeline."""
+
+import random
+
+import pytest
+
+from src.normalization import pipeline
+from src.normalization.event_classifier import _GRANULARITY_WORDS
+
+RAW_MARKETS = [
+    {"id": "a", "title": "Will the Fed cut rates in Q3?", "description": "FOMC decision", "category": "economics"},
+    {"id": "b", "title": "Will BTC trade above $100k?", "description": "", "category": "crypto"},
+]
+
+
+@pytest.fixture
+def stub_models(monkeypatch):
+    """Replace NER and embedding models with deterministic stand-ins."""
+    calls = {"entities": [], "embeddings": []}
+
+    def fake_entities(text):
+        return {"tickers": ["BTC"] if "BTC" in text else [], "people": [], "organizations": [],
+                "countries": [], "misc": []}
+
+    def fake_entities_batch(texts):
+        calls["entities"].append(list(texts))
+        return [fake_entities(text) for text in texts]
+
+    def fake_embeddings(texts):
+        calls["embeddings"].append(list(texts))
+        return [None for _ in texts]
+
+    monkeypatch.setattr(pipeline, "extract_entities", fake_entities)
+    monkeypatch.setattr(pipeline, "extract_entities_batch", fake_entities_batch)
+    monkeypatch.setattr(pipeline, "generate_market_embedding", lambda title, description: None)
+    monkeypatch.setattr(pipeline, "batch_generate_embeddings", fake_embeddings)
+    return calls
+
+
+@pytest.mark.unit
+class TestNormalizeMarkets:
+    """Test batched normalization."""
+
+    def test_batch_matches_single(self, stub_models):
+        """Test a batch runs NER and embeddings once and matches per-market results."""
+        batched = pipeline.normalize_markets(RAW_MARKETS, "kalshi")
+
+        assert len(stub_models["entities"]) == len(stub_models["embeddings"]) == 1
+        assert stub_models["embeddings"][0][1] == "bitcoin trade above $100k? | "
+        for raw_market, normalized in zip(RAW_MARKETS, batched):
+            single = pipeline.normalize_market(raw_market, "kalshi")
+            del single["metadata"]["normalized_at"], normalized["metadata"]["normalized_at"]
+            assert normalized == single
+
+    def test_single_market_uses_per_market_path(self, stub_models):
+        """Test a one-market batch skips the batched calls."""
+        assert pipeline.normalize_markets(RAW_MARKETS[:1], "kalshi")[0]["id"] == "a"
+        assert stub_models["entities"] == stub_models["embeddings"] == []
+
+
+@pytest.mark.unit
+class TestInferGranularity:
+    """Test granularity inference."""
+
+    @pytest.mark.parametrize("title,expected", [
+        ("weekly close above 100 by end of day?", "day"),
+        ("q3 gdp this year", "quarter"),
+        ("weekend box office", "week"),
+        ("bitcoin above 100k", "week"),
+        ("annual report", "year"),
+    ])
+    def test_granularity(self, title, expected):
+        """Test the earliest granularity in priority order wins, wherever it appears."""
+        assert pipeline.infer_granularity(title, None) == expected
+
+    def test_matches_substring_tests(self):
+        """Test the single regex scan agrees with per-indicator substring tests."""
+        rng = random.Random(0)
+        indicators = [word for _, words in _GRANULARITY_WORDS for word in words]
+
+        for _ in range(300):
+            title = "".join(rng.choice(indicators + ["x", " ", "e", "y"]) for _ in range(4))
+            expected = next(
+                (g for g, words in _GRANULARITY_WORDS if any(w in title for w in words)), "week"
+            )
+            assert pipeline.infer_granularity(title, None) == expected, title
+
+
+@pytest.mark.unit
+class TestInferPolarity:
+    """Test polarity inference."""
+
+    @pytest.mark.parametrize("title,expected", [
+        ("Will the Fed NOT cut rates?", "negative"),
+        ("Senate won't pass the bill", "negative"),
+        ("Court rejects the appeal?", "negative"),
+        ("Bill fails to pass by June?", "negative"),
+        ("Notable win for the Knicks?", "positive"),
+        ("Will Nottingham Forest win?", "positive"),
+    ])
+    def test_polarity(self, title, expected):
+        """Test negative indicators count only as whole words."""
+        assert pipeline.infer_polarity(title) == expected
@@ -0,0 +1,246 @@
+"""Unit tests for Polymarket client pagination."""
+
+import asyncio
+
+import httpx
+import pytest
+
+from src.ingestion.polymarket_client import (
+    AsyncPolymarketGammaClient,
+    PolymarketCLOBClient,
+    PolymarketGammaClient,
+)
+
+
+def _gamma_market(condition_id):
+    """Build a minimal raw Gamma market."""
+    return {"conditionId": condition_id, "question": f"{condition_id}?", "tags": ["Politics"]}
+
+
+def _offset_handler(markets, requests_seen):
+    """Build a mock transport handler serving offset/limit slices."""
+    def handler(request: httpx.Request) -> httpx.Response:
+        offset = int(request.url.params["offset"])
+        limit = int(request.url.params["limit"])
+        requests_seen.append(offset)
+        return httpx.Response(200, json=markets[offset:offset + limit])
+    return handler
+
+
+def _run_fetch(markets, requests_seen, concurrency):
+    """Run a full async Gamma fetch against mocked pages."""
+    async def run():
+        async with AsyncPolymarketGammaClient(
+            api_base="https://gamma.test", concurrency=concurrency
+        ) as client:
+            await client.session.aclose()
+            client.session = httpx.AsyncClient(
+                transport=httpx.MockTransport(_offset_handler(markets, requests_seen))
+            )
+            return await client.fetch_all_active_markets()
+
+    return asyncio.run(run())
+
+
+@pytest.mark.unit
+class TestAsyncPolymarketGammaClient:
+    """Test concurrent Gamma full-market crawl."""
+
+    def test_fetch_all_active_markets_in_offset_order(self):
+        """Test concurrent pages are merged in offset order and stop at a short page."""
+        markets = [_gamma_market(f"0x{i}") for i in range(250)]
+        requests_seen = []
+
+        fetched = _run_fetch(markets, requests_seen, concurrency=2)
+
+        assert [m["id"] for m in fetched] == [f"0x{i}" for i in range(250)]
+        assert sorted(requests_seen) == [0, 100, 200, 300]
+
+    def test_fetch_all_active_markets_stops_on_empty_page(self):
+        """Test an exact multiple of the page size stops at the empty page."""
+        markets = [_gamma_market(f"0x{i}") for i in range(100)]
+        requests_seen = []
+
+        fetched = _run_fetch(markets, requests_seen, concurrency=3)
+
+        assert len(fetched) == 100
+        assert sorted(requests_seen) == [0, 100, 200]
+
+
+@pytest.mark.unit
+class TestPolymarketGammaClientLookup:
+    """Test condition ID lookups."""
+
+    def _client(self, markets, requests_seen):
+        """Build a Gamma client filtering mocked markets by condition_ids."""
+        def handler(request: httpx.Request) -> httpx.Response:
+            ids = request.url.params.get_list("condition_ids")
+            requests_seen.append(ids)
+            return httpx.Response(200, json=[m for m in markets if m["conditionId"] in ids])
+
+        client = PolymarketGammaClient(api_base="https://gamma.test")
+        client.session = httpx.Client(transport=httpx.MockTransport(handler))
+        return client
+
+    def test_get_market_single_request(self):
+        """Test get_market filters server-side and raises when missing."""
+        requests_seen = []
+        client = self._client([_gamma_market("0xa"), _gamma_market("0xb")], requests_seen)
+
+        assert client.get_market("0xb")["conditionId"] == "0xb"
+        with pytest.raises(ValueError):
+            client.get_market("0xc")
+        assert requests_seen == [["0xb"], ["0xc"]]
+
+    def test_get_markets_by_ids_batches(self):
+        """Test bulk lookup uses one request."""
+        requests_seen = []
+        client = self._client([_gamma_market("0xa"), _gamma_market("0xb")], requests_seen)
+
+        markets = client.get_markets_by_ids(["0xa", "0xb"])
+
+        assert [m["conditionId"] for m in markets] == ["0xa", "0xb"]
+        assert requests_seen == [["0xa", "0xb"]]
+        assert client.get_markets_by_ids([]) == []
+
+
+@pytest.mark.unit
+class TestPolymarketCLOBClientEnrichment:
+    """Test CLOB price enrichment."""
+
+    def test_enrich_uses_primed_index(self):
+        """Test simplified markets are fetched once for many enrichments."""
+        requests_seen = []
+        simplified = [
+            "not-a-market",
+            {
+                "condition_id": "0xa",
+                "accepting_orders": True,
+                "tokens": [{"price": "0.4", "outcome": "Yes"}, {"price": "0.6", "outcome": "No"}],
+            },
+            {"condition_id": "0xc", "tokens": [{"price": "0.3", "outcome": "Yes"}, "bad", {"price": "0.7"}]},
+        ]
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests_seen.append(request.url.path)
+            return httpx.Response(200, json=simplified)
+
+        client = PolymarketCLOBClient(api_base="https://clob.test")
+        client.session = httpx.Client(transport=httpx.MockTransport(handler))
+
+        assert client.prime_clob_index() == 2
+
+        market_a = client.enrich_market_with_prices(
+            {"id": "0xa", "outcomes": [{"label": "Yes"}, {"label": "No"}], "metadata": {}}
+        )
+        market_b = client.enrich_market_with_prices({"id": "0xb", "outcomes": [{"label": "Yes"}]})
+
+        assert [o["price"] for o in market_a["outcomes"]] == [0.4, 0.6]
+        assert market_a["metadata"]["accepting_orders"] is True
+        assert "price" not in market_b["outcomes"][0]
+
+        market_c = client.enrich_market_with_prices(
+            {"id": "0xc", "outcomes": [{"label": "Yes"}, {"label": "No"}], "metadata": None}
+        )
+        assert market_c["outcomes"][0]["price"] == 0.3
+        assert "price" not in market_c["outcomes"][1]
+        assert market_c["metadata"] == {"accepting_orders": False}
+        assert requests_seen == ["/simplified-markets"]
+
+
+@pytest.mark.unit
+class TestPolymarketClientSession:
+    """Test HTTP session sharing."""
+
+    def test_gamma_and_clob_share_session(self):
+        """Test Gamma and CLOB reuse one pool and send their own auth."""
+        seen = []
+
+        def handler(request):
+            seen.append((request.url.host, request.headers.get("Authorization")))
+            return httpx.Response(200, json=[_gamma_market("0xa")])
+
+        session = httpx.Client(transport=httpx.MockTransport(handler))
+        with PolymarketGammaClient(api_base="https://gamma.test", api_key="g", session=session) as gamma:
+            gamma.get_market("0xa")
+        with PolymarketCLOBClient(api_base="https://clob.test", api_key="c", session=session) as clob:
+            clob.get_simplified_markets()
+
+        assert seen == [("gamma.test", "Bearer g"), ("clob.test", "Bearer c")]
+        assert not session.is_closed
+        assert PolymarketGammaClient(api_base="x").session is PolymarketCLOBClient(api_base="y").session
+
+
+@pytest.mark.unit
+class TestPolymarketNormalizeMarket:
+    """Test Gamma market normalization."""
+
+    def test_normalize_market(self):
+        """Test token IDs, category and numeric metadata are normalized."""
+        client = PolymarketGammaClient(api_base="https://gamma.test")
+        market = client.normalize_market({
+            "conditionId": "0xa",
+            "question": "Will it rain?",
+            "clobTokenIds": '["t1", "t2"]',
+            "tags": ["Weather"],
+            "liquidity": "1250.5",
+            "volume": 300.0,
+        })
+
+        assert market["id"] == "0xa"
+        assert market["description"] == "Will it rain?"
+        assert market["category"] == "weather"
+        assert [o["token_id"] for o in market["outcomes"]] == ["t1", "t2"]
+        assert market["outcomes"][0] is not client.normalize_market({})["outcomes"][0]
+        assert market["metadata"]["liquidity"] == 1250.5
+        assert market["metadata"]["volume"] == 300.0
+
+    def test_normalize_page_skips_malformed_market(self):
+        """Test one bad market falls back to per-market handling for its page."""
+        client = PolymarketGammaClient(api_base="https://gamma.test")
+        page = [_gamma_market("0xa"), {"conditionId": "0xbad", "tags": [123]}, _gamma_market("0xc")]
+
+        assert [m["id"] for m in client.normalize_markets([page[0], page[2]])] == ["0xa", "0xc"]
+        assert [m["id"] for m in client._normalize_page(page)] == ["0xa", "0xc"]
+        assert client.normalize_market({"clobTokenIds": "not json"})["outcomes"][0]["token_id"] is None
+
+    def test_normalize_page_batches_valid_page(self, monkeypatch):
+        """Test a page with no malformed market never takes the per-market fallback."""
+        client = PolymarketGammaClient(api_base="https://gamma.test")
+
+        def fail(market):
+            raise AssertionError("per-market fallback used")
+
+        monkeypatch.setattr(client, "normalize_market", fail)
+
+        assert [m["id"] for m in client._normalize_page([_gamma_market("0xa"), _gamma_market("0xb")])] == [
+            "0xa", "0xb",
+        ]
+
+
+@pytest.mark.unit
+class TestPolymarketGammaClientStreaming:
+    """Test streamed Gamma pagination."""
+
+    def test_iter_active_market_pages(self):
+        """Test pages are yielded lazily and stop at a short page."""
+        markets = [_gamma_market(f"0x{i}") for i in range(150)]
+        requests_seen = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            offset = int(request.url.params["offset"])
+            requests_seen.append(offset)
+            return httpx.Response(200, json=markets[offset:offset + 100])
+
+        client = PolymarketGammaClient(
+            api_base="https://gamma.test",
+            session=httpx.Client(transport=httpx.MockTransport(handler)),
+        )
+
+        pages = client.iter_active_market_pages()
+        assert len(next(pages)) == 100
+        assert requests_seen == [0]
+        assert len(next(pages)) == 50
+        assert list(pages) == []
+        assert requests_seen == [0, 100]
+        assert [m["id"] for m in client.iter_active_markets()][-1] == "0x149"
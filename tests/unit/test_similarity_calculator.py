@@ -0,0 +1,36 @@
+"""Unit tests for similarity score aggregation."""
+
+import numpy as np
+import pytest
+
+from src.similarity.calculator import calculate_weighted_score, calculate_weighted_scores
+
+
+def _features(text, entity, time, outcome, resolution):
+    """Build a feature breakdown with the final score keys."""
+    return {
+        "text": {"score_text": text},
+        "entity": {"score_entity_final": entity},
+        "time": {"score_time_final": time},
+        "outcome": {"score_outcome": outcome},
+        "resolution": {"score_resolution": resolution},
+    }
+
+
+@pytest.mark.unit
+class TestWeightedScore:
+    """Test weighted score aggregation."""
+
+    def test_batch_matches_scalar(self):
+        """Test batched scores match per-pair scores."""
+        rows = [
+            (0.9, 0.8, 0.7, 1.0, 0.5),
+            (0.1, 0.0, 0.3, 0.2, 0.0),
+            (1.0, 1.0, 1.0, 1.0, 1.0),
+        ]
+
+        batch = calculate_weighted_scores(np.array(rows))
+
+        assert batch.shape == (3,)
+        for row, score in zip(rows, batch):
+            assert score == pytest.approx(calculate_weighted_score(_features(*row)))
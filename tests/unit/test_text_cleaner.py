@@ -0,0 +1,75 @@
+"""Unit tests for text cleaning."""
+
+import pytest
+
+from src.normalization import text_cleaner
+from src.normalization.text_cleaner import (
+    clean_description,
+    clean_text,
+    clean_title,
+    expand_abbreviations,
+    extract_key_terms,
+    remove_platform_prefixes,
+)
+
+
+@pytest.mark.unit
+class TestRemovePlatformPrefixes:
+    """Test platform/question prefix removal."""
+
+    @pytest.mark.parametrize("text,expected", [
+        ("Kalshi: Will BTC hit 100k?", "BTC hit 100k?"),
+        ("polymarket:   who wins?", "wins?"),
+        ("Is the Fed cutting?", "the Fed cutting?"),
+        ("is will x", "will x"),  # prefixes only strip in declaration order
+        ("Willow Smith album", "Willow Smith album"),
+    ])
+    def test_prefixes(self, text, expected):
+        """Test prefixes are stripped in order, each at most once."""
+        assert remove_platform_prefixes(text) == expected
+
+
+@pytest.mark.unit
+class TestExpandAbbreviations:
+    """Test abbreviation expansion."""
+
+    def test_expands_whole_words(self):
+        """Test abbreviations expand on word boundaries only."""
+        assert expand_abbreviations("BTC vs ETH in Q3, not fedex") == (
+            "bitcoin vs ethereum in quarter 3, not fedex"
+        )
+
+    def test_symbol_abbreviation(self):
+        """Test abbreviations containing punctuation are expanded."""
+        assert expand_abbreviations("s&p above 5000") == "standard and poors above 5000"
+
+
+@pytest.mark.unit
+class TestCleanText:
+    """Test the full cleaning pipeline."""
+
+    def test_clean_title(self):
+        """Test HTML, whitespace, prefixes and abbreviations are normalized."""
+        assert clean_text("Kalshi: <b>Will</b>  the  Fed cut in Q1?") == (
+            "the federal reserve cut in quarter 1?"
+        )
+
+    def test_title_and_description_share_cache(self):
+        """Test repeated titles and descriptions are cleaned once."""
+        text_cleaner.clear_text_cache()
+
+        assert clean_title("Will BTC hit 100k?") == "bitcoin hit 100k?"
+        assert clean_description("Will BTC hit 100k?") == clean_title("Will BTC hit 100k?")
+        assert clean_title(None) == clean_description("") == ""
+
+        info = text_cleaner._clean_text_cached.cache_info()
+        assert (info.hits, info.misses) == (2, 1)
+
+
+@pytest.mark.unit
+class TestExtractKeyTerms:
+    """Test key term extraction."""
+
+    def test_drops_stopwords_and_short_words(self):
+        """Test stopwords and words under the minimum length are dropped."""
+        assert extract_key_terms("Will the Fed cut rates by the end of 2025?") == {"fed", "cut", "rates", "2025"}
@@ -0,0 +1,45 @@
+"""Unit tests for tier assignment."""
+
+import numpy as np
+import pytest
+
+from src.similarity.tier_assigner import assign_tier, assign_tiers
+
+
+def _features(text, entity, outcome, time, resolution):
+    """Build a feature breakdown with the scores tier assignment reads."""
+    return {
+        "text": {"score_text": text},
+        "entity": {"score_entity_final": entity},
+        "time": {"score_time_final": time},
+        "outcome": {"score_outcome": outcome},
+        "resolution": {"score_resolution": resolution},
+    }
+
+
+@pytest.mark.unit
+class TestAssignTiers:
+    """Test batched tier assignment."""
+
+    def test_batch_matches_scalar(self):
+        """Test vectorized tiers match per-pair assign_tier."""
+        rows = [
+            (0.90, 0.99, 0.95, 0.80, 0.99, 0.60, 0.30),  # tier 1
+            (0.75, 0.92, 0.85, 0.60, 0.95, 0.40, 0.00),  # tier 2
+            (0.75, 0.92, 0.85, 0.60, 0.95, 0.10, 0.00),  # time too low
+            (0.90, 0.99, 0.95, 0.80, 0.99, 0.60, 0.30),  # hard constraint violated
+        ]
+        violated = [False, False, False, True]
+
+        tiers = assign_tiers(np.array(rows), np.array(violated))
+
+        expected = [
+            assign_tier(
+                p_match=row[1],
+                features=_features(*row[2:]),
+                hard_constraints_violated=hard,
+                similarity_result={"similarity_score": row[0]},
+            )
+            for row, hard in zip(rows, violated)
+        ]
+        assert list(tiers) == expected == [1, 2, 3, 3]